@@ -0,0 +1 @@
+# XgenConfig 성능 벤치마크 패키지
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+설정 읽기/쓰기 핫패스 벤치마크
+
+합성 설정 저장소(100 ~ 100k 키)를 만들어 주요 연산의 호출당 시간을 측정하고
+릴리스 간 회귀 추적을 위해 JSON으로 결과를 저장합니다.
+
+기본 백엔드는 fakeredis(로컬 Redis 대체)로 실제 RedisConfigManager 코드 경로를 측정합니다.
+fakeredis가 없으면 memory 백엔드로 대체합니다.
+
+Usage:
+    python -m benchmarks.bench_config --output bench.json
+    python -m benchmarks.bench_config --sizes 100,1000 --backend memory
+    python -m benchmarks.bench_config --backend redis --redis-url redis://localhost:6379/15
+    python -m benchmarks.bench_config --backend redis --redis-url redis://localhost:6379/15 --flush
+
+get_category_configs_nested, get_config_dict_nested_*는 리비전 캐시가 채워진 상태(hot)를 측정합니다.
+category_tree_build_lua/pipelined는 Redis 백엔드에서 캐시 없이 카테고리를 읽어 트리를 만드는 시간을
+서버 측 스크립트 일괄 조회와 파이프라인 조회로 나눠 비교합니다 (fakeredis는 lupa가 있어야 스크립트 실행 가능,
+스크립트 실행 비용은 실제 Redis로 측정해야 의미가 있음).
+"""
+import random
+import logging
+import argparse
+from itertools import cycle
+from typing import Dict, Any, List
+
+from benchmarks.common import create_backend, environment_info, measure, write_results
+
+from config.config_composer import ConfigComposer
+from service.config_backend import ConfigBackend
+from service.config_tree import build_config_tree
+from service.config_utils import dict_to_namespace, get_config_dict, lazy_namespace
+
+logger = logging.getLogger("bench-config")
+
+DEFAULT_SIZES = [100, 1000, 10000, 100000]
+NUM_CATEGORIES = 10
+KEYS_PER_GROUP = 10
+SEED = 20240601
+
+
+def synthetic_configs(size: int) -> List[Dict[str, Any]]:
+    """
+    합성 설정 목록 생성 (항상 같은 결과를 내도록 고정 시드 사용)
+
+    경로 형식: bench<카테고리>.group<그룹>.key<번호>
+    """
+    rng = random.Random(SEED)
+    configs = []
+    for i in range(size):
+        category = f"bench{i % NUM_CATEGORIES}"
+        group = (i // NUM_CATEGORIES) // KEYS_PER_GROUP
+        kind = i % 4
+        if kind == 0:
+            value, data_type = rng.randint(0, 65535), "int"
+        elif kind == 1:
+            value, data_type = rng.random(), "float"
+        elif kind == 2:
+            value, data_type = bool(rng.getrandbits(1)), "bool"
+        else:
+            value, data_type = f"value-{rng.getrandbits(32):08x}", "string"
+        configs.append({
+            "path": f"{category}.group{group}.key{i}",
+            "value": value,
+            "type": data_type,
+            "category": category,
+        })
+    return configs
+
+
+def populate(backend: ConfigBackend, configs: List[Dict[str, Any]]):
+    """백엔드에 합성 설정 저장"""
+    for config in configs:
+        backend.set_config(config["path"], config["value"], config["type"], config["category"])
+
+
+def remove_benchmark_keys(backend, categories):
+    """
+    Redis 백엔드에서 이번 크기에 쓴 카테고리 키와 리비전 키만 삭제 (대상 DB의 다른 키는 건드리지 않음)
+
+    Args:
+        backend: RedisConfigManager
+        categories: 합성 설정(bench*)과 ConfigComposer가 기본값을 저장한 카테고리
+    """
+    for category in sorted(categories):
+        backend.clear_category(category)
+
+    key_scheme = backend.key_scheme
+    keys = [key_scheme.revision_key]
+    if key_scheme.categories_key:
+        keys.append(key_scheme.categories_key)
+        keys.extend(key_scheme.category_revision_key(category) for category in categories)
+    backend.redis_client.delete(*keys)
+
+
+def scaled_number(size: int, budget: int = 20000) -> int:
+    """저장소 크기에 반비례하는 측정당 호출 횟수"""
+    return max(1, budget // size)
+
+
+def bench_size(backend_name: str, size: int, repeat: int, redis_url: str = None,
+               flush: bool = False) -> List[Dict[str, Any]]:
+    """하나의 저장소 크기에 대해 모든 연산 측정"""
+    backend = create_backend(backend_name, redis_url, flush)
+    configs = synthetic_configs(size)
+    populate(backend, configs)
+
+    rng = random.Random(SEED)
+    sample_paths = [config["path"] for config in rng.sample(configs, min(1000, size))]
+    category_size = size // NUM_CATEGORIES
+    results = []
+
+    def record(operation: str, stats: Dict[str, float], **extra):
+        entry = {"operation": operation, "size": size, **extra, **stats}
+        results.append(entry)
+        logger.info("%-30s size=%-7d mean=%.3fms", operation, size, stats["mean_s"] * 1000)
+
+    # set_config: 기존 키 덮어쓰기
+    write_paths = cycle(sample_paths)
+    record("set_config", measure(
+        lambda: backend.set_config(next(write_paths), 1, "int"),
+        repeat=repeat, number=len(sample_paths)
+    ))
+
+    # get_config_value: 존재하는 키 조회
+    read_paths = cycle(sample_paths)
+    record("get_config_value", measure(
+        lambda: backend.get_config_value(next(read_paths)),
+        repeat=repeat, number=len(sample_paths)
+    ))
+
+    # get_config_values: 워커 부팅 시 패턴 (경로 20개 일괄 조회)
+    boot_paths = sample_paths[:20]
+    record("get_config_values_20", measure(
+        lambda: backend.get_config_values(boot_paths),
+        repeat=repeat, number=50
+    ))
+
+    # get_category_configs_nested: 카테고리 하나 (size / NUM_CATEGORIES 키)
+    backend.get_category_configs_nested("bench0")
+    record("get_category_configs_nested", measure(
+        lambda: backend.get_category_configs_nested("bench0"),
+        repeat=repeat, number=scaled_number(category_size or 1)
+    ), category_size=category_size)
+
+    # 카테고리 트리 빌드 (캐시 없음): 서버 측 스크립트 일괄 조회 vs SMEMBERS + MGET 파이프라인
+    if hasattr(backend, "lua_reads"):
+        for mode, lua_reads in (("lua", True), ("pipelined", False)):
+            backend.lua_reads = lua_reads
+            if lua_reads:
+                # 서버가 EVAL을 거부하면 관리자가 조용히 파이프라인 조회로 전환하므로 미리 한 번 호출해 확인
+                backend.get_category_configs("bench0")
+                if not backend.lua_reads:
+                    logger.warning("Redis 서버가 스크립트를 실행하지 않아 category_tree_build_lua를 건너뜁니다 "
+                                   "(fakeredis는 pip install lupa 필요)")
+                    continue
+            record(f"category_tree_build_{mode}", measure(
+                lambda: build_config_tree(backend.get_category_configs("bench0")),
+                repeat=repeat, number=scaled_number(category_size or 1)
+            ), category_size=category_size)
+        backend.lua_reads = True
+
+    # get_all_configs: 전체 저장소
+    record("get_all_configs", measure(
+        backend.get_all_configs,
+        repeat=repeat, number=scaled_number(size)
+    ))
+
+    # get_config_dict(flatten=False): 전체 중첩 트리 (리비전 캐시, 공유 읽기 전용 / 복사본)
+    get_config_dict(redis_manager=backend, copy=False)
+    record("get_config_dict_nested_shared", measure(
+        lambda: get_config_dict(redis_manager=backend, copy=False),
+        repeat=repeat, number=scaled_number(size)
+    ))
+    record("get_config_dict_nested_copy", measure(
+        lambda: get_config_dict(redis_manager=backend),
+        repeat=repeat, number=scaled_number(size)
+    ))
+
+    # dict_to_namespace: 전체 중첩 트리 변환
+    tree = get_config_dict(redis_manager=backend)
+    record("dict_to_namespace", measure(
+        lambda: dict_to_namespace(tree),
+        repeat=repeat, number=scaled_number(size)
+    ))
+
+    # lazy_namespace: 뷰 생성 + 속성 하나 읽기 (get_category_config 호출 패턴)
+    record("lazy_namespace_single_attr", measure(
+        lambda: lazy_namespace(tree).bench0.group0,
+        repeat=repeat, number=scaled_number(size)
+    ))
+
+    # ConfigComposer 생성: sub_config 전체 로드 (합성 키와 같은 저장소 사용)
+    composers = []
+    stats = measure(lambda: composers.append(ConfigComposer(redis_manager=backend)), repeat=repeat)
+    composer = composers[-1]
+    record("config_composer_init", stats, config_count=len(composer.all_configs))
+
+    # refresh_all: 모든 PersistentConfig 재로드
+    record("refresh_all", measure(
+        composer.refresh_all,
+        repeat=repeat
+    ), config_count=len(composer.all_configs))
+
+    if backend_name == "redis":
+        # 다음 크기가 빈 DB에서 시작하도록 벤치마크가 쓴 키만 삭제
+        categories = {config["category"] for config in configs}
+        categories.update(config.config_path.split('.')[0] for config in composer.all_configs.values())
+        remove_benchmark_keys(backend, categories)
+
+    backend.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="XgenConfig 설정 핫패스 벤치마크")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES),
+                        help="콤마로 구분한 저장소 크기 목록 (기본: 100,1000,10000,100000)")
+    parser.add_argument("--backend", default="fakeredis",
+                        choices=["fakeredis", "redis", "memory", "sqlite"],
+                        help="측정할 백엔드 (기본: fakeredis)")
+    parser.add_argument("--redis-url", default=None,
+                        help="--backend redis 사용 시 접속 URL (벤치마크 전용 DB, 비어 있어야 함)")
+    parser.add_argument("--flush", action="store_true",
+                        help="--backend redis 사용 시 대상 DB를 비우고 시작 (DB의 모든 키 삭제)")
+    parser.add_argument("--repeat", type=int, default=5, help="연산별 측정 반복 횟수")
+    parser.add_argument("--output", default=None, help="결과 JSON 파일 경로 (없으면 stdout)")
+    args = parser.parse_args()
+
+    # 설정 로드 로그가 측정 출력에 섞이지 않도록 벤치마크 로그만 INFO로 출력
+    logging.basicConfig(level=logging.ERROR, format='%(name)s - %(message)s')
+    logger.setLevel(logging.INFO)
+
+    backend_name = args.backend
+    if backend_name == "fakeredis":
+        try:
+            import fakeredis  # noqa: F401
+        except ImportError:
+            logger.warning("fakeredis가 설치되어 있지 않아 memory 백엔드로 대체합니다 (pip install fakeredis)")
+            backend_name = "memory"
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    results = []
+    for index, size in enumerate(sizes):
+        # --flush는 첫 크기에서만 적용, 각 크기는 끝날 때 자기가 쓴 벤치마크 키만 지우므로 다음 크기도 빈 DB에서 시작
+        results.extend(bench_size(backend_name, size, args.repeat, args.redis_url, flush=args.flush and index == 0))
+
+    meta = environment_info(backend_name)
+    meta.update({"suite": "config", "sizes": sizes, "repeat": args.repeat, "seed": SEED})
+    write_results(results, meta, args.output)
+
+
+if __name__ == "__main__":
+    main()
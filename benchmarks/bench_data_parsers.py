@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+data_parsers 일괄 처리 벤치마크
+
+리포트 집계처럼 많은 행을 처리할 때 한 개씩 호출하는 함수(extract_collection_name, parse_input_data,
+safe_round_float)와 일괄 버전(extract_collection_names, parse_input_data_batch, safe_round_floats)의
+행당 시간을 비교하고 JSON으로 저장합니다. 측정 전에 두 결과가 같은지 먼저 확인합니다.
+
+safe_round_floats는 numpy가 있어야 일괄 반올림 경로를 측정합니다 (pip install numpy).
+data_parsers는 파일 경로로 직접 로드하므로 controller.helper.utils 패키지가 import 하는
+앱 DB 모델(service.database) 없이도 실행됩니다.
+
+Usage:
+    python -m benchmarks.bench_data_parsers --output bench_parsers.json
+    python -m benchmarks.bench_data_parsers --sizes 1000,100000 --repeat 3
+"""
+import os
+import math
+import uuid
+import random
+import logging
+import argparse
+import importlib.util
+from decimal import Decimal
+from typing import Dict, Any, List
+
+from benchmarks.common import PROJECT_ROOT, environment_info, measure, write_results
+
+
+def _load_data_parsers():
+    """
+    data_parsers 모듈을 파일 경로로 로드
+
+    controller.helper.utils 패키지 __init__은 auth_helpers 등을 통해 앱 DB 모델을 import 하므로
+    표준 라이브러리(와 선택적으로 numpy)만 쓰는 data_parsers를 패키지를 거치지 않고 읽습니다.
+    """
+    path = os.path.join(PROJECT_ROOT, "controller", "helper", "utils", "data_parsers.py")
+    spec = importlib.util.spec_from_file_location("bench_data_parsers_target", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+data_parsers = _load_data_parsers()
+extract_collection_name = data_parsers.extract_collection_name
+extract_collection_names = data_parsers.extract_collection_names
+parse_input_data = data_parsers.parse_input_data
+parse_input_data_batch = data_parsers.parse_input_data_batch
+safe_round_float = data_parsers.safe_round_float
+safe_round_floats = data_parsers.safe_round_floats
+np = data_parsers.np
+
+logger = logging.getLogger("bench-data-parsers")
+
+DEFAULT_SIZES = [1000, 100000]
+SEED = 20240601
+
+
+def synthetic_rows(size: int) -> Dict[str, List[Any]]:
+    """
+    합성 리포트 행 생성 (항상 같은 결과를 내도록 고정 시드 사용)
+
+    컬렉션 이름 절반은 UUID 접미사 포함, 입력 데이터는 구분 패턴이 섞인 "Input: " 문자열,
+    점수는 DB에서 읽은 것처럼 Decimal/float/None이 섞인 값
+    """
+    rng = random.Random(SEED)
+    names, inputs, scores = [], [], []
+    for i in range(size):
+        name = f"문서컬렉션{i % 50}"
+        if i % 2 == 0:
+            name += f"_{uuid.UUID(int=rng.getrandbits(128))}"
+        names.append(name)
+
+        kind = i % 4
+        question = f"질문 {rng.getrandbits(32):08x}에 대한 답변을 작성해 주세요."
+        if kind == 0:
+            inputs.append(f"Input: {question}")
+        elif kind == 1:
+            inputs.append(f"Input: {question}\n\nparameters: {{'top_k': 4}}")
+        elif kind == 2:
+            inputs.append(f"Input: {question}\n\nAdditional Parameters: {{'lang': 'ko'}}")
+        else:
+            inputs.append(question)
+
+        kind = i % 5
+        if kind == 0:
+            scores.append(None)
+        elif kind in (1, 2):
+            scores.append(Decimal(f"{rng.random():.6f}"))
+        else:
+            scores.append(rng.random() * 100)
+    return {"names": names, "inputs": inputs, "scores": scores}
+
+
+def _same_values(single: List[Any], batch: List[Any]) -> bool:
+    return len(single) == len(batch) and all(
+        a == b or (isinstance(a, float) and isinstance(b, float) and math.isnan(a) and math.isnan(b))
+        for a, b in zip(single, batch)
+    )
+
+
+def bench_size(size: int, repeat: int) -> List[Dict[str, Any]]:
+    """하나의 행 수에 대해 단일/일괄 함수 측정"""
+    rows = synthetic_rows(size)
+    results = []
+
+    cases = [
+        ("extract_collection_name", rows["names"],
+         lambda values: [extract_collection_name(value) for value in values], extract_collection_names),
+        ("parse_input_data", rows["inputs"],
+         lambda values: [parse_input_data(value) for value in values], parse_input_data_batch),
+        ("safe_round_float", rows["scores"],
+         lambda values: [safe_round_float(value) for value in values], safe_round_floats),
+    ]
+
+    for operation, values, single, batch in cases:
+        if not _same_values(single(values), batch(values)):
+            raise AssertionError(f"{operation}: 일괄 결과가 단일 호출 결과와 다릅니다")
+
+        single_stats = measure(lambda: single(values), repeat=repeat)
+        batch_stats = measure(lambda: batch(values), repeat=repeat)
+        single_ns = single_stats["median_s"] / size * 1e9
+        batch_ns = batch_stats["median_s"] / size * 1e9
+        for mode, stats, per_row_ns in (("single", single_stats, single_ns), ("batch", batch_stats, batch_ns)):
+            results.append({"operation": operation, "mode": mode, "rows": size,
+                            "per_row_ns": per_row_ns, **stats})
+        logger.info("%-24s rows=%-7d single=%.0fns/row batch=%.0fns/row (x%.1f)",
+                    operation, size, single_ns, batch_ns, single_ns / batch_ns if batch_ns else 0.0)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="XgenConfig data_parsers 일괄 처리 벤치마크")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES),
+                        help="콤마로 구분한 행 수 목록 (기본: 1000,100000)")
+    parser.add_argument("--repeat", type=int, default=5, help="연산별 측정 반복 횟수")
+    parser.add_argument("--output", default=None, help="결과 JSON 파일 경로 (없으면 stdout)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR, format='%(name)s - %(message)s')
+    logger.setLevel(logging.INFO)
+
+    if np is None:
+        logger.warning("numpy가 설치되어 있지 않아 safe_round_floats는 한 개씩 반올림합니다 (pip install numpy)")
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    results = []
+    for size in sizes:
+        results.extend(bench_size(size, args.repeat))
+
+    meta = environment_info("none")
+    meta.update({"suite": "data_parsers", "sizes": sizes, "repeat": args.repeat, "seed": SEED,
+                 "numpy": np.__version__ if np is not None else None})
+    write_results(results, meta, args.output)
+
+
+if __name__ == "__main__":
+    main()
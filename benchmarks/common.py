@@ -0,0 +1,140 @@
+"""
+벤치마크 공통 유틸리티
+
+측정 헬퍼, 백엔드(Redis 대체) 생성, JSON 결과 저장을 담당합니다.
+"""
+import os
+import sys
+import json
+import time
+import platform
+import statistics
+import subprocess
+from datetime import datetime, timezone
+from typing import Callable, Dict, Any, List, Optional
+
+# 프로젝트 루트를 Python 경로에 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+# config 모듈 import 시 생성되는 전역 ConfigComposer가 실제 Redis에 접속하지 않도록 함
+os.environ.setdefault("CONFIG_BACKEND", "memory")
+
+from service.config_backend import ConfigBackend, create_config_manager
+
+
+def measure(func: Callable[[], Any], repeat: int = 5, number: int = 1,
+            setup: Optional[Callable[[], Any]] = None) -> Dict[str, float]:
+    """
+    함수 실행 시간 측정
+
+    Args:
+        func: 측정할 함수 (인자 없음)
+        repeat: 측정 반복 횟수
+        number: 한 번의 측정에서 func를 호출하는 횟수
+        setup: 매 측정 전에 호출할 준비 함수 (측정 시간에서 제외)
+
+    Returns:
+        Dict: 호출 1회당 시간 통계 (초)
+    """
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+
+    samples.sort()
+    p95_index = min(len(samples) - 1, int(round(0.95 * (len(samples) - 1))))
+    mean = statistics.fmean(samples)
+    return {
+        "repeat": repeat,
+        "number": number,
+        "min_s": samples[0],
+        "median_s": statistics.median(samples),
+        "mean_s": mean,
+        "p95_s": samples[p95_index],
+        "stdev_s": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "ops_per_s": (1.0 / mean) if mean > 0 else 0.0,
+    }
+
+
+def create_backend(name: str, redis_url: Optional[str] = None, flush: bool = False) -> ConfigBackend:
+    """
+    벤치마크용 설정 백엔드 생성
+
+    Args:
+        name: fakeredis (기본, 실제 RedisConfigManager 코드 경로), redis, memory, sqlite
+        redis_url: name이 redis일 때 접속할 로컬 Redis URL
+        flush: name이 redis일 때 대상 DB를 비우고 시작 (False면 비어 있지 않은 DB에서는 실행하지 않음)
+
+    Returns:
+        ConfigBackend: 비어 있는 백엔드 인스턴스
+    """
+    if name == "fakeredis":
+        import fakeredis
+        from service.redis_config_manager import RedisConfigManager
+        return RedisConfigManager(redis_client=fakeredis.FakeRedis(decode_responses=True))
+
+    if name == "redis":
+        import redis
+        from service.redis_config_manager import RedisConfigManager
+        client = redis.Redis.from_url(redis_url or "redis://localhost:6379/15", decode_responses=True)
+        # 운영 중인 설정 DB를 지우지 않도록 명시적으로 요청한 경우에만 비우고, 아니면 빈 DB에서만 실행
+        if flush:
+            client.flushdb()
+        elif client.dbsize():
+            raise ValueError(f"벤치마크 대상 Redis DB가 비어 있지 않습니다 ({client.dbsize()}개 키): "
+                             f"벤치마크 전용 DB를 지정하거나 --flush로 비우고 실행하세요")
+        return RedisConfigManager(redis_client=client)
+
+    if name == "sqlite":
+        return create_config_manager("sqlite", db_path=":memory:")
+
+    if name == "memory":
+        # 공유 인스턴스가 아닌 새 저장소
+        return create_config_manager("memory", initial_configs=[])
+
+    raise ValueError(f"지원되지 않는 벤치마크 백엔드입니다: {name}")
+
+
+def environment_info(backend: str) -> Dict[str, Any]:
+    """결과 비교를 위한 실행 환경 정보"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "backend": backend,
+    }
+
+
+def write_results(results: List[Dict[str, Any]], meta: Dict[str, Any],
+                  output: Optional[str] = None) -> Dict[str, Any]:
+    """
+    결과를 JSON으로 저장 (output이 없으면 stdout으로 출력)
+
+    Returns:
+        Dict: 저장된 JSON 문서
+    """
+    document = {"meta": meta, "results": results}
+    text = json.dumps(document, indent=2, ensure_ascii=False)
+
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    return document
@@ -3,9 +3,9 @@ Redis 기반 Base Configuration 클래스
 """
 import os
 import logging
-from typing import Any, Optional, Union, List, Dict
+from typing import Any, Callable, Optional, Union, List, Dict
 from abc import ABC, abstractmethod
-from service.redis_config_manager import RedisConfigManager
+from service.config_backend import ConfigBackend, create_config_manager
 
 logger = logging.getLogger("config-base")
 
@@ -15,12 +15,15 @@ class PersistentConfig:
 
     def __init__(self, env_name: str, config_path: str, env_value: Any,
                  type_converter: Optional[callable] = None,
-                 redis_manager: Optional[RedisConfigManager] = None):
+                 redis_manager: Optional[ConfigBackend] = None):
         self.env_name = env_name
         self.config_path = config_path
         self.env_value = env_value
         self.type_converter = type_converter
-        self.redis_manager = redis_manager or RedisConfigManager()
+        self.redis_manager = redis_manager or create_config_manager()
+
+        # 값이 바뀐 뒤 호출할 콜백 (ConfigComposer가 설정 스냅샷을 다시 만들 때 사용)
+        self.on_change: Optional[Callable[["PersistentConfig"], None]] = None
 
         # Redis에서 값 로드 시도
         self._value = self._load_from_redis()
@@ -92,9 +95,18 @@ class PersistentConfig:
             logger.error(f"Failed to update config {self.config_path}: {e}")
             raise
 
+        self._notify_change()
+
     def refresh(self):
         """Redis에서 최신 값 다시 로드"""
+        old_value = self._value
         self._value = self._load_from_redis()
+        if self._value != old_value:
+            self._notify_change()
+
+    def _notify_change(self):
+        if self.on_change is not None:
+            self.on_change(self)
 
 
 class BaseConfig(ABC):
@@ -102,9 +114,9 @@ class BaseConfig(ABC):
     모든 설정 클래스의 기본 클래스 (Redis 기반)
     """
 
-    def __init__(self, redis_manager: Optional[RedisConfigManager] = None):
+    def __init__(self, redis_manager: Optional[ConfigBackend] = None):
         self.configs: Dict[str, PersistentConfig] = {}
-        self.redis_manager = redis_manager or RedisConfigManager()
+        self.redis_manager = redis_manager or create_config_manager()
         self.logger = logging.getLogger(f"config-{self.__class__.__name__.lower()}")
 
         # 설정 자동 초기화
@@ -2,12 +2,18 @@
 Config Composer - 모든 설정을 통합 관리 (Redis 기반)
 """
 import os
+import time
 import importlib
 import logging
-from typing import Dict, Any
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Optional
 from pathlib import Path
 from config.base_config import BaseConfig, PersistentConfig
-from service.redis_config_manager import RedisConfigManager
+from config.config_snapshot import ConfigSnapshot
+from config.local_snapshot import LocalConfigSnapshot
+from service.config_backend import ConfigBackend, create_config_manager
+from service.metrics import CONFIG_COMPOSER_LOAD_SECONDS
 
 logger = logging.getLogger("config-composer")
 
@@ -18,25 +24,80 @@ class ConfigComposer:
     sub_config/ 디렉토리의 *_config.py 파일들을 자동으로 스캔하고 로드합니다.
     """
 
-    def __init__(self, redis_manager: RedisConfigManager = None):
+    def __init__(self, redis_manager: ConfigBackend = None, local_snapshot_path: Optional[str] = None):
         # 동적으로 로드된 설정 카테고리들을 저장
         self.config_categories: Dict[str, Any] = {}
 
         # 모든 설정을 저장하는 딕셔너리
         self.all_configs: Dict[str, PersistentConfig] = {}
 
-        # Redis 매니저
-        self.redis_manager = redis_manager or RedisConfigManager()
+        # 설정 저장소 백엔드 (기본값: Redis)
+        self.redis_manager = redis_manager or create_config_manager()
 
         self.logger = logger
 
+        # 현재 설정 스냅샷 (값이 바뀔 때마다 새 스냅샷으로 참조 교체)
+        self._snapshot_lock = threading.Lock()
+        self._snapshot_version = 0
+        self._snapshot = ConfigSnapshot(0, {})
+        # 여러 값을 바꾸는 동안 값마다 스냅샷을 만들지 않도록 (스레드별) 미루는 깊이
+        self._deferred_publish = threading.local()
+
+        # 로컬 스냅샷 (경로를 넘긴 컴포저만 사용, start()로 원본 백엔드와 맞추는 앱 소유 컴포저에서 지정)
+        # 전역 config_composer처럼 start()를 호출하지 않는 컴포저는 처음부터 원본 백엔드에서 읽음
+        self.local_snapshot = LocalConfigSnapshot(local_snapshot_path) if local_snapshot_path else None
+        self._local_snapshot_interval = float(os.getenv('CONFIG_LOCAL_SNAPSHOT_INTERVAL', '60'))
+        self._reconcile_retry_interval = float(os.getenv('CONFIG_LOCAL_SNAPSHOT_RETRY_INTERVAL', '5'))
+        self._persisted_version = 0
+        self._reconcile_lock = threading.RLock()
+        self._pending_updates = set()
+        self._stop = threading.Event()
+
+        # 원본 백엔드와 맞춰졌는지 여부 (False면 로컬 스냅샷 또는 기본값으로 동작 중)
+        self.reconciled = True
+        load_manager = self.redis_manager
+
+        if self.local_snapshot is not None:
+            seed = self.local_snapshot.load()
+            if seed is not None:
+                # 로컬 스냅샷 값으로 즉시 시작하고 원본 백엔드는 백그라운드에서 맞춤
+                from service.memory_config_manager import MemoryConfigManager
+                load_manager = MemoryConfigManager(initial_configs=seed)
+                self.reconciled = False
+            elif self.redis_manager.get_revision() is None:
+                # 스냅샷도 없고 원본 백엔드도 응답하지 않으면 기본값으로 시작한 상태
+                self.reconciled = False
+
         # 설정 카테고리들을 자동으로 발견하고 로드
-        self._discover_and_load_configs()
+        self._discover_and_load_configs(load_manager)
+        self._publish_snapshot()
+
+        # 원본 백엔드 맞춤/로컬 스냅샷 저장 작업은 앱이 소유한 컴포저에서만 start()로 시작
+        self._snapshot_thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """
+        로컬 스냅샷 백그라운드 작업 시작 (CONFIG_LOCAL_SNAPSHOT_PATH가 있을 때만, 이미 실행 중이면 무시)
 
-    def _discover_and_load_configs(self):
+        같은 파일을 여러 컴포저가 저장하지 않도록 애플리케이션 lifespan에서 만든 컴포저에서만 호출하고,
+        종료 시 close()를 호출합니다.
+        """
+        if self.local_snapshot is None or self._snapshot_thread is not None:
+            return
+        self._stop.clear()
+        self._snapshot_thread = threading.Thread(
+            target=self._local_snapshot_loop, name="config-local-snapshot", daemon=True
+        )
+        self._snapshot_thread.start()
+
+    def _discover_and_load_configs(self, load_manager: Optional[ConfigBackend] = None):
         """
         sub_config/ 디렉토리에서 *_config.py 파일들을 자동으로 발견하고 로드
+
+        Args:
+            load_manager: 설정 값을 읽을 백엔드 (기본값: self.redis_manager, 로컬 스냅샷 시작 시 메모리 백엔드)
         """
+        load_manager = load_manager or self.redis_manager
         sub_config_dir = Path(__file__).parent / "sub_config"
 
         # sub_config 디렉토리가 없으면 생성
@@ -53,8 +114,17 @@ class ConfigComposer:
 
         self.logger.info("Found %d config files: %s", len(config_files), [f.name for f in config_files])
 
-        # 각 설정 파일을 동적으로 로드
+        # 각 설정 파일을 동적으로 로드 (기본값 시딩 쓰기는 백엔드가 지원하면 한 번에 반영)
+        with load_manager.write_batch():
+            self._load_config_files(config_files, load_manager)
+
+        self.logger.info("Auto-discovered %d config categories: %s",
+                        len(self.config_categories), list(self.config_categories.keys()))
+
+    def _load_config_files(self, config_files, load_manager: ConfigBackend):
+        """설정 파일별 클래스 로드 및 인스턴스 생성"""
         for config_file in config_files:
+            load_start = time.perf_counter()
             try:
                 # 파일명에서 카테고리명 추출 (예: openai_config.py -> openai)
                 category_name = config_file.stem.replace("_config", "")
@@ -93,7 +163,7 @@ class ConfigComposer:
                     raise AttributeError(f"No valid config class found in {module_name}")
 
                 # 인스턴스 생성 (Redis 매니저 전달)
-                config_instance = config_class(redis_manager=self.redis_manager)
+                config_instance = config_class(redis_manager=load_manager)
 
                 # 카테고리로 저장
                 self.config_categories[category_name] = config_instance
@@ -101,17 +171,17 @@ class ConfigComposer:
                 # 동적 속성으로 설정 (self.openai, self.app 등)
                 setattr(self, category_name, config_instance)
 
-                # all_configs에 추가
+                # all_configs에 추가 (값을 직접 바꿔도 스냅샷에 반영되도록 변경 콜백 연결)
+                for config in config_instance.configs.values():
+                    config.on_change = self._on_config_change
                 self.all_configs.update(config_instance.configs)
 
+                CONFIG_COMPOSER_LOAD_SECONDS.labels(category_name).set(time.perf_counter() - load_start)
                 self.logger.info("Successfully loaded config category: %s", category_name)
 
             except Exception as e:
                 self.logger.error("Failed to load config file %s: %s", config_file.name, e)
 
-        self.logger.info("Auto-discovered %d config categories: %s",
-                        len(self.config_categories), list(self.config_categories.keys()))
-
     def get_config_by_name(self, config_name: str) -> PersistentConfig:
         """
         설정 이름으로 PersistentConfig 객체 가져오기
@@ -141,8 +211,16 @@ class ConfigComposer:
         config = self.get_config_by_name(config_name)
         old_value = config.value
 
-        # 값 업데이트 (자동으로 Redis에도 저장됨)
-        config.value = new_value
+        # start()하지 않은 컴포저는 쓰기 전에 원본 백엔드와 직접 맞춤 (시드 백엔드에만 쓰지 않도록)
+        if not self.reconciled and self._snapshot_thread is None:
+            self.reconcile()
+
+        # 값 업데이트 (자동으로 Redis에도 저장되고 변경 콜백이 스냅샷을 교체함)
+        with self._reconcile_lock:
+            config.value = new_value
+            if not self.reconciled:
+                # 원본 백엔드와 맞추기 전의 변경은 맞출 때 다시 저장
+                self._pending_updates.add(config_name)
 
         return {
             "old_value": old_value,
@@ -151,12 +229,125 @@ class ConfigComposer:
 
     def refresh_all(self):
         """모든 설정을 Redis에서 다시 로드"""
-        for config_name, config in self.all_configs.items():
+        with self._publish_once():
+            for config_name, config in self.all_configs.items():
+                try:
+                    config.refresh()
+                    self.logger.debug(f"Refreshed config: {config_name}")
+                except Exception as e:
+                    self.logger.error(f"Failed to refresh config {config_name}: {e}")
+
+    def snapshot(self) -> ConfigSnapshot:
+        """
+        현재 설정 스냅샷 반환
+
+        복사 없이 현재 스냅샷의 참조만 반환합니다. 값이 바뀌면(update_config, refresh_all,
+        PersistentConfig.value 직접 변경) 새 스냅샷으로 교체되며 이미 반환된 스냅샷은 바뀌지 않습니다.
+
+        Returns:
+            ConfigSnapshot: 읽기 전용 설정 스냅샷
+        """
+        return self._snapshot
+
+    def reconcile(self) -> bool:
+        """
+        로컬 스냅샷으로 시작한 설정을 원본 백엔드와 맞춤
+
+        원본 백엔드가 응답하면 모든 설정을 원본 백엔드로 전환하고, 그 사이 변경된 값을 저장한 뒤
+        refresh_all로 원본 값을 다시 읽습니다. 응답하지 않으면 현재 값을 유지하고 False를 반환합니다.
+
+        Returns:
+            bool: 원본 백엔드와 맞춰졌는지 여부
+        """
+        if self.reconciled:
+            return True
+
+        if self.redis_manager.get_revision() is None:
+            self.logger.warning("Config backend unavailable, keep serving local snapshot values")
+            return False
+
+        with self._reconcile_lock, self._publish_once():
+            for category in self.config_categories.values():
+                category.redis_manager = self.redis_manager
+                for config in category.configs.values():
+                    config.redis_manager = self.redis_manager
+
+            for config_name in self._pending_updates:
+                config = self.all_configs[config_name]
+                config.value = config.value
+            self._pending_updates.clear()
+
+            self.refresh_all()
+            self.reconciled = True
+
+        self.logger.info("Reconciled %d configs with config backend (%s)",
+                         len(self.all_configs), self.redis_manager.backend_name)
+        return True
+
+    def persist_local_snapshot(self) -> bool:
+        """현재 값을 로컬 스냅샷 파일에 저장 (원본 백엔드와 맞춘 뒤, 값이 바뀐 경우에만)"""
+        if self.local_snapshot is None or not self.reconciled:
+            return False
+
+        snapshot = self._snapshot
+        if snapshot.version == self._persisted_version:
+            return False
+
+        configs = [
+            {"path": config.config_path, "value": config.value,
+             "type": config._infer_data_type(config.value)}
+            for config in self.all_configs.values()
+        ]
+        if self.local_snapshot.save(configs):
+            self._persisted_version = snapshot.version
+            return True
+        return False
+
+    def _local_snapshot_loop(self):
+        while not self._stop.is_set():
             try:
-                config.refresh()
-                self.logger.debug(f"Refreshed config: {config_name}")
+                if not self.reconcile():
+                    self._stop.wait(self._reconcile_retry_interval)
+                    continue
+                self.persist_local_snapshot()
             except Exception as e:
-                self.logger.error(f"Failed to refresh config {config_name}: {e}")
+                self.logger.error(f"Local config snapshot task failed: {e}")
+            self._stop.wait(self._local_snapshot_interval)
+
+    def close(self):
+        """백그라운드 작업 종료 및 마지막 로컬 스냅샷 저장"""
+        self._stop.set()
+        self.persist_local_snapshot()
+
+    def _on_config_change(self, config: PersistentConfig):
+        """PersistentConfig 값이 바뀌면 스냅샷 교체 (_publish_once 안에서는 끝날 때 한 번만)"""
+        if getattr(self._deferred_publish, "depth", 0):
+            return
+        self._publish_snapshot()
+
+    @contextmanager
+    def _publish_once(self):
+        """블록 안의 값 변경을 모아 블록이 끝날 때 스냅샷을 한 번만 교체 (중첩 가능)"""
+        depth = getattr(self._deferred_publish, "depth", 0)
+        self._deferred_publish.depth = depth + 1
+        try:
+            yield
+        finally:
+            self._deferred_publish.depth = depth
+            if depth == 0:
+                self._publish_snapshot()
+
+    def _publish_snapshot(self) -> ConfigSnapshot:
+        """현재 설정 값으로 새 스냅샷을 만들어 교체 (쓰기 경로에서만 호출)"""
+        with self._snapshot_lock:
+            self._snapshot_version += 1
+            snapshot = ConfigSnapshot(self._snapshot_version, {
+                category_name: {name: config.value for name, config in category.configs.items()}
+                for category_name, category in self.config_categories.items()
+            })
+            # 참조 대입은 원자적이므로 읽는 쪽은 Lock 없이 이전 또는 새 스냅샷 중 하나를 봄
+            self._snapshot = snapshot
+        return snapshot
 
     def get_config_summary(self) -> Dict[str, Any]:
         """
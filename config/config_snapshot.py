@@ -0,0 +1,72 @@
+"""
+Config Snapshot - 특정 시점의 설정 값을 담는 불변 스냅샷
+"""
+import time
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
+
+
+class ConfigSnapshot:
+    """
+    ConfigComposer가 발행하는 읽기 전용 설정 스냅샷
+
+    값이 바뀔 때마다 새 스냅샷을 만들어 참조만 교체(copy-on-write)하므로
+    요청 처리 중에 갱신이 일어나도 이미 잡은 스냅샷의 값은 바뀌지 않고, 읽을 때 Lock이 필요 없습니다.
+    리스트, dict 같은 값 객체 자체는 복사하지 않고 공유하므로 수정하지 않아야 합니다.
+
+    Examples:
+        >>> snapshot = config_composer.snapshot()
+        >>> snapshot["ENVIRONMENT"]
+        'development'
+        >>> snapshot.category("app")["PORT"]
+        8000
+    """
+
+    __slots__ = ("version", "created_at", "values", "categories")
+
+    def __init__(self, version: int, categories: Dict[str, Dict[str, Any]]):
+        values = {}
+        for category_values in categories.values():
+            values.update(category_values)
+
+        object.__setattr__(self, "version", version)
+        object.__setattr__(self, "created_at", time.time())
+        object.__setattr__(self, "values", MappingProxyType(values))
+        object.__setattr__(self, "categories", MappingProxyType({
+            name: MappingProxyType(dict(category_values))
+            for name, category_values in categories.items()
+        }))
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError("ConfigSnapshot is read-only")
+
+    def __getitem__(self, config_name: str) -> Any:
+        try:
+            return self.values[config_name]
+        except KeyError:
+            raise KeyError(f"Configuration '{config_name}' not found") from None
+
+    def __contains__(self, config_name: str) -> bool:
+        return config_name in self.values
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __repr__(self) -> str:
+        return f"ConfigSnapshot(version={self.version}, configs={len(self.values)})"
+
+    def get(self, config_name: str, default: Any = None) -> Any:
+        """설정 이름(env_name)으로 값 조회"""
+        return self.values.get(config_name, default)
+
+    def category(self, category_name: str) -> Mapping[str, Any]:
+        """
+        특정 카테고리의 {env_name: value} 읽기 전용 매핑
+
+        Raises:
+            KeyError: 카테고리가 없는 경우
+        """
+        try:
+            return self.categories[category_name]
+        except KeyError:
+            raise KeyError(f"Category '{category_name}' not found") from None
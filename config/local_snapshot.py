@@ -0,0 +1,103 @@
+"""
+Local Snapshot - 해석된 설정 값을 로컬 파일에 저장/복원 (Redis 없이 빠른 콜드 스타트용)
+"""
+import os
+import json
+import time
+import hashlib
+import logging
+import tempfile
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger("config-local-snapshot")
+
+SNAPSHOT_HEADER = b"XGENCFG1"
+
+
+class LocalConfigSnapshot:
+    """
+    체크섬이 포함된 로컬 설정 스냅샷 파일
+
+    파일 형식은 "XGENCFG1 <sha256>\\n" 헤더 한 줄과 compact JSON 본문이며,
+    임시 파일에 쓴 뒤 os.replace로 교체하므로 쓰는 도중 종료되어도 기존 파일이 깨지지 않습니다.
+    체크섬이 맞지 않거나 형식이 다르면 무시하고 원본 백엔드에서 로드합니다.
+
+    Example:
+        >>> snapshot = LocalConfigSnapshot("/var/lib/xgen/config.snapshot")
+        >>> snapshot.save([{"path": "app.port", "value": 8000, "type": "int"}])
+        >>> snapshot.load()
+        [{'path': 'app.port', 'value': 8000, 'type': 'int'}]
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def save(self, configs: List[Dict[str, Any]]) -> bool:
+        """
+        설정 목록 저장
+
+        Args:
+            configs: {path, value, type} 형태의 설정 리스트
+
+        Returns:
+            bool: 성공 여부
+        """
+        try:
+            body = json.dumps(
+                {"created_at": time.time(), "configs": configs},
+                separators=(',', ':'), ensure_ascii=False, default=str
+            ).encode('utf-8')
+            checksum = hashlib.sha256(body).hexdigest().encode('ascii')
+
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            # 같은 프로세스의 다른 저장과 겹치지 않도록 임시 파일 이름은 매번 새로 만듦
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f"{os.path.basename(self.path)}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(SNAPSHOT_HEADER + b" " + checksum + b"\n" + body)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+
+            logger.debug(f"로컬 설정 스냅샷 저장: {self.path} ({len(configs)}개)")
+            return True
+
+        except Exception as e:
+            logger.error(f"로컬 설정 스냅샷 저장 실패: {self.path} - {str(e)}")
+            return False
+
+    def load(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        설정 목록 복원
+
+        Returns:
+            설정 리스트 (파일이 없거나 손상된 경우 None)
+        """
+        if not os.path.exists(self.path):
+            return None
+
+        try:
+            with open(self.path, 'rb') as f:
+                header, _, body = f.read().partition(b"\n")
+
+            magic, _, checksum = header.partition(b" ")
+            if magic != SNAPSHOT_HEADER:
+                logger.warning(f"로컬 설정 스냅샷 형식이 다릅니다: {self.path}")
+                return None
+            if hashlib.sha256(body).hexdigest().encode('ascii') != checksum:
+                logger.warning(f"로컬 설정 스냅샷 체크섬 불일치: {self.path}")
+                return None
+
+            data = json.loads(body)
+            logger.info(f"로컬 설정 스냅샷 로드: {self.path} "
+                        f"({len(data['configs'])}개, {time.time() - data['created_at']:.0f}초 전)")
+            return data['configs']
+
+        except Exception as e:
+            logger.warning(f"로컬 설정 스냅샷 로드 실패: {self.path} - {str(e)}")
+            return None
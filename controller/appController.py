@@ -5,12 +5,13 @@ App 컨트롤러
 애플리케이션 상태, 설정 관리, 데모 기능 등을 담당합니다.
 """
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel
 from typing import Dict, Any
 import logging
 
-from controller.helper.singletonHelper import get_config_composer
+from config.config_snapshot import ConfigSnapshot
+from controller.helper.singletonHelper import get_config_composer, get_config_snapshot
 
 logger = logging.getLogger("app-controller")
 router = APIRouter(prefix="/app", tags=["app"])
@@ -25,10 +26,8 @@ class UserCreateRequest(BaseModel):
     full_name: str = None
 
 @router.get("/status")
-async def get_app_status(request: Request):
+async def get_app_status(request: Request, snapshot: ConfigSnapshot = Depends(get_config_snapshot)):
     """애플리케이션 상태 조회"""
-    config_composer = get_config_composer(request)
-
     try:
         node_count = getattr(request.app.state, 'node_count', 0)
         node_registry = getattr(request.app.state, 'node_registry', [])
@@ -38,8 +37,9 @@ async def get_app_status(request: Request):
             "config": {
                 "app_name": "PlateeRAG Backend",
                 "version": "1.0.0",
-                "environment": config_composer.get_config_by_name("ENVIRONMENT").value,
-                "debug_mode": config_composer.get_config_by_name("DEBUG_MODE").value
+                "environment": snapshot["ENVIRONMENT"],
+                "debug_mode": snapshot["DEBUG_MODE"],
+                "config_version": snapshot.version
             },
             "node_count": node_count,
             "available_nodes": available_nodes,
@@ -1,12 +1,38 @@
 # controller/helper/singletonHelper.py
 from fastapi import Request
 from config.config_composer import ConfigComposer
+from config.config_snapshot import ConfigSnapshot
 
 
-def get_config_composer(request: Request) -> ConfigComposer:
-    """request.app.state에서 config_composer 가져오기"""
-    if hasattr(request.app.state, 'config_composer') and request.app.state.config_composer:
-        return request.app.state.config_composer
+def resolve_config_composer(app) -> ConfigComposer:
+    """app.state의 config_composer 반환 (없으면 전역 인스턴스)"""
+    state = getattr(app, 'state', None)
+    if getattr(state, 'config_composer', None):
+        return state.config_composer
     else:
         from config.config_composer import config_composer
         return config_composer
+
+
+def get_config_composer(request: Request) -> ConfigComposer:
+    """request.app.state에서 config_composer 가져오기"""
+    return resolve_config_composer(request.app)
+
+
+def get_config_snapshot(request: Request) -> ConfigSnapshot:
+    """
+    요청에 고정된 설정 스냅샷 가져오기 (FastAPI 의존성으로 사용)
+
+    ConfigSnapshotMiddleware가 요청 시작 시점에 고정한 스냅샷을 반환하며,
+    미들웨어가 없으면 현재 스냅샷을 고정합니다.
+
+    Example:
+        >>> @router.get("/status")
+        ... async def status(snapshot: ConfigSnapshot = Depends(get_config_snapshot)):
+        ...     return {"environment": snapshot["ENVIRONMENT"]}
+    """
+    snapshot = getattr(request.state, 'config_snapshot', None)
+    if snapshot is None:
+        snapshot = get_config_composer(request).snapshot()
+        request.state.config_snapshot = snapshot
+    return snapshot
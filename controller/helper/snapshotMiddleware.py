@@ -0,0 +1,25 @@
+# controller/helper/snapshotMiddleware.py
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class ConfigSnapshotMiddleware:
+    """
+    요청 시작 시점의 설정 스냅샷을 request.state.config_snapshot에 고정하는 ASGI 미들웨어
+
+    스냅샷은 복사본이 아니라 ConfigComposer가 발행한 불변 스냅샷의 참조이므로 비용이 거의 없고,
+    요청 처리 중 update/refresh가 일어나도 핸들러는 일관된 값을 읽습니다.
+    BaseHTTPMiddleware 대신 순수 ASGI로 구현하여 응답 스트리밍에 개입하지 않습니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] in ("http", "websocket"):
+            from controller.helper.singletonHelper import resolve_config_composer
+
+            composer = resolve_config_composer(scope.get("app"))
+            # Starlette Request.state는 scope["state"]를 사용
+            scope.setdefault("state", {})["config_snapshot"] = composer.snapshot()
+
+        await self.app(scope, receive, send)
@@ -1,7 +1,7 @@
 # Workflow utilities package
 
 # 자주 사용되는 유틸리티 함수들을 패키지 레벨에서 임포트
-from .data_parsers import extract_collection_name, parse_input_data, clean_llm_output, safe_round_float
-from .auth_helpers import workflow_user_id_extractor
+from .data_parsers import extract_collection_name, extract_collection_names, parse_input_data, parse_input_data_batch, clean_llm_output, clean_llm_output_stream, safe_round_float, safe_round_floats
+from .auth_helpers import workflow_user_id_extractor, workflow_user_ids_extractor, invalidate_user_groups, invalidate_workflow_share, clear_permission_cache
 from .workflow_helpers import workflow_parameter_helper, default_workflow_parameter_helper
-from .llm_evaluators import evaluate_with_llm
+from .llm_evaluators import evaluate_with_llm, evaluate_batch_with_llm
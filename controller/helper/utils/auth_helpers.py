@@ -1,60 +1,275 @@
 """
 인증 및 사용자 관리 관련 유틸리티 함수들
 """
+import os
+import time
 import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Hashable, Iterable, Optional, Tuple
+
 from service.database.models.user import User
 from service.database.models.workflow import WorkflowMeta
 
 logger = logging.getLogger("auth-helpers")
 
+# 권한 확인용 사용자 그룹/워크플로우 공유 정보 캐시 유지 시간 (초, 0이면 캐시 사용 안 함)
+# 그룹이나 공유 설정 변경은 invalidate_* 훅을 호출하지 않으면 최대 이 시간만큼 늦게 반영됩니다.
+AUTH_PERMISSION_CACHE_TTL = float(os.getenv('AUTH_PERMISSION_CACHE_TTL', '30'))
+
+# 캐시별 최대 항목 수 (넘으면 가장 오래 사용하지 않은 항목부터 제거)
+AUTH_PERMISSION_CACHE_MAX_ENTRIES = int(os.getenv('AUTH_PERMISSION_CACHE_MAX_ENTRIES', '10000'))
+
+class _TTLCache:
+    """항목 수가 제한된 LRU + TTL 캐시 (스레드 안전)"""
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """(캐시에 있는지, 값)"""
+        if not self.enabled:
+            return False, None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[0]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def set(self, key: Hashable, value: Any):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, match=None) -> int:
+        """match(key)가 참인 항목 제거 (None이면 전체), 제거한 항목 수 반환"""
+        with self._lock:
+            if match is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+            keys = [key for key in self._entries if match(key)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "ttl": self.ttl,
+                "max_entries": self.max_entries,
+            }
+
+# 로그인 사용자 ID -> (사용자 존재 여부, groups)
+_user_groups_cache = _TTLCache(AUTH_PERMISSION_CACHE_TTL, AUTH_PERMISSION_CACHE_MAX_ENTRIES)
+# (워크플로우 소유자 ID, 워크플로우 이름) -> (is_shared, share_group), 메타데이터가 없으면 None
+_workflow_share_cache = _TTLCache(AUTH_PERMISSION_CACHE_TTL, AUTH_PERMISSION_CACHE_MAX_ENTRIES)
+
+def invalidate_user_groups(user_id=None) -> int:
+    """
+    사용자 그룹 캐시 무효화 (사용자 그룹 변경, 사용자 삭제 후 호출)
+
+    Args:
+        user_id: 무효화할 사용자 ID (None이면 전체)
+
+    Returns:
+        int: 제거된 항목 수
+    """
+    if user_id is None:
+        return _user_groups_cache.invalidate()
+    user_id = str(user_id).strip()
+    return _user_groups_cache.invalidate(lambda key: key == user_id)
+
+def invalidate_workflow_share(user_id=None, workflow_id=None) -> int:
+    """
+    워크플로우 공유 정보 캐시 무효화 (공유 설정 변경, 워크플로우 생성/삭제 후 호출)
+
+    Args:
+        user_id: 워크플로우 소유자 ID (None이면 모든 사용자)
+        workflow_id: 워크플로우 이름 (None이면 해당 사용자의 모든 워크플로우)
+
+    Returns:
+        int: 제거된 항목 수
+
+    Example:
+        >>> invalidate_workflow_share("3", "my_workflow")
+        1
+    """
+    if user_id is None and workflow_id is None:
+        return _workflow_share_cache.invalidate()
+    user_id = str(user_id).strip() if user_id is not None else None
+    workflow_id = str(workflow_id) if workflow_id is not None else None
+    return _workflow_share_cache.invalidate(
+        lambda key: (user_id is None or key[0] == user_id) and (workflow_id is None or key[1] == workflow_id)
+    )
+
+def clear_permission_cache():
+    """사용자 그룹과 워크플로우 공유 정보 캐시 전체 무효화"""
+    _user_groups_cache.invalidate()
+    _workflow_share_cache.invalidate()
+
+def get_permission_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """권한 캐시 적중/실패 통계"""
+    return {
+        "user_groups": _user_groups_cache.stats(),
+        "workflow_share": _workflow_share_cache.stats(),
+    }
+
+def _normalize_user_ids(login_user_id, requested_user_id) -> Tuple[Optional[str], Optional[str]]:
+    if login_user_id is not None:
+        login_user_id = str(login_user_id).strip()
+    if requested_user_id is not None:
+        requested_user_id = str(requested_user_id).strip()
+    return login_user_id, requested_user_id
+
+def _load_user_groups(app_db, login_user_id: str) -> Tuple[bool, Any]:
+    """(사용자 존재 여부, groups) - 캐시에 없으면 DB에서 조회"""
+    found, cached = _user_groups_cache.get(login_user_id)
+    if found:
+        return cached
+
+    user = app_db.find_by_id(User, login_user_id)
+    cached = (True, user.groups) if user else (False, None)
+    _user_groups_cache.set(login_user_id, cached)
+    return cached
+
+def _share_info(workflow_meta) -> Tuple[Any, Any]:
+    return workflow_meta.is_shared, workflow_meta.share_group
+
+def _load_workflow_share(app_db, requested_user_id: str, workflow_id) -> Optional[Tuple[Any, Any]]:
+    """(is_shared, share_group) - 메타데이터가 없으면 None, 캐시에 없으면 DB에서 조회"""
+    found, cached = _workflow_share_cache.get((requested_user_id, str(workflow_id)))
+    if found:
+        return cached
+    return _query_workflow_share(app_db, requested_user_id, workflow_id)
+
+def _query_workflow_share(app_db, requested_user_id: str, workflow_id) -> Optional[Tuple[Any, Any]]:
+    requested_workflow_meta = app_db.find_by_condition(
+        WorkflowMeta,
+        {'user_id': requested_user_id, 'workflow_name': workflow_id},
+        limit=1
+    )
+    share = _share_info(requested_workflow_meta[0]) if requested_workflow_meta else None
+    _workflow_share_cache.set((requested_user_id, str(workflow_id)), share)
+    return share
+
+def _resolve_shared_access(login_user_id: str, requested_user_id: str, workflow_id,
+                           groups, share: Optional[Tuple[Any, Any]]) -> str:
+    """공유 정보와 로그인 사용자 그룹으로 사용할 사용자 ID 결정"""
+    if share is None:
+        logger.warning(f"✗ No workflow metadata found for user_id: {requested_user_id}, workflow_name: {workflow_id}. Using login_user_id: {login_user_id}")
+        return login_user_id
+
+    is_shared, share_group = share
+    if not is_shared:
+        logger.warning(f"✗ Access denied! Workflow is not shared (is_shared=False). Using login_user_id: {login_user_id}")
+        return login_user_id
+
+    if share_group in groups:
+        logger.info(f"✓ Access granted! Login user belongs to share group '{share_group}'. Using requested_user_id: {requested_user_id}")
+        return requested_user_id
+    return login_user_id
+
 def workflow_user_id_extractor(app_db, login_user_id, requested_user_id, workflow_id):
     """
     로그인된 사용자와 요청된 사용자 ID를 비교하여 적절한 사용자 ID를 반환합니다.
     그룹 공유 권한도 확인합니다.
-    
+
+    로그인 사용자 그룹과 워크플로우 공유 정보는 AUTH_PERMISSION_CACHE_TTL 동안 캐시합니다.
+
     Args:
         app_db: 데이터베이스 매니저
         login_user_id: 로그인된 사용자 ID
         requested_user_id: 요청된 사용자 ID
         workflow_id: 워크플로우 ID
-    
+
     Returns:
         str: 사용할 사용자 ID
     """
-    if login_user_id is not None:
-        login_user_id = str(login_user_id).strip()
-
-    if requested_user_id is not None:
-        requested_user_id = str(requested_user_id).strip()
-    else:
-        requested_user_id = None
+    login_user_id, requested_user_id = _normalize_user_ids(login_user_id, requested_user_id)
 
     if (login_user_id == requested_user_id) or requested_user_id == None or len(requested_user_id) == 0:
         return login_user_id
-    else:
-        user = app_db.find_by_id(User, login_user_id)
-        if not user:
-            logger.error(f"Login user not found in database: {login_user_id}")
-            return login_user_id
-
-        groups = user.groups
-        requested_workflow_meta = app_db.find_by_condition(
-            WorkflowMeta, 
-            {'user_id': requested_user_id, 'workflow_name': workflow_id}, 
-            limit=1
-        )
-
-        if requested_workflow_meta:
-            requested_workflow_meta = requested_workflow_meta[0]
-            if requested_workflow_meta.is_shared:
-                if requested_workflow_meta.share_group in groups:
-                    logger.info(f"✓ Access granted! Login user belongs to share group '{requested_workflow_meta.share_group}'. Using requested_user_id: {requested_user_id}")
-                    return requested_user_id
-                else:
-                    return login_user_id
-            else:
-                logger.warning(f"✗ Access denied! Workflow is not shared (is_shared=False). Using login_user_id: {login_user_id}")
-                return login_user_id
+
+    user_found, groups = _load_user_groups(app_db, login_user_id)
+    if not user_found:
+        logger.error(f"Login user not found in database: {login_user_id}")
+        return login_user_id
+
+    share = _load_workflow_share(app_db, requested_user_id, workflow_id)
+    return _resolve_shared_access(login_user_id, requested_user_id, workflow_id, groups, share)
+
+def workflow_user_ids_extractor(app_db, login_user_id, requested_user_id, workflow_ids: Iterable[Any]) -> Dict[Any, str]:
+    """
+    workflow_user_id_extractor의 일괄 버전 (같은 요청 사용자의 여러 워크플로우 권한을 한 번에 확인)
+
+    로그인 사용자 그룹은 한 번만 확인하고, 공유 정보는 캐시에 없는 워크플로우만 한 행씩 조회해 캐시에 채웁니다.
+
+    Args:
+        app_db: 데이터베이스 매니저
+        login_user_id: 로그인된 사용자 ID
+        requested_user_id: 요청된 사용자 ID
+        workflow_ids: 워크플로우 ID 목록
+
+    Returns:
+        Dict: {workflow_id: 사용할 사용자 ID}
+
+    Example:
+        >>> workflow_user_ids_extractor(app_db, 1, 2, ["shared_flow", "private_flow"])
+        {'shared_flow': '2', 'private_flow': '1'}
+    """
+    workflow_ids = list(dict.fromkeys(workflow_ids))
+    login_user_id, requested_user_id = _normalize_user_ids(login_user_id, requested_user_id)
+
+    if (login_user_id == requested_user_id) or requested_user_id == None or len(requested_user_id) == 0:
+        return {workflow_id: login_user_id for workflow_id in workflow_ids}
+
+    user_found, groups = _load_user_groups(app_db, login_user_id)
+    if not user_found:
+        logger.error(f"Login user not found in database: {login_user_id}")
+        return {workflow_id: login_user_id for workflow_id in workflow_ids}
+
+    shares = {}
+    missing = []
+    for workflow_id in workflow_ids:
+        found, share = _workflow_share_cache.get((requested_user_id, str(workflow_id)))
+        if found:
+            shares[workflow_id] = share
         else:
-            logger.warning(f"✗ No workflow metadata found for user_id: {requested_user_id}, workflow_name: {workflow_id}. Using login_user_id: {login_user_id}")
-            return login_user_id
\ No newline at end of file
+            missing.append(workflow_id)
+
+    # DB 매니저에 이름 목록/컬럼 선택 조회가 없으므로 캐시에 없는 워크플로우만 한 행씩 조회
+    # (소유자의 전체 WorkflowMeta를 가져오면 workflow_data까지 모두 읽게 됨)
+    for workflow_id in missing:
+        shares[workflow_id] = _query_workflow_share(app_db, requested_user_id, workflow_id)
+
+    return {
+        workflow_id: _resolve_shared_access(login_user_id, requested_user_id, workflow_id, groups, shares[workflow_id])
+        for workflow_id in workflow_ids
+    }
@@ -3,9 +3,24 @@
 """
 import re
 import logging
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy가 없으면 safe_round_floats는 한 개씩 반올림
+    np = None
 
 logger = logging.getLogger("data-parsers")
 
+# 컬렉션 이름 끝의 UUID 패턴: _ + 8-4-4-4-12 형태의 16진수 문자열 (대소문자 구분 없음)
+# re.IGNORECASE 대신 대문자 범위를 직접 넣어 같은 문자를 더 빠르게 일치시킴
+_COLLECTION_UUID_SUFFIX = re.compile(
+    r'_[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$'
+)
+
+_INPUT_PREFIX = "Input: "
+_INPUT_SECTION_MARKERS = ("\n\nparameters:", "\n\nAdditional Parameters:", "\n\nValidation Error:")
+
 def extract_collection_name(collection_full_name: str) -> str:
     """
     컬렉션 이름에서 UUID 부분을 제거하고 실제 이름만 추출합니다.
@@ -18,13 +33,37 @@ def extract_collection_name(collection_full_name: str) -> str:
     Returns:
         UUID 부분이 제거된 깨끗한 컬렉션 이름
     """
-    # UUID 패턴: 8-4-4-4-12 형태의 16진수 문자열
-    uuid_pattern = r'_[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
-
     # UUID 부분을 제거하고 앞의 이름만 반환
-    clean_name = re.sub(uuid_pattern, '', collection_full_name, flags=re.IGNORECASE)
+    return _COLLECTION_UUID_SUFFIX.sub('', collection_full_name)
+
+def extract_collection_names(collection_full_names: Iterable[str]) -> List[str]:
+    """
+    extract_collection_name의 일괄 버전 (리포트 등 많은 행을 처리할 때)
+
+    미리 컴파일한 패턴을 한 번만 찾아 모든 이름에 적용합니다. 결과는 한 개씩 호출한 것과 같습니다.
+
+    Args:
+        collection_full_names: UUID가 포함된 전체 컬렉션 이름 목록
 
-    return clean_name
+    Returns:
+        UUID 부분이 제거된 컬렉션 이름 목록 (입력 순서)
+
+    Example:
+        >>> extract_collection_names(['문서_3a6a552d-d277-490d-9f3c-cead80d651f7', '문서'])
+        ['문서', '문서']
+    """
+    strip_uuid = _COLLECTION_UUID_SUFFIX.sub
+    return [strip_uuid('', name) for name in collection_full_names]
+
+def _parse_input_text(after_input: str) -> str:
+    """"Input: " 이후 텍스트에서 첫 번째로 일치하는 구분 패턴 앞까지 반환"""
+    # 모든 구분 패턴이 빈 줄로 시작하므로 빈 줄이 없으면 바로 반환
+    if "\n\n" in after_input:
+        for marker in _INPUT_SECTION_MARKERS:
+            index = after_input.find(marker)
+            if index >= 0:
+                return after_input[:index].strip()
+    return after_input.strip()
 
 def parse_input_data(input_data_str: str) -> str:
     """
@@ -39,28 +78,84 @@ def parse_input_data(input_data_str: str) -> str:
     if not input_data_str or not isinstance(input_data_str, str):
         return input_data_str
 
-    # "Input: " 패턴으로 시작하는지 확인
-    if input_data_str.startswith("Input: "):
-        # "Input: " 이후의 텍스트 추출
-        after_input = input_data_str[7:]  # "Input: " 길이만큼 자르기
+    # "Input: " 패턴으로 시작하면 이후 텍스트에서
+    # "\n\nparameters:", "\n\nAdditional Parameters:", "\n\nValidation Error:" 패턴 앞까지 반환
+    if input_data_str.startswith(_INPUT_PREFIX):
+        return _parse_input_text(input_data_str[len(_INPUT_PREFIX):])
 
-        # "\n\nparameters:" 또는 "\n\nAdditional Parameters:" 패턴 찾기
-        patterns = ["\n\nparameters:", "\n\nAdditional Parameters:", "\n\nValidation Error:"]
+    # "Input: " 패턴이 없으면 원본 반환
+    return input_data_str
 
-        for pattern in patterns:
-            if pattern in after_input:
-                # 패턴 앞까지의 텍스트 반환
-                return after_input.split(pattern)[0].strip()
+def parse_input_data_batch(input_data_strs: Iterable[Any]) -> List[Any]:
+    """
+    parse_input_data의 일괄 버전 (결과는 한 개씩 호출한 것과 같음)
 
-        # 패턴이 없으면 전체 텍스트 반환 (Input: 이후)
-        return after_input.strip()
+    Args:
+        input_data_strs: 파싱할 입력 데이터 목록 (문자열이 아닌 값은 그대로 반환)
 
-    # "Input: " 패턴이 없으면 원본 반환
-    return input_data_str
+    Returns:
+        파싱된 입력 텍스트 목록 (입력 순서)
+    """
+    prefix = _INPUT_PREFIX
+    start = len(prefix)
+    return [
+        (_parse_input_text(value[start:]) if value.startswith(prefix) else value)
+        if value.__class__ is str else parse_input_data(value)
+        for value in input_data_strs
+    ]
+
+# clean_llm_output이 순서대로 제거하는 태그 블록: (여는 문자열, 닫는 문자열, 블록 패턴)
+# 블록 패턴은 닫는 문자열 전까지 되돌아가지 않고 한 번에 건너뛰도록 풀어 쓴 형태 (.*?와 같은 범위를 지움)
+# 한 패턴으로 묶어 한 번에 스캔하면 먼저 열린 태그부터 지우게 되어, 종류가 엇갈린 출력
+# (예: '[Cite.{{ <think> }}] </think>')에서 종류별로 차례로 지우던 결과와 달라지므로 일부러 종류별로 적용
+# (점수 캐시 키가 정리된 출력을 해시하므로 결과가 같아야 함)
+_LLM_OUTPUT_TAG_BLOCKS = tuple((opening, close, re.compile(pattern)) for opening, close, pattern in (
+    ('<think>', '</think>', r'<think>[^<]*+(?:<(?!/think>)[^<]*+)*+</think>'),
+    ('[Cite.', '}}]', r'\[Cite\.\s*+\{\{[^}]*+(?:\}(?!\}\])[^}]*+)*+\}\}\]'),
+    ('<TOOLUSELOG>', '</TOOLUSELOG>', r'<TOOLUSELOG>[^<]*+(?:<(?!/TOOLUSELOG>)[^<]*+)*+</TOOLUSELOG>'),
+    ('<TOOLOUTPUTLOG>', '</TOOLOUTPUTLOG>', r'<TOOLOUTPUTLOG>[^<]*+(?:<(?!/TOOLOUTPUTLOG>)[^<]*+)*+</TOOLOUTPUTLOG>'),
+))
+
+# 스트리밍 정리용 여는 패턴 -> 닫는 문자열
+_LLM_OUTPUT_TAG_OPEN = re.compile(r'<think>|<TOOLUSELOG>|<TOOLOUTPUTLOG>|\[Cite\.\s*\{\{')
+_LLM_OUTPUT_TAG_CLOSE = {
+    '<think>': '</think>',
+    '<TOOLUSELOG>': '</TOOLUSELOG>',
+    '<TOOLOUTPUTLOG>': '</TOOLOUTPUTLOG>',
+}
+_CITE_CLOSE = '}}]'
+
+# 스트리밍 시 chunk 끝에서 잘렸을 수 있는 여는 패턴의 앞부분
+_LLM_OUTPUT_TAG_LITERALS = ('<think>', '<TOOLUSELOG>', '<TOOLOUTPUTLOG>', '[Cite.')
+_PARTIAL_CITE_OPEN = re.compile(r'\[Cite\.\s*\{?\Z')
+
+def _tag_close(open_match: "re.Match") -> str:
+    return _LLM_OUTPUT_TAG_CLOSE.get(open_match.group(), _CITE_CLOSE)
+
+def _remove_llm_output_tags(text: str) -> Tuple[str, bool]:
+    """
+    태그 블록 제거 (결과, 여는/닫는 문자열이 모두 있는 태그가 있었는지)
+
+    think -> cite -> tooluse -> tooloutput 순서로 종류마다 제거하고 앞뒤 공백을 정리하므로
+    서로 다른 종류의 태그가 엇갈려 있어도 순서대로 제거하던 기존 결과와 같습니다.
+    여는 문자열과 닫는 문자열이 모두 있는 종류만 스캔하므로 닫히지 않은 태그 때문에 끝까지 되돌아가지 않습니다.
+    """
+    # 태그가 없는 대부분의 출력은 바로 반환
+    if '<think>' not in text and '[Cite.' not in text and '<TOOL' not in text:
+        return text, False
+    found = False
+    for opening, close, pattern in _LLM_OUTPUT_TAG_BLOCKS:
+        if opening in text and close in text:
+            text = pattern.sub('', text).strip()
+            found = True
+    return text, found
 
 def clean_llm_output(actual_output: str) -> str:
     """
     LLM 출력에서 불필요한 태그들을 제거합니다.
+
+    <think>, [Cite.{{...}}], <TOOLUSELOG>, <TOOLOUTPUTLOG> 블록을 이 순서대로 미리 컴파일한 패턴으로 제거하고
+    앞뒤 공백을 정리합니다.
     
     Args:
         actual_output: 정리할 LLM 출력
@@ -70,24 +165,152 @@ def clean_llm_output(actual_output: str) -> str:
     """
     if not actual_output:
         return actual_output
-    
-    # <think> 태그 제거
-    if '<think>' in actual_output and '</think>' in actual_output:
-        actual_output = re.sub(r'<think>.*?</think>', '', actual_output, flags=re.DOTALL).strip()
 
-    # [Cite.{{}}] 태그 제거
-    if '[Cite.' in actual_output and '}}]' in actual_output:
-        actual_output = re.sub(r'\[Cite\.\s*\{\{.*?\}\}\]', '', actual_output, flags=re.DOTALL).strip()
+    cleaned, found = _remove_llm_output_tags(actual_output)
+    return cleaned.strip() if found else cleaned
+
+class LLMOutputCleaner:
+    """
+    스트리밍 LLM 출력 정리기 (clean_llm_output의 chunk 단위 버전)
+
+    feed()에 chunk를 순서대로 넣으면 바로 내보낼 수 있는 정리된 텍스트를 반환하고, 마지막에 finish()를 호출합니다.
+    태그 블록 안의 내용과 chunk 끝에서 잘린 여는 패턴, 끝 공백만 잠시 보관하므로 전체 응답을 모으지 않습니다.
+    앞뒤 공백은 태그 블록을 제거한 경우에만 정리하며, 앞 공백은 그 앞에서 블록이 제거된 경우에만 정리됩니다.
+    블록은 먼저 열린 태그부터 제거하므로 서로 다른 종류의 태그가 엇갈려 있으면(예: '[Cite.{{ <think> }}] </think>')
+    종류 순서대로 제거하는 clean_llm_output과 결과가 다를 수 있습니다 (그 외에는 같은 결과).
+
+    Example:
+        >>> cleaner = LLMOutputCleaner()
+        >>> cleaner.feed("<think>계획") + cleaner.feed("</think>\n\n답변") + cleaner.finish()
+        '답변'
+    """
+
+    def __init__(self):
+        self._pending = ""
+        self._close: Optional[str] = None
+        self._block_parts = []
+        self._close_tail = ""
+        self._removed = False
+        self._started = False
+        self._leading = ""
+        self._trailing = ""
+
+    def _emit(self, text: str) -> str:
+        if not text:
+            return ""
+        if not self._started:
+            stripped = text.lstrip()
+            if not stripped:
+                self._leading += text
+                return ""
+            self._started = True
+            text = stripped if self._removed else self._leading + text
+            self._leading = ""
+
+        body = text.rstrip()
+        if not body:
+            self._trailing += text
+            return ""
+        out = self._trailing + body
+        self._trailing = text[len(body):]
+        return out
+
+    @staticmethod
+    def _hold_from(text: str) -> int:
+        """text 끝에서 여는 패턴의 앞부분일 수 있는 위치 (없으면 text 길이)"""
+        cite = text.rfind('[')
+        if cite >= 0 and ('[Cite.'.startswith(text[cite:]) or _PARTIAL_CITE_OPEN.match(text, cite)):
+            return cite
+        pos = text.find('<', max(0, len(text) - len('<TOOLOUTPUTLOG>')))
+        while pos >= 0:
+            tail = text[pos:]
+            if any(literal.startswith(tail) for literal in _LLM_OUTPUT_TAG_LITERALS):
+                return pos
+            pos = text.find('<', pos + 1)
+        return len(text)
+
+    def feed(self, chunk: str) -> str:
+        """chunk를 추가하고 지금 내보낼 수 있는 정리된 텍스트 반환"""
+        out = []
+        text = chunk or ""
+        while text:
+            if self._close is not None:
+                # 태그 블록 안: 닫는 문자열을 찾을 때까지 보관 (끝까지 안 닫히면 finish에서 다시 처리)
+                joined = self._close_tail + text
+                close_at = joined.find(self._close)
+                if close_at < 0:
+                    self._block_parts.append(text)
+                    self._close_tail = joined[-(len(self._close) - 1):]
+                    break
+                text = joined[close_at + len(self._close):]
+                self._close = None
+                self._block_parts = []
+                self._removed = True
+                continue
+
+            text = self._pending + text
+            self._pending = ""
+            match = _LLM_OUTPUT_TAG_OPEN.search(text)
+            if match is None:
+                hold_from = self._hold_from(text)
+                out.append(self._emit(text[:hold_from]))
+                self._pending = text[hold_from:]
+                break
+            out.append(self._emit(text[:match.start()]))
+            self._close = _tag_close(match)
+            self._block_parts = [match.group()]
+            self._close_tail = ""
+            text = text[match.end():]
+        return ''.join(out)
+
+    def finish(self) -> str:
+        """남은 텍스트 반환 (닫히지 않은 태그는 제거하지 않음)"""
+        if self._close is not None:
+            text, removed = _remove_llm_output_tags(''.join(self._block_parts))
+            self._removed = self._removed or removed
+        else:
+            text = self._pending
+        self._pending, self._close, self._block_parts, self._close_tail = "", None, [], ""
 
-    # <TOOLUSELOG> 태그 제거
-    if '<TOOLUSELOG>' in actual_output and '</TOOLUSELOG>' in actual_output:
-        actual_output = re.sub(r'<TOOLUSELOG>.*?</TOOLUSELOG>', '', actual_output, flags=re.DOTALL).strip()
+        out = self._emit(text)
+        if not self._removed:
+            out += self._leading + self._trailing
+        self._leading = self._trailing = ""
+        return out
 
-    # <TOOLOUTPUTLOG> 태그 제거
-    if '<TOOLOUTPUTLOG>' in actual_output and '</TOOLOUTPUTLOG>' in actual_output:
-        actual_output = re.sub(r'<TOOLOUTPUTLOG>.*?</TOOLOUTPUTLOG>', '', actual_output, flags=re.DOTALL).strip()
+def clean_llm_output_stream(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    스트리밍 LLM 출력을 chunk 단위로 정리
 
-    return actual_output
+    Args:
+        chunks: LLM 응답 토큰/chunk 이터레이터
+
+    Returns:
+        정리된 텍스트 chunk 이터레이터 (빈 문자열은 내보내지 않음)
+
+    Example:
+        >>> ''.join(clean_llm_output_stream(["<think>", "...</think>", " 답변"]))
+        '답변'
+    """
+    cleaner = LLMOutputCleaner()
+    for chunk in chunks:
+        text = cleaner.feed(chunk)
+        if text:
+            yield text
+    text = cleaner.finish()
+    if text:
+        yield text
+
+async def aclean_llm_output_stream(chunks: AsyncIterable[str]) -> AsyncIterator[str]:
+    """clean_llm_output_stream의 비동기 버전 (astream 응답 등)"""
+    cleaner = LLMOutputCleaner()
+    async for chunk in chunks:
+        text = cleaner.feed(chunk)
+        if text:
+            yield text
+    text = cleaner.finish()
+    if text:
+        yield text
 
 def safe_round_float(value, decimal_places=4):
     """
@@ -106,4 +329,84 @@ def safe_round_float(value, decimal_places=4):
         else:
             return float(value) if value else 0.0
     except (ValueError, TypeError):
-        return 0.0
\ No newline at end of file
+        return 0.0
+
+# numpy로 반올림할 때 round()와 같은 결과를 보장하는 범위 (이보다 작은 배치는 한 개씩 처리하는 편이 빠름)
+_ROUND_VECTOR_MIN_SIZE = 64
+_ROUND_VECTOR_MAX_DECIMALS = 15
+_ROUND_EXACT_LIMIT = 2.0 ** 52
+
+def _round_float_array(floats: "np.ndarray", decimal_places: int) -> "np.ndarray":
+    """
+    float 배열을 round(value, decimal_places)와 같은 값으로 반올림
+
+    10^n을 곱해 정수로 반올림한 뒤 다시 나누고, 곱셈 오차 때문에 결과가 달라질 수 있는 값
+    (.5 경계 근처, 정수 정밀도를 넘는 값, inf/nan)만 round()로 다시 계산합니다.
+    """
+    scale = 10.0 ** decimal_places
+    with np.errstate(over='ignore', invalid='ignore'):
+        scaled = floats * scale
+        rounded = np.rint(scaled) / scale
+        magnitude = np.abs(scaled)
+        fraction = magnitude - np.floor(magnitude)
+        unsure = ~(magnitude < _ROUND_EXACT_LIMIT) | (np.abs(fraction - 0.5) <= magnitude * 1e-15 + 1e-12)
+    for index in np.flatnonzero(unsure):
+        rounded[index] = round(float(floats[index]), decimal_places)
+    return rounded
+
+def safe_round_floats(values: Sequence[Any], decimal_places: int = 4):
+    """
+    safe_round_float의 일괄 버전 (리포트 집계처럼 많은 행을 반올림할 때)
+
+    numpy가 있으면 한 번에 반올림하고 없으면 한 개씩 처리합니다. 어느 쪽이든 값마다 safe_round_float를
+    호출한 것과 같은 결과입니다 (None은 None, 변환할 수 없는 값은 0.0).
+
+    Args:
+        values: 반올림할 값 목록 (Decimal, float, int, str, None 등) 또는 숫자 numpy 배열
+        decimal_places: 소수점 자릿수
+
+    Returns:
+        반올림된 값 목록 (숫자 numpy 배열을 넣으면 float64 배열)
+
+    Example:
+        >>> safe_round_floats([Decimal('0.123456'), None, '1.5', 'abc'])
+        [0.1235, None, 1.5, 0.0]
+    """
+    vectorized = (
+        np is not None
+        and decimal_places.__class__ is int
+        and 0 <= decimal_places <= _ROUND_VECTOR_MAX_DECIMALS
+    )
+
+    if vectorized and isinstance(values, np.ndarray) and values.dtype.kind in 'biuf':
+        return _round_float_array(values.astype(np.float64), decimal_places)
+
+    if not isinstance(values, (list, tuple)):
+        values = list(values)
+    if not vectorized or len(values) < _ROUND_VECTOR_MIN_SIZE:
+        return [safe_round_float(value, decimal_places) for value in values]
+
+    # safe_round_float의 변환 단계: 반올림할 float를 모으고, 반올림하지 않는 결과(None, 0.0 등)는 따로 기록
+    floats = []
+    fixed = {}
+    append = floats.append
+    for index, value in enumerate(values):
+        if value.__class__ is float:
+            append(value)
+            continue
+        if value is None:
+            fixed[index] = None
+        else:
+            try:
+                if hasattr(value, '__float__') or isinstance(value, str):
+                    append(float(value))
+                    continue
+                fixed[index] = float(value) if value else 0.0
+            except (ValueError, TypeError):
+                fixed[index] = 0.0
+        append(0.0)
+
+    rounded = _round_float_array(np.array(floats, dtype=np.float64), decimal_places).tolist()
+    for index, result in fixed.items():
+        rounded[index] = result
+    return rounded
@@ -1,87 +1,183 @@
 """
 LLM 평가 관련 유틸리티 함수들
 """
+import os
 import re
+import asyncio
 import logging
+import threading
+from contextlib import nullcontext
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.output_parsers import JsonOutputParser
 from controller.workflow.models.requests import ScoreModelParser
 from controller.helper.utils.data_parsers import clean_llm_output
+from controller.helper.utils.llm_score_cache import LLMScoreCache, get_llm_score_cache, score_cache_key
 from service.database.models.executor import ExecutionIO
 
 logger = logging.getLogger("llm-evaluators")
 
-async def evaluate_with_llm(
-    unique_interaction_id: str,
-    input_data: str,
-    expected_output: str,
-    actual_output: str,
-    llm_eval_type: str,
-    llm_eval_model: str,
-    app_db,
-    config_composer
-) -> float:
+OPENAI_BASE_URL = "https://api.openai.com/v1"
+
+# 일괄 평가: 동시에 진행하는 LLM 호출 수, 초당 최대 요청 수 (0이면 제한 없음), 한 트랜잭션에 저장하는 점수 수
+LLM_EVAL_CONCURRENCY = int(os.getenv('LLM_EVAL_CONCURRENCY', '8'))
+LLM_EVAL_RATE_LIMIT = float(os.getenv('LLM_EVAL_RATE_LIMIT', '0'))
+LLM_EVAL_DB_BATCH_SIZE = int(os.getenv('LLM_EVAL_DB_BATCH_SIZE', '500'))
+
+# 평가 프롬프트 버전 (프롬프트나 점수 기준을 바꾸면 올려서 이전 점수 캐시를 쓰지 않도록 함)
+EVAL_PROMPT_VERSION = 1
+
+# 평가 프롬프트 구성 요소 (평가마다 같으므로 모듈 로드 시 한 번만 생성)
+EVAL_OUTPUT_PARSER = JsonOutputParser(pydantic_object=ScoreModelParser)
+EVAL_FORMAT_INSTRUCTIONS = EVAL_OUTPUT_PARSER.get_format_instructions()
+EVAL_SYSTEM_MESSAGE = SystemMessage(
+    content="""당신은 정확한 답변 평가 전문가입니다.
+주어진 입력에 대해 실제 생성된 답변이 레퍼런스 정답과 얼마나 일치하는지 평가해주세요.
+
+평가 기준:
+1. 레퍼런스 정답에서 요구하는 핵심 정보나 값이 정확히 포함되어 있는가?
+2. 답변이 적절해 보여도 레퍼런스가 지정하는 정확한 값과 다르면 낮은 점수를 주어야 합니다.
+3. 부분적으로 맞더라도 핵심 내용이 틀리면 낮은 점수를 주어야 합니다.
+4. 완전히 정확한 경우에만 높은 점수(0.9-1.0)를 주세요.
+
+점수 기준:
+- 1.0: 레퍼런스와 완전히 일치하거나 동등한 정확성
+- 0.7-0.9: 대부분 정확하지만 일부 세부사항이 다름
+- 0.4-0.6: 부분적으로 맞지만 중요한 부분이 틀림
+- 0.1-0.3: 대부분 틀렸지만 일부 관련성 있음
+- 0.0: 완전히 틀렸거나 관련성 없음
+
+응답은 반드시 JSON 형식으로 소수점 2자리까지 정확하게 제공해주세요."""
+)
+
+def _eval_temperature(llm_eval_model: str) -> float:
+    if llm_eval_model == "gpt-5" or llm_eval_model == "gpt-5-nano" or llm_eval_model == "gpt-5-mini":
+        return 1
+    return 0.1
+
+class LLMClientRegistry:
     """
-    LLM을 사용하여 실제 출력과 예상 출력을 비교하고 점수를 반환합니다.
+    평가용 ChatOpenAI 클라이언트 재사용
+
+    (provider, base_url, model, temperature)별로 클라이언트를 하나만 만들어 HTTP 연결 풀을 평가 간에 공유합니다.
+    ConfigComposer의 OPENAI_API_KEY, VLLM_API_BASE_URL, VLLM_MODEL_NAME 값이 바뀌면
+    다음 조회 때 기존 클라이언트를 모두 버리고 새 값으로 다시 만듭니다.
+
+    Example:
+        >>> llm_client = llm_client_registry.get_client("OpenAI", "gpt-4o-mini", config_composer)
+        >>> response = await llm_client.ainvoke(messages)
     """
-    logger.info(f"LLM 평가 시작: unique_interaction_id={unique_interaction_id}")
 
-    # 출력 정리
-    actual_output = clean_llm_output(actual_output)
+    WATCHED_CONFIGS = ("OPENAI_API_KEY", "VLLM_API_BASE_URL", "VLLM_MODEL_NAME")
+
+    def __init__(self, max_tokens: int = 1000):
+        self.max_tokens = max_tokens
+        self._clients: Dict[Tuple[str, str, str, float], ChatOpenAI] = {}
+        self._settings: Optional[Tuple[Any, ...]] = None
+        self._lock = threading.Lock()
+
+    def _current_settings(self, config_composer) -> Tuple[Any, ...]:
+        settings = []
+        for config_name in self.WATCHED_CONFIGS:
+            try:
+                settings.append(config_composer.get_config_by_name(config_name).value)
+            except KeyError:
+                settings.append(None)
+        return tuple(settings)
+
+    def _resolve(self, llm_eval_type: str, llm_eval_model: str,
+                 config_composer) -> Tuple[Tuple[str, str, str, float], Optional[str], Tuple[Any, ...]]:
+        api_key, vllm_base_url, vllm_model_name = settings = self._current_settings(config_composer)
 
-    try:
         if llm_eval_type == "OpenAI":
-            api_key = config_composer.get_config_by_name("OPENAI_API_KEY").value
-            base_url = "https://api.openai.com/v1"
-            model_name = llm_eval_model
             if not api_key:
                 logger.error(f"[LLM_EVAL] OpenAI API 키가 설정되지 않았습니다")
                 raise ValueError("OpenAI API 키가 설정되지 않았습니다.")
+            key_api_key, base_url, model_name = api_key, OPENAI_BASE_URL, llm_eval_model
 
         elif llm_eval_type == "vLLM":
-            api_key = None
-            base_url = config_composer.get_config_by_name("VLLM_API_BASE_URL").value
-            model_name = config_composer.get_config_by_name("VLLM_MODEL_NAME").value
+            # 변경 감지에서는 없는 설정을 None으로 두지만, 선택한 vLLM의 주소/모델이 없으면 OpenAI로 보내지 않음
+            if not vllm_base_url or not vllm_model_name:
+                logger.error(f"[LLM_EVAL] vLLM 주소 또는 모델이 설정되지 않았습니다")
+                raise ValueError("VLLM_API_BASE_URL 또는 VLLM_MODEL_NAME이 설정되지 않았습니다.")
+            key_api_key, base_url, model_name = None, vllm_base_url, vllm_model_name
 
         else:
             raise ValueError(f"지원되지 않는 LLM 평가 타입입니다: {llm_eval_type}")
 
-        temperature = 0.1
-        if llm_eval_model == "gpt-5" or llm_eval_model == "gpt-5-nano" or llm_eval_model == "gpt-5-mini":
-            temperature = 1
+        key = (llm_eval_type, base_url, model_name, _eval_temperature(llm_eval_model))
+        return key, key_api_key, settings
 
-        llm_client = ChatOpenAI(
-            api_key=api_key,
-            model=model_name,
-            temperature=temperature,
-            max_tokens=1000,
-            base_url=base_url
-        )
+    def client_key(self, llm_eval_type: str, llm_eval_model: str, config_composer) -> Tuple[str, str, str, float]:
+        """실제로 사용할 (provider, base_url, model, temperature)"""
+        return self._resolve(llm_eval_type, llm_eval_model, config_composer)[0]
 
-        parser = JsonOutputParser(pydantic_object=ScoreModelParser)
+    def get_client(self, llm_eval_type: str, llm_eval_model: str, config_composer) -> ChatOpenAI:
+        """
+        평가 타입과 모델에 맞는 클라이언트 반환 (없으면 생성)
 
-        system_msg = SystemMessage(
-            content="""당신은 정확한 답변 평가 전문가입니다.
-주어진 입력에 대해 실제 생성된 답변이 레퍼런스 정답과 얼마나 일치하는지 평가해주세요.
+        Args:
+            llm_eval_type: "OpenAI" 또는 "vLLM"
+            llm_eval_model: 평가 모델 이름 (vLLM은 VLLM_MODEL_NAME 사용)
+            config_composer: 설정 컴포저
 
-평가 기준:
-1. 레퍼런스 정답에서 요구하는 핵심 정보나 값이 정확히 포함되어 있는가?
-2. 답변이 적절해 보여도 레퍼런스가 지정하는 정확한 값과 다르면 낮은 점수를 주어야 합니다.
-3. 부분적으로 맞더라도 핵심 내용이 틀리면 낮은 점수를 주어야 합니다.
-4. 완전히 정확한 경우에만 높은 점수(0.9-1.0)를 주세요.
+        Returns:
+            ChatOpenAI: 재사용되는 클라이언트
+        """
+        key, key_api_key, settings = self._resolve(llm_eval_type, llm_eval_model, config_composer)
+        _, base_url, model_name, temperature = key
+        with self._lock:
+            if settings != self._settings:
+                if self._clients:
+                    logger.info("LLM evaluator settings changed, dropping %d cached clients", len(self._clients))
+                self._clients.clear()
+                self._settings = settings
 
-점수 기준:
-- 1.0: 레퍼런스와 완전히 일치하거나 동등한 정확성
-- 0.7-0.9: 대부분 정확하지만 일부 세부사항이 다름
-- 0.4-0.6: 부분적으로 맞지만 중요한 부분이 틀림
-- 0.1-0.3: 대부분 틀렸지만 일부 관련성 있음
-- 0.0: 완전히 틀렸거나 관련성 없음
+            llm_client = self._clients.get(key)
+            if llm_client is None:
+                llm_client = ChatOpenAI(
+                    api_key=key_api_key,
+                    model=model_name,
+                    temperature=temperature,
+                    max_tokens=self.max_tokens,
+                    base_url=base_url
+                )
+                self._clients[key] = llm_client
+            return llm_client
 
-응답은 반드시 JSON 형식으로 소수점 2자리까지 정확하게 제공해주세요."""
-        )
+    def invalidate(self):
+        """캐시된 클라이언트 모두 제거 (다음 조회 때 다시 생성)"""
+        with self._lock:
+            self._clients.clear()
+            self._settings = None
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+llm_client_registry = LLMClientRegistry()
+
+class AsyncRateLimiter:
+    """요청 시작 간격을 1/rate초 이상으로 유지하는 비동기 속도 제한 (rate가 0 이하면 제한 없음)"""
 
-        evaluation_prompt = f"""다음 내용을 평가해주세요:
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        if not self.interval:
+            return
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            wait = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+async def _score_with_llm(llm_client: ChatOpenAI, input_data: str, expected_output: str, actual_output: str) -> float:
+    """LLM 호출 한 번으로 점수 계산 (actual_output은 정리된 값, 실패하면 예외)"""
+    evaluation_prompt = f"""다음 내용을 평가해주세요:
 
 **입력 질문/요청:**
 {input_data}
@@ -94,22 +190,79 @@ async def evaluate_with_llm(
 
 위 실제 답변이 레퍼런스 정답과 얼마나 정확히 일치하는지 0.00~1.00 사이의 점수로 평가해주세요.
 **답변 형식**
-{parser.get_format_instructions()}"""
+{EVAL_FORMAT_INSTRUCTIONS}"""
+
+    human_msg = HumanMessage(content=evaluation_prompt)
+
+    # LLM 호출
+    response = await llm_client.ainvoke([EVAL_SYSTEM_MESSAGE, human_msg])
+    content = response.content.strip()
+
+    # JSON 파싱
+    parsed_result = EVAL_OUTPUT_PARSER.parse(content)
+    try:
+        score = parsed_result.llm_eval_score
+    except:
+        score = parsed_result.get('llm_eval_score', 0.0)
+
+    return max(0.0, min(1.0, round(score, 2)))
+
+async def _cache_call(cache: LLMScoreCache, func, *args):
+    """네트워크 I/O가 있는 캐시(Redis)는 워커 스레드에서 호출"""
+    if cache.blocking:
+        return await asyncio.to_thread(func, *args)
+    return func(*args)
+
+def _save_llm_eval_scores(app_db, scores: List[Tuple[str, float]]):
+    """
+    (interaction_id, 점수) 목록을 한 트랜잭션으로 저장
+
+    레코드를 먼저 읽지 않고 interaction_id 조건으로 llm_eval_score 컬럼만 갱신합니다.
+    DB 매니저가 transaction()을 제공하지 않으면 같은 갱신을 트랜잭션 없이 실행합니다.
+    """
+    begin = getattr(app_db, 'transaction', None)
+    with begin() if callable(begin) else nullcontext():
+        for interaction_id, score in scores:
+            app_db.update_list_columns(
+                ExecutionIO,
+                {"llm_eval_score": score},
+                {"interaction_id": interaction_id}
+            )
+
+async def evaluate_with_llm(
+    unique_interaction_id: str,
+    input_data: str,
+    expected_output: str,
+    actual_output: str,
+    llm_eval_type: str,
+    llm_eval_model: str,
+    app_db,
+    config_composer
+) -> float:
+    """
+    LLM을 사용하여 실제 출력과 예상 출력을 비교하고 점수를 반환합니다.
+    """
+    logger.info(f"LLM 평가 시작: unique_interaction_id={unique_interaction_id}")
 
-        human_msg = HumanMessage(content=evaluation_prompt)
+    # 출력 정리
+    actual_output = clean_llm_output(actual_output)
 
-        # LLM 호출
-        response = await llm_client.ainvoke([system_msg, human_msg])
-        content = response.content.strip()
+    try:
+        llm_client = llm_client_registry.get_client(llm_eval_type, llm_eval_model, config_composer)
 
-        # JSON 파싱
-        parsed_result = parser.parse(content)
-        try:
-            score = parsed_result.llm_eval_score
-        except:
-            score = parsed_result.get('llm_eval_score', 0.0)
+        # 같은 내용을 같은 모델과 프롬프트로 평가한 점수가 있으면 LLM을 호출하지 않음
+        score = None
+        cache = get_llm_score_cache(config_composer)
+        if cache is not None:
+            model_name = llm_client_registry.client_key(llm_eval_type, llm_eval_model, config_composer)[2]
+            cache_key = score_cache_key(input_data, expected_output, actual_output,
+                                        llm_eval_type, model_name, EVAL_PROMPT_VERSION)
+            score = await _cache_call(cache, cache.get, cache_key)
 
-        score = max(0.0, min(1.0, round(score, 2)))
+        if score is None:
+            score = await _score_with_llm(llm_client, input_data, expected_output, actual_output)
+            if cache is not None:
+                await _cache_call(cache, cache.set, cache_key, score)
 
         # DB 업데이트
         existing_data = app_db.find_by_condition(
@@ -132,3 +285,124 @@ async def evaluate_with_llm(
     except Exception as e:
         logger.error(f"LLM 평가 중 오류 발생: {str(e)}", exc_info=True)
         return 0.0
+
+async def evaluate_batch_with_llm(
+    items: Iterable[Tuple[str, str, str, str]],
+    llm_eval_type: str,
+    llm_eval_model: str,
+    app_db,
+    config_composer,
+    concurrency: Optional[int] = None,
+    rate_limit: Optional[float] = None,
+    db_batch_size: Optional[int] = None
+) -> Dict[str, float]:
+    """
+    여러 실행 결과를 LLM으로 일괄 평가하고 점수를 배치 단위로 저장합니다.
+
+    최대 concurrency개의 LLM 호출을 동시에 진행하고, rate_limit이 있으면 초당 요청 수를 제한합니다.
+    점수는 db_batch_size개씩 모아 워커 스레드에서 한 트랜잭션으로 저장합니다 (이벤트 루프를 막지 않음).
+    점수 캐시를 쓰면 같은 내용은 한 번만 평가하고, 캐시에 있는 내용은 LLM을 호출하지 않고 저장만 합니다.
+    평가에 실패한 항목은 0.0으로 반환하고 DB에는 저장하지 않습니다 (evaluate_with_llm과 같음).
+
+    Args:
+        items: (interaction_id, input_data, expected_output, actual_output) 목록
+        llm_eval_type: "OpenAI" 또는 "vLLM"
+        llm_eval_model: 평가 모델 이름
+        app_db: 데이터베이스 매니저
+        config_composer: 설정 컴포저
+        concurrency: 동시 LLM 호출 수 (기본값: LLM_EVAL_CONCURRENCY)
+        rate_limit: 초당 최대 LLM 요청 수 (기본값: LLM_EVAL_RATE_LIMIT, 0이면 제한 없음)
+        db_batch_size: 한 트랜잭션에 저장하는 점수 수 (기본값: LLM_EVAL_DB_BATCH_SIZE)
+
+    Returns:
+        Dict[str, float]: interaction_id별 점수
+
+    Example:
+        >>> scores = await evaluate_batch_with_llm(
+        ...     [("run-1", "질문", "정답", "답변"), ("run-2", "질문", "정답", "답변")],
+        ...     "OpenAI", "gpt-4o-mini", app_db, config_composer, concurrency=16, rate_limit=20
+        ... )
+        >>> scores["run-1"]
+        0.95
+    """
+    items = list(items)
+    logger.info(f"LLM 일괄 평가 시작: {len(items)}건")
+
+    scores: Dict[str, float] = {}
+    try:
+        llm_client = llm_client_registry.get_client(llm_eval_type, llm_eval_model, config_composer)
+    except ValueError as e:
+        logger.error(f"LLM 일괄 평가 중 오류 발생: {str(e)}")
+        return {item[0]: 0.0 for item in items}
+
+    # 같은 내용(캐시 키)은 한 번만 평가하고, 점수 캐시에 있는 내용은 LLM 호출 없이 저장 대상으로
+    cache = get_llm_score_cache(config_composer)
+    groups: Dict[Any, Tuple[List[str], str, str, str]] = {}
+    if cache is not None:
+        model_name = llm_client_registry.client_key(llm_eval_type, llm_eval_model, config_composer)[2]
+    for index, (interaction_id, input_data, expected_output, actual_output) in enumerate(items):
+        actual_output = clean_llm_output(actual_output)
+        group_key = index
+        if cache is not None:
+            group_key = score_cache_key(input_data, expected_output, actual_output,
+                                        llm_eval_type, model_name, EVAL_PROMPT_VERSION)
+        if group_key in groups:
+            groups[group_key][0].append(interaction_id)
+        else:
+            groups[group_key] = ([interaction_id], input_data, expected_output, actual_output)
+
+    cached: Dict[Any, float] = {}
+    if cache is not None:
+        cached = await _cache_call(cache, cache.get_many, list(groups))
+
+    limiter = AsyncRateLimiter(LLM_EVAL_RATE_LIMIT if rate_limit is None else rate_limit)
+    batch_size = max(1, db_batch_size or LLM_EVAL_DB_BATCH_SIZE)
+    pending: List[Tuple[str, float]] = []
+    save_lock = asyncio.Lock()
+    failed = 0
+    saved = 0
+    queue = iter([(group_key, group) for group_key, group in groups.items() if group_key not in cached])
+    for group_key, score in cached.items():
+        for interaction_id in groups[group_key][0]:
+            scores[interaction_id] = score
+            pending.append((interaction_id, score))
+
+    async def flush(force: bool = False):
+        nonlocal saved
+        while len(pending) >= batch_size or (force and pending):
+            batch = pending[:batch_size]
+            del pending[:batch_size]
+            async with save_lock:
+                try:
+                    await asyncio.to_thread(_save_llm_eval_scores, app_db, batch)
+                    saved += len(batch)
+                except Exception as e:
+                    logger.error(f"LLM 평가 점수 저장 중 오류 발생 ({len(batch)}건): {str(e)}", exc_info=True)
+
+    async def worker():
+        nonlocal failed
+        # 공유 이터레이터에서 하나씩 가져가므로 진행 중인 호출은 항상 워커 수 이하
+        for group_key, (interaction_ids, input_data, expected_output, actual_output) in queue:
+            await limiter.acquire()
+            try:
+                score = await _score_with_llm(llm_client, input_data, expected_output, actual_output)
+                if cache is not None:
+                    await _cache_call(cache, cache.set, group_key, score)
+            except Exception as e:
+                logger.error(f"LLM 평가 중 오류 발생: unique_interaction_id={interaction_ids[0]}, {str(e)}")
+                for interaction_id in interaction_ids:
+                    scores[interaction_id] = 0.0
+                failed += len(interaction_ids)
+                continue
+            for interaction_id in interaction_ids:
+                scores[interaction_id] = score
+                pending.append((interaction_id, score))
+            await flush()
+
+    await flush()
+    workers = max(1, min(concurrency or LLM_EVAL_CONCURRENCY, len(items) or 1))
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    await flush(force=True)
+
+    logger.info(f"LLM 일괄 평가 완료: {len(items)}건, 캐시 적중 {sum(len(groups[key][0]) for key in cached)}건, 실패 {failed}건, 저장 {saved}건")
+    return {item[0]: scores[item[0]] for item in items}
@@ -0,0 +1,258 @@
+"""
+LLM 평가 점수 캐시
+
+같은 (입력, 레퍼런스 정답, 정리된 실제 답변, 평가 타입, 모델, 프롬프트 버전)은 같은 점수를 받으므로
+내용 해시를 키로 점수를 저장해 다시 평가할 때 LLM을 호출하지 않습니다.
+설정 서비스가 Redis를 쓰면 같은 Redis에 TTL과 함께 저장하고, 아니면 프로세스 안의 LRU 캐시를 사용합니다.
+"""
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Iterable, Tuple
+
+logger = logging.getLogger("llm-score-cache")
+
+# 캐시 저장소 (auto: 설정 백엔드가 Redis면 redis, 아니면 memory / redis / memory / off)
+LLM_EVAL_CACHE = os.getenv('LLM_EVAL_CACHE', 'auto').lower()
+
+# 점수 보관 시간 (초, 0이면 만료 없음)
+LLM_EVAL_CACHE_TTL = int(os.getenv('LLM_EVAL_CACHE_TTL', str(7 * 24 * 3600)))
+
+# memory 저장소 최대 항목 수 (넘으면 가장 오래 사용하지 않은 항목부터 제거)
+LLM_EVAL_CACHE_MAX_ENTRIES = int(os.getenv('LLM_EVAL_CACHE_MAX_ENTRIES', '100000'))
+
+# Redis 키 접두사 (설정 키 config:*와 겹치지 않음)
+REDIS_KEY_PREFIX = "llm_eval_score:"
+
+
+def score_cache_key(input_data: str, expected_output: str, actual_output: str,
+                    llm_eval_type: str, model_name: str, prompt_version: Any) -> str:
+    """
+    평가 내용 해시 (actual_output은 clean_llm_output으로 정리된 값)
+
+    Example:
+        >>> score_cache_key("질문", "정답", "답변", "OpenAI", "gpt-4o-mini", 1)
+        'c0ffee...'
+    """
+    payload = json.dumps(
+        [prompt_version, llm_eval_type, model_name, input_data, expected_output or "", actual_output],
+        ensure_ascii=False, separators=(',', ':')
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class LLMScoreCache(ABC):
+    """
+    점수 캐시 공통 부분 (적중/실패 통계)
+
+    blocking이 True인 저장소(Redis)는 네트워크 I/O가 있으므로 비동기 코드에서 asyncio.to_thread로 호출합니다.
+    """
+
+    backend_name = "base"
+    blocking = False
+
+    def __init__(self, ttl: int = LLM_EVAL_CACHE_TTL):
+        self.ttl = ttl
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.errors = 0
+
+    def _record(self, hits: int = 0, misses: int = 0, writes: int = 0, errors: int = 0):
+        with self._stats_lock:
+            self.hits += hits
+            self.misses += misses
+            self.writes += writes
+            self.errors += errors
+
+    def get(self, key: str) -> Optional[float]:
+        return self.get_many([key]).get(key)
+
+    def set(self, key: str, score: float):
+        self.set_many([(key, score)])
+
+    @abstractmethod
+    def get_many(self, keys: List[str]) -> Dict[str, float]:
+        """저장된 점수 {key: score} (없는 키는 결과에서 빠짐)"""
+
+    @abstractmethod
+    def set_many(self, items: Iterable[Tuple[str, float]]):
+        """점수 저장"""
+
+    @abstractmethod
+    def clear(self):
+        """저장된 점수 모두 삭제"""
+
+    def size(self) -> Optional[int]:
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        """적중/실패 통계"""
+        with self._stats_lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": self.backend_name,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "writes": self.writes,
+                "errors": self.errors,
+                "size": self.size(),
+                "ttl": self.ttl,
+            }
+
+
+class MemoryLLMScoreCache(LLMScoreCache):
+    """프로세스 안의 LRU + TTL 점수 캐시"""
+
+    backend_name = "memory"
+
+    def __init__(self, max_entries: int = LLM_EVAL_CACHE_MAX_ENTRIES, ttl: int = LLM_EVAL_CACHE_TTL):
+        super().__init__(ttl)
+        self.max_entries = max(1, max_entries)
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: List[str]) -> Dict[str, float]:
+        found = {}
+        now = time.monotonic()
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                score, expires_at = entry
+                if expires_at and expires_at <= now:
+                    del self._entries[key]
+                    continue
+                self._entries.move_to_end(key)
+                found[key] = score
+        self._record(hits=len(found), misses=len(keys) - len(found))
+        return found
+
+    def set_many(self, items: Iterable[Tuple[str, float]]):
+        expires_at = time.monotonic() + self.ttl if self.ttl else 0.0
+        written = 0
+        with self._lock:
+            for key, score in items:
+                self._entries[key] = (score, expires_at)
+                self._entries.move_to_end(key)
+                written += 1
+            evicted = len(self._entries) - self.max_entries
+            for _ in range(max(0, evicted)):
+                self._entries.popitem(last=False)
+            if evicted > 0:
+                self.evictions += evicted
+        self._record(writes=written)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def size(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        stats.update(max_entries=self.max_entries, evictions=self.evictions)
+        return stats
+
+
+class RedisLLMScoreCache(LLMScoreCache):
+    """
+    Redis 점수 캐시 (설정 서비스와 같은 Redis, 키마다 TTL로 만료)
+
+    Redis 오류는 캐시 실패로만 처리하고 평가는 계속 진행합니다.
+    """
+
+    backend_name = "redis"
+    blocking = True
+
+    def __init__(self, redis_client, ttl: int = LLM_EVAL_CACHE_TTL, key_prefix: str = REDIS_KEY_PREFIX):
+        super().__init__(ttl)
+        self.redis_client = redis_client
+        self.key_prefix = key_prefix
+
+    def get_many(self, keys: List[str]) -> Dict[str, float]:
+        if not keys:
+            return {}
+        try:
+            # 클러스터에서도 동작하도록 MGET 대신 파이프라인 GET
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key in keys:
+                pipe.get(self.key_prefix + key)
+            values = pipe.execute()
+        except Exception as e:
+            logger.warning("LLM score cache read failed: %s", str(e))
+            self._record(misses=len(keys), errors=1)
+            return {}
+
+        found = {key: float(value) for key, value in zip(keys, values) if value is not None}
+        self._record(hits=len(found), misses=len(keys) - len(found))
+        return found
+
+    def set_many(self, items: Iterable[Tuple[str, float]]):
+        items = list(items)
+        if not items:
+            return
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key, score in items:
+                pipe.set(self.key_prefix + key, repr(float(score)), ex=self.ttl or None)
+            pipe.execute()
+            self._record(writes=len(items))
+        except Exception as e:
+            logger.warning("LLM score cache write failed: %s", str(e))
+            self._record(errors=1)
+
+    def clear(self):
+        keys = list(self.redis_client.scan_iter(match=f"{self.key_prefix}*", count=1000))
+        for start in range(0, len(keys), 1000):
+            self.redis_client.unlink(*keys[start:start + 1000])
+
+
+_cache: Optional[LLMScoreCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_score_cache(config_composer=None) -> Optional[LLMScoreCache]:
+    """
+    LLM_EVAL_CACHE 설정에 맞는 점수 캐시 (처음 호출 때 생성, off면 None)
+
+    Args:
+        config_composer: auto/redis 모드에서 Redis 클라이언트를 가져올 설정 컴포저
+
+    Returns:
+        Optional[LLMScoreCache]: 점수 캐시
+    """
+    global _cache
+    if LLM_EVAL_CACHE == "off":
+        return None
+    if _cache is not None:
+        return _cache
+
+    with _cache_lock:
+        if _cache is None:
+            redis_client = getattr(getattr(config_composer, 'redis_manager', None), 'redis_client', None)
+            if LLM_EVAL_CACHE in ("auto", "redis") and redis_client is not None:
+                _cache = RedisLLMScoreCache(redis_client)
+            else:
+                if LLM_EVAL_CACHE == "redis":
+                    logger.warning("LLM_EVAL_CACHE=redis but config backend has no Redis client, using memory cache")
+                _cache = MemoryLLMScoreCache()
+            logger.info("LLM score cache: %s (ttl=%ds)", _cache.backend_name, _cache.ttl)
+    return _cache
+
+
+def reset_llm_score_cache(cache: Optional[LLMScoreCache] = None):
+    """사용할 캐시 교체 (None이면 다음 호출 때 설정에 따라 다시 생성)"""
+    global _cache
+    with _cache_lock:
+        _cache = cache
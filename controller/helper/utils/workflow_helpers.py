@@ -3,15 +3,44 @@
 """
 import os
 import json
+import time
+import asyncio
+import inspect
 import logging
-from typing import Dict, Any
+import threading
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Tuple, Optional, Callable, Iterable, Iterator
 
 from service.database.models.workflow import WorkflowMeta
 from service.database.models.deploy import DeployMeta
 from controller.workflow.helper import _workflow_parameter_helper, _default_workflow_parameter_helper
+from controller.helper.utils.workflow_manifest import WorkflowSyncManifest, content_hash
+from controller.helper.utils.workflow_metadata import extract_workflow_metadata
+from controller.helper.utils.auth_helpers import invalidate_workflow_share
 
 logger = logging.getLogger("workflow-helpers")
 
+# 워크플로우 파일 읽기/쓰기 스레드 수
+WORKFLOW_SYNC_IO_WORKERS = int(os.getenv('WORKFLOW_SYNC_IO_WORKERS', '8'))
+
+# 동기화 시 한 번에 조회하는 WorkflowMeta 최대 행 수
+# 전체 조회 결과가 이 수에 도달하면 잘렸을 수 있으므로 사용자별 조회로 전환
+WORKFLOW_SYNC_DB_LIMIT = 100000
+
+# 변경 계획을 DB에 반영할 때 한 트랜잭션에 묶는 행 수
+WORKFLOW_SYNC_BATCH_SIZE = int(os.getenv('WORKFLOW_SYNC_BATCH_SIZE', '500'))
+
+# 삽입/갱신 배치 하나가 메모리에 올리는 워크플로우 파일 크기 합 (바이트, 파일 하나가 더 크면 단독 배치)
+WORKFLOW_SYNC_BATCH_BYTES = int(os.getenv('WORKFLOW_SYNC_BATCH_BYTES', str(64 * 1024 * 1024)))
+
+# 동시에 동기화하는 사용자 수
+WORKFLOW_SYNC_USER_CONCURRENCY = int(os.getenv('WORKFLOW_SYNC_USER_CONCURRENCY', '4'))
+
+# downloads 폴더 안의 기본 매니페스트 파일 (숫자 폴더가 아니므로 사용자 폴더로 인식되지 않음)
+WORKFLOW_SYNC_MANIFEST_FILENAME = ".workflow_sync_manifest.json"
+
 # 기존 helper 함수들을 재 export
 async def workflow_parameter_helper(request_body, workflow_data):
     """워크플로우 파라미터를 설정합니다."""
@@ -21,231 +50,592 @@ async def default_workflow_parameter_helper(request, request_body, workflow_data
     """기본 워크플로우 파라미터를 설정합니다."""
     return await _default_workflow_parameter_helper(request, request_body, workflow_data)
 
-async def workflow_data_synchronizer(app_db) -> Dict[str, Any]:
+def _read_workflow_file(file_path: str) -> Tuple[Dict[str, Any], str, os.stat_result]:
+    """워크플로우 파일 읽기 (데이터, 내용 해시, 읽은 시점의 stat)"""
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+        stat = os.fstat(f.fileno())
+    return json.loads(raw), content_hash(raw), stat
+
+def _write_workflow_file(file_path: str, workflow_data: Any) -> Tuple[str, os.stat_result]:
+    """DB의 workflow_data로 워크플로우 파일 생성 (내용 해시, stat)"""
+    # workflow_data가 문자열인 경우 JSON 파싱
+    if isinstance(workflow_data, str):
+        workflow_data = json.loads(workflow_data)
+
+    raw = json.dumps(workflow_data, indent=2, ensure_ascii=False).encode('utf-8')
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, 'wb') as f:
+        f.write(raw)
+    return content_hash(raw), os.stat(file_path)
+
+def _scan_user_folder(user_downloads_path: str) -> Dict[str, Tuple[str, os.stat_result]]:
+    """사용자 폴더의 워크플로우 파일 목록 {workflow_name: (file_path, stat)}"""
+    files = {}
+    with os.scandir(user_downloads_path) as entries:
+        for entry in entries:
+            if entry.name.endswith('.json') and entry.is_file():
+                files[entry.name[:-5]] = (entry.path, entry.stat())  # .json 제거
+    return files
+
+def _map_in_order(executor: ThreadPoolExecutor, func: Callable, items: Iterable,
+                  window: int) -> Iterator[Tuple[Any, Any, Optional[Exception]]]:
     """
-    모든 사용자의 파일시스템과 WorkflowMeta DB 간의 데이터 동기화를 수행합니다.
+    items를 스레드 풀에서 처리하고 입력 순서대로 (item, 결과, 예외) 반환
 
-    Args:
-        app_db: 데이터베이스 매니저
+    동시에 제출하는 작업을 window개로 제한해 읽은 파일 내용이 한꺼번에 메모리에 쌓이지 않도록 합니다.
+    """
+    def run(item):
+        try:
+            return item, func(item), None
+        except Exception as e:
+            return item, None, e
+
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(run, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+def _batches(items: List[Any], batch_size: int) -> Iterator[List[Any]]:
+    for start in range(0, len(items), batch_size):
+        yield items[start:start + batch_size]
+
+def _sized_batches(entries: List[Dict[str, Any]], batch_size: int, max_bytes: int) -> Iterator[List[Dict[str, Any]]]:
+    """batch_size개 또는 파일 크기 합(entry["file_size"])이 max_bytes를 넘지 않는 배치로 나눔"""
+    batch, batch_bytes = [], 0
+    for entry in entries:
+        size = entry.get("file_size", 0)
+        if batch and (len(batch) >= batch_size or batch_bytes + size > max_bytes):
+            yield batch
+            batch, batch_bytes = [], 0
+        batch.append(entry)
+        batch_bytes += size
+    if batch:
+        yield batch
+
+class WorkflowSyncWriter:
+    """
+    동기화 변경 계획을 배치 단위로 DB에 반영
 
-    Returns:
-        Dict: 동기화 결과 정보
+    DB 매니저가 insert_many(models), delete_many(model_class, conditions), transaction()을 제공하면
+    배치마다 일괄 실행과 트랜잭션을 사용하고, 없으면 같은 배치를 기존 단건 메서드로 실행합니다.
+    배치가 실패하면 해당 배치만 실패로 기록하고 다음 배치를 계속 진행합니다.
+    여러 사용자를 동시에 동기화해도 DB 쓰기는 한 번에 한 배치씩 실행됩니다.
     """
-    downloads_path = os.path.join(os.getcwd(), "downloads")
 
-    sync_results = {
+    def __init__(self, app_db, batch_size: int = WORKFLOW_SYNC_BATCH_SIZE,
+                 batch_bytes: int = WORKFLOW_SYNC_BATCH_BYTES):
+        self.app_db = app_db
+        self.batch_size = max(1, batch_size)
+        self.batch_bytes = max(1, batch_bytes)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def transaction(self):
+        begin = getattr(self.app_db, 'transaction', None)
+        with self._lock, (begin() if callable(begin) else nullcontext()):
+            yield
+
+    def insert(self, workflow_metas: List[Any]):
+        """WorkflowMeta 일괄 삽입 (배치 하나)"""
+        with self.transaction():
+            insert_many = getattr(self.app_db, 'insert_many', None)
+            if callable(insert_many):
+                insert_many(workflow_metas)
+            else:
+                for workflow_meta in workflow_metas:
+                    self.app_db.insert(workflow_meta)
+
+    def update_workflow_data(self, updates: List[Tuple[Any, str]]):
+        """(id, workflow_data JSON) 목록 갱신 (배치 하나)"""
+        with self.transaction():
+            for workflow_id, workflow_data_json in updates:
+                self.app_db.update_list_columns(
+                    WorkflowMeta,
+                    {"workflow_data": workflow_data_json},
+                    {"id": workflow_id}
+                )
+
+    def delete(self, entries: List[Dict[str, Any]]):
+        """WorkflowMeta와 연결된 DeployMeta 일괄 삭제 (배치 하나)"""
+        deploy_conditions = [{"user_id": entry["user_id"], "workflow_id": entry["workflow_id"]} for entry in entries]
+        with self.transaction():
+            delete_many = getattr(self.app_db, 'delete_many', None)
+            if callable(delete_many):
+                delete_many(WorkflowMeta, [{"id": entry["id"]} for entry in entries])
+                delete_many(DeployMeta, deploy_conditions)
+            else:
+                for entry, condition in zip(entries, deploy_conditions):
+                    self.app_db.delete(WorkflowMeta, entry["id"])
+                    self.app_db.delete(DeployMeta, condition)
+
+    def load_workflow_data(self, workflow_meta_id: Any) -> Any:
+        """파일로 복원할 워크플로우 하나의 workflow_data 조회 (계획 단계에서는 보관하지 않음)"""
+        workflow = self.app_db.find_by_condition(
+            WorkflowMeta,
+            {"id": workflow_meta_id},
+            limit=1,
+            return_list=True
+        )
+        if not workflow or not workflow[0].get('workflow_data'):
+            raise ValueError("workflow_data no longer exists in database")
+        return workflow[0]['workflow_data']
+
+def _new_sync_results() -> Dict[str, Any]:
+    return {
         "files_added_to_db": 0,
         "files_created_from_db": 0,
         "orphaned_db_entries_removed": 0,
+        "files_skipped_unchanged": 0,
         "users_processed": 0,
         "errors": [],
-        "success": True
     }
 
-    try:
-        # 1. downloads 폴더의 사용자 폴더 스캔 (숫자로 된 폴더만)
-        user_folders = []
-        if os.path.exists(downloads_path):
-            for item in os.listdir(downloads_path):
-                item_path = os.path.join(downloads_path, item)
-                # 숫자로 된 폴더만 사용자 워크플로우 폴더로 인식
-                if os.path.isdir(item_path) and item.isdigit():
-                    user_folders.append(item)
-
-        # 2. 각 사용자별로 처리
-        for user_id in user_folders:
-            user_downloads_path = os.path.join(downloads_path, user_id)
-
-            # 해당 사용자의 파일시스템 워크플로우들 스캔
-            filesystem_workflows = {}
-            for filename in os.listdir(user_downloads_path):
-                if filename.endswith('.json'):
-                    workflow_name = filename[:-5]  # .json 제거
-                    file_path = os.path.join(user_downloads_path, filename)
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            workflow_data = json.load(f)
-                        filesystem_workflows[workflow_name] = workflow_data
-                    except (json.JSONDecodeError, FileNotFoundError, IOError) as e:
-                        sync_results["errors"].append(f"User {user_id}: Failed to read file {filename}: {str(e)}")
-
-            # 해당 사용자의 DB 워크플로우 데이터 조회
-            db_workflows = app_db.find_by_condition(
-                WorkflowMeta,
-                {"user_id": user_id},
-                limit=10000,
-                return_list=True
-            )
+def _merge_sync_results(sync_results: Dict[str, Any], user_results: Dict[str, Any]):
+    for name, value in user_results.items():
+        if name == "errors":
+            sync_results["errors"].extend(value)
+        else:
+            sync_results[name] += value
+
+def _list_user_folders(downloads_path: str) -> List[str]:
+    """downloads 폴더의 사용자 폴더 (숫자로 된 폴더만)"""
+    user_folders = []
+    if os.path.exists(downloads_path):
+        for item in os.listdir(downloads_path):
+            item_path = os.path.join(downloads_path, item)
+            # 숫자로 된 폴더만 사용자 워크플로우 폴더로 인식
+            if os.path.isdir(item_path) and item.isdigit():
+                user_folders.append(item)
+    return user_folders
+
+def _summarize_db_workflow(workflow: Dict[str, Any]) -> Dict[str, Any]:
+    """계획에 필요한 WorkflowMeta 필드만 남김 (workflow_data는 있는지 여부만)"""
+    return {
+        "id": workflow['id'],
+        "workflow_name": workflow['workflow_name'],
+        "workflow_id": workflow.get('workflow_id'),
+        "has_workflow_data": bool(workflow.get('workflow_data')),
+    }
 
-            db_workflow_dict = {workflow['workflow_name']: workflow for workflow in db_workflows}
-
-            # 3. 파일시스템에 존재하지만 DB에 없는 경우 처리
-            for workflow_name, workflow_data in filesystem_workflows.items():
-                if workflow_name not in db_workflow_dict:
-                    try:
-                        # 워크플로우 데이터에서 메타데이터 추출
-                        nodes = workflow_data.get('nodes', [])
-                        node_count = len(nodes) if isinstance(nodes, list) else 0
-                        has_startnode = any(
-                            node.get('data', {}).get('functionId') == 'startnode' for node in nodes
-                        )
-                        has_endnode = any(
-                            node.get('data', {}).get('functionId') == 'endnode' for node in nodes
-                        )
-
-                        edges = workflow_data.get('edges', [])
-                        edge_count = len(edges) if isinstance(edges, list) else 0
-
-                        # WorkflowMeta 객체 생성 및 DB에 삽입
-                        workflow_meta = WorkflowMeta(
-                            user_id=user_id,
-                            workflow_id=workflow_data.get('workflow_id', ''),
-                            workflow_name=workflow_name,
-                            node_count=node_count,
-                            edge_count=edge_count,
-                            has_startnode=has_startnode,
-                            has_endnode=has_endnode,
-                            is_completed=(has_startnode and has_endnode),
-                            workflow_data=workflow_data,
-                        )
-
-                        app_db.insert(workflow_meta)
-                        sync_results["files_added_to_db"] += 1
-                        logger.info("Added workflow '%s' to database from filesystem for user %s", workflow_name, user_id)
-
-                    except (IOError, ValueError) as e:
-                        sync_results["errors"].append(f"User {user_id}: Failed to add workflow '{workflow_name}' to DB: {str(e)}")
-
-            # 4. 파일시스템과 DB에 모두 존재하지만 DB에 workflow_data가 없는 경우 처리
-            for workflow_name, workflow_data in filesystem_workflows.items():
-                if workflow_name in db_workflow_dict:
-                    db_workflow = db_workflow_dict[workflow_name]
-                    if not db_workflow.get('workflow_data'):
-                        try:
-                            # DB에 workflow_data 업데이트 - JSON 문자열로 변환해서 저장
-                            workflow_data_json = json.dumps(workflow_data, ensure_ascii=False)
-                            app_db.update_list_columns(
-                                WorkflowMeta,
-                                {"workflow_data": workflow_data_json},
-                                {"id": db_workflow['id']}
-                            )
-                            sync_results["files_added_to_db"] += 1
-                            logger.info("Updated workflow_data for workflow '%s' in database for user %s", workflow_name, user_id)
-
-                        except (ValueError, RuntimeError) as e:
-                            sync_results["errors"].append(f"User {user_id}: Failed to update workflow_data for workflow '{workflow_name}': {str(e)}")
-
-            # 5. DB에 존재하지만 파일시스템에 없는 경우 처리
-            for workflow_name, db_workflow in db_workflow_dict.items():
-                if workflow_name not in filesystem_workflows:
-                    # workflow_data가 존재하는지 확인
-                    if db_workflow.get('workflow_data'):
-                        try:
-                            # 파일시스템에 파일 생성
-                            if not os.path.exists(user_downloads_path):
-                                os.makedirs(user_downloads_path)
-
-                            file_path = os.path.join(user_downloads_path, f"{workflow_name}.json")
-                            workflow_data = db_workflow['workflow_data']
-
-                            # workflow_data가 문자열인 경우 JSON 파싱
-                            if isinstance(workflow_data, str):
-                                workflow_data = json.loads(workflow_data)
-
-                            with open(file_path, 'w', encoding='utf-8') as f:
-                                json.dump(workflow_data, f, indent=2, ensure_ascii=False)
-
-                            sync_results["files_created_from_db"] += 1
-                            logger.info("Created file for workflow '%s' from database for user %s", workflow_name, user_id)
-
-                        except (IOError, json.JSONDecodeError, OSError) as e:
-                            sync_results["errors"].append(f"User {user_id}: Failed to create file for workflow '{workflow_name}': {str(e)}")
-                    else:
-                        # workflow_data가 없는 경우 DB에서 삭제
-                        try:
-                            app_db.delete(WorkflowMeta, db_workflow['id'])
-                            app_db.delete(DeployMeta, {"user_id": user_id, "workflow_id": db_workflow['workflow_id']})
-                            sync_results["orphaned_db_entries_removed"] += 1
-                            logger.info("Removed orphaned database entry for workflow '%s' for user %s", workflow_name, user_id)
+def _load_db_workflows(app_db) -> Tuple[Dict[str, Dict[str, Dict[str, Any]]], bool]:
+    """
+    전체 WorkflowMeta를 한 번 조회해서 사용자별로 그룹핑
 
-                        except (ValueError, RuntimeError) as e:
-                            sync_results["errors"].append(f"User {user_id}: Failed to remove orphaned DB entry for workflow '{workflow_name}': {str(e)}")
+    DB 매니저에 컬럼 선택 조회가 없어 조회 자체는 workflow_data를 포함하지만, 행마다 계획에 필요한 필드만
+    남기고 바로 버리므로 동기화 동안 전체 workflow_data를 메모리에 들고 있지 않습니다.
+    파일로 복원할 항목의 workflow_data만 반영할 때 다시 조회합니다.
 
-            sync_results["users_processed"] += 1
+    Returns:
+        ({user_id: {workflow_name: workflow}}, 조회 결과가 잘리지 않았는지)
+    """
+    all_db_workflows = app_db.find_by_condition(
+        WorkflowMeta,
+        {},
+        limit=WORKFLOW_SYNC_DB_LIMIT,
+        return_list=True
+    )
+    complete = len(all_db_workflows) < WORKFLOW_SYNC_DB_LIMIT
+    db_users: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for workflow in all_db_workflows:
+        db_users.setdefault(str(workflow['user_id']), {})[workflow['workflow_name']] = _summarize_db_workflow(workflow)
+    return db_users, complete
+
+def _load_user_db_workflows(app_db, user_id: str) -> Dict[str, Dict[str, Any]]:
+    """
+    사용자 한 명의 WorkflowMeta 조회 (전체 조회 결과가 잘렸을 때 사용)
 
-        # 3. DB에만 존재하는 사용자들의 워크플로우도 처리
-        all_db_workflows = app_db.find_by_condition(
-            WorkflowMeta,
-            {},
-            limit=100000,
-            return_list=True
-        )
+    조회 결과도 잘렸으면 DB에 있는 워크플로우를 없는 것으로 보고 중복 삽입하지 않도록 ValueError
+    """
+    db_workflows = app_db.find_by_condition(
+        WorkflowMeta,
+        {"user_id": user_id},
+        limit=WORKFLOW_SYNC_DB_LIMIT,
+        return_list=True
+    )
+    if len(db_workflows) >= WORKFLOW_SYNC_DB_LIMIT:
+        raise ValueError(f"more than {WORKFLOW_SYNC_DB_LIMIT} workflows in database, skipping user")
+    return {workflow['workflow_name']: _summarize_db_workflow(workflow) for workflow in db_workflows}
+
+def _build_user_sync_plan(user_id: str, user_downloads_path: str, has_folder: bool,
+                          db_workflow_dict: Dict[str, Dict[str, Any]],
+                          manifest: Optional[WorkflowSyncManifest], executor: ThreadPoolExecutor, window: int,
+                          sync_results: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    사용자 한 명의 파일시스템과 DB를 비교해 변경 계획 생성 (DB와 파일은 수정하지 않음)
 
-        # 사용자별로 그룹핑
-        db_users = {}
-        for workflow in all_db_workflows:
-            user_id = str(workflow['user_id'])
-            if user_id not in db_users:
-                db_users[user_id] = []
-            db_users[user_id].append(workflow)
-
-        # 파일시스템에 없는 사용자들 처리
-        for user_id, workflows in db_users.items():
-            if user_id not in user_folders:
-                user_downloads_path = os.path.join(downloads_path, user_id)
-
-                for workflow in workflows:
-                    workflow_name = workflow['workflow_name']
-                    if workflow.get('workflow_data'):
-                        try:
-                            # 사용자 폴더 생성
-                            if not os.path.exists(user_downloads_path):
-                                os.makedirs(user_downloads_path)
-
-                            file_path = os.path.join(user_downloads_path, f"{workflow_name}.json")
-                            workflow_data = workflow['workflow_data']
-
-                            # workflow_data가 문자열인 경우 JSON 파싱
-                            if isinstance(workflow_data, str):
-                                workflow_data = json.loads(workflow_data)
-
-                            with open(file_path, 'w', encoding='utf-8') as f:
-                                json.dump(workflow_data, f, indent=2, ensure_ascii=False)
-
-                            sync_results["files_created_from_db"] += 1
-                            logger.info("Created file for workflow '%s' from database for user %s", workflow_name, user_id)
-
-                        except (IOError, json.JSONDecodeError, OSError) as e:
-                            sync_results["errors"].append(f"User {user_id}: Failed to create file for workflow '{workflow_name}': {str(e)}")
-                    else:
-                        # workflow_data가 없는 경우 DB에서 삭제
-                        try:
-                            app_db.delete(WorkflowMeta, workflow['id'])
-                            app_db.delete(DeployMeta, {"user_id": user_id, "workflow_id": workflow['workflow_id']})
-                            sync_results["orphaned_db_entries_removed"] += 1
-                            logger.info("Removed orphaned database entry for workflow '%s' for user %s", workflow_name, user_id)
+    Returns:
+        Dict: {"inserts", "updates", "restores", "deletes"} 항목 리스트
+              inserts/updates는 파일 경로와 크기, 읽은 시점의 내용 해시, 메타데이터를 가지며
+              실제 workflow_data는 반영할 때 다시 읽습니다 (계획이 파일 내용을 들고 있지 않도록).
+    """
+    plan = {"inserts": [], "updates": [], "restores": [], "deletes": [], "seen_keys": []}
+
+    filesystem_workflows = _scan_user_folder(user_downloads_path) if has_folder else {}
+
+    # 읽어야 하는 파일 선택 (DB에 없거나 DB에 workflow_data가 없거나 지난 동기화 이후 바뀐 파일)
+    to_read = []
+    for workflow_name, (file_path, stat) in filesystem_workflows.items():
+        key = f"{user_id}/{workflow_name}.json"
+        plan["seen_keys"].append(key)
+        db_workflow = db_workflow_dict.get(workflow_name)
+        needs_data = db_workflow is None or not db_workflow['has_workflow_data']
+        if not needs_data and manifest is not None and manifest.unchanged(key, stat):
+            sync_results["files_skipped_unchanged"] += 1
+            continue
+        to_read.append((workflow_name, key, file_path))
+
+    # 계획 단계에서는 파일을 스트리밍으로 읽어 메타데이터와 해시만 계산 (전체 파싱은 DB 반영 시에만)
+    for (workflow_name, key, file_path), result, error in _map_in_order(
+            executor, lambda item: extract_workflow_metadata(item[2]), to_read, window):
+        if error is not None:
+            sync_results["errors"].append(f"User {user_id}: Failed to read file {workflow_name}.json: {str(error)}")
+            continue
+
+        metadata, sha256, stat = result
+        if manifest is not None:
+            manifest.record(key, stat, sha256)
+
+        entry = {"user_id": user_id, "workflow_name": workflow_name, "file_path": file_path,
+                 "file_size": stat.st_size, "sha256": sha256}
+        db_workflow = db_workflow_dict.get(workflow_name)
+        if db_workflow is None:
+            # 파일시스템에 존재하지만 DB에 없는 경우
+            entry.update(metadata)
+            plan["inserts"].append(entry)
+        elif not db_workflow['has_workflow_data']:
+            # 파일시스템과 DB에 모두 존재하지만 DB에 workflow_data가 없는 경우
+            entry["id"] = db_workflow['id']
+            plan["updates"].append(entry)
+
+    # DB에만 있는 워크플로우: workflow_data가 있으면 파일 복원, 없으면 DB에서 삭제
+    for workflow_name, db_workflow in db_workflow_dict.items():
+        if workflow_name in filesystem_workflows:
+            continue
+        entry = {
+            "user_id": user_id,
+            "workflow_name": db_workflow['workflow_name'],
+            "workflow_id": db_workflow.get('workflow_id'),
+            "id": db_workflow['id'],
+        }
+        if db_workflow['has_workflow_data']:
+            entry["file_path"] = os.path.join(user_downloads_path, f"{db_workflow['workflow_name']}.json")
+            plan["restores"].append(entry)
+        else:
+            plan["deletes"].append(entry)
+
+    return plan
+
+def _read_planned_file(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """계획 시점 이후 파일이 바뀌었으면 ValueError (다음 동기화에서 다시 계획)"""
+    workflow_data, sha256, _ = _read_workflow_file(entry["file_path"])
+    if sha256 != entry["sha256"]:
+        raise ValueError("file changed during synchronization")
+    return workflow_data
+
+def _apply_sync_plan(plan: Dict[str, List[Dict[str, Any]]], writer: WorkflowSyncWriter,
+                     manifest: Optional[WorkflowSyncManifest],
+                     executor: ThreadPoolExecutor, window: int, sync_results: Dict[str, Any]):
+    """변경 계획을 배치 단위로 DB와 파일시스템에 반영"""
+
+    def failed(entries: List[Dict[str, Any]], action: str, error: Exception):
+        for entry in entries:
+            sync_results["errors"].append(f"User {entry['user_id']}: Failed to {action} for workflow '{entry['workflow_name']}': {str(error)}")
+
+    # 1. 파일시스템에 존재하지만 DB에 없는 워크플로우 삽입
+    # 배치의 workflow_data는 삽입할 때까지 메모리에 있으므로 배치를 파일 크기 합으로도 제한
+    for batch in _sized_batches(plan["inserts"], writer.batch_size, writer.batch_bytes):
+        workflow_metas, inserted = [], []
+        for entry, workflow_data, error in _map_in_order(executor, _read_planned_file, batch, window):
+            if error is not None:
+                failed([entry], "add workflow to DB", error)
+                continue
+            metadata = {name: entry[name] for name in ("node_count", "edge_count", "has_startnode", "has_endnode")}
+            # WorkflowMeta 객체 생성
+            workflow_metas.append(WorkflowMeta(
+                user_id=entry["user_id"],
+                workflow_id=entry["workflow_id"],
+                workflow_name=entry["workflow_name"],
+                **metadata,
+                is_completed=(metadata["has_startnode"] and metadata["has_endnode"]),
+                workflow_data=workflow_data,
+            ))
+            inserted.append(entry)
+        if not workflow_metas:
+            continue
+        try:
+            writer.insert(workflow_metas)
+            sync_results["files_added_to_db"] += len(inserted)
+            logger.info("Added %d workflows to database from filesystem", len(inserted))
+        except (IOError, ValueError, RuntimeError) as e:
+            failed(inserted, "add workflow to DB", e)
+
+    # 2. DB에 workflow_data가 없는 워크플로우 갱신 - JSON 문자열로 변환해서 저장
+    for batch in _sized_batches(plan["updates"], writer.batch_size, writer.batch_bytes):
+        updates, updated = [], []
+        for entry, workflow_data, error in _map_in_order(executor, _read_planned_file, batch, window):
+            if error is not None:
+                failed([entry], "update workflow_data", error)
+                continue
+            updates.append((entry["id"], json.dumps(workflow_data, ensure_ascii=False)))
+            updated.append(entry)
+        if not updates:
+            continue
+        try:
+            writer.update_workflow_data(updates)
+            sync_results["files_added_to_db"] += len(updated)
+            logger.info("Updated workflow_data for %d workflows in database", len(updated))
+        except (ValueError, RuntimeError) as e:
+            failed(updated, "update workflow_data", e)
+
+    # 3. DB에만 있는 워크플로우 파일 생성 (복원할 항목의 workflow_data만 조회)
+    write = lambda entry: _write_workflow_file(entry["file_path"], writer.load_workflow_data(entry["id"]))
+    for entry, result, error in _map_in_order(executor, write, plan["restores"], window):
+        if error is not None:
+            failed([entry], "create file", error)
+            continue
+
+        key = f"{entry['user_id']}/{entry['workflow_name']}.json"
+        plan["seen_keys"].append(key)
+        if manifest is not None:
+            sha256, stat = result
+            manifest.record(key, stat, sha256)
+        sync_results["files_created_from_db"] += 1
+        logger.info("Created file for workflow '%s' from database for user %s", entry['workflow_name'], entry['user_id'])
+
+    # 4. workflow_data가 없는 고아 DB 항목 삭제
+    for batch in _batches(plan["deletes"], writer.batch_size):
+        try:
+            writer.delete(batch)
+            sync_results["orphaned_db_entries_removed"] += len(batch)
+            logger.info("Removed %d orphaned database entries", len(batch))
+        except (ValueError, RuntimeError) as e:
+            failed(batch, "remove orphaned DB entry", e)
+
+def describe_sync_plan(plan: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """dry_run 결과용 계획 요약 (항목별 대상 목록)"""
+    return {
+        action: [{name: value for name, value in entry.items() if name != "file_path"} for entry in plan[action]]
+        for action in ("inserts", "updates", "restores", "deletes")
+    }
+
+def _sync_user(user_id: str, downloads_path: str, has_folder: bool, db_workflow_dict: Dict[str, Dict[str, Any]],
+               manifest: Optional[WorkflowSyncManifest], writer: Optional[WorkflowSyncWriter],
+               executor: ThreadPoolExecutor, window: int) -> Tuple[Dict[str, Any], Dict[str, List[Dict[str, Any]]]]:
+    """사용자 한 명의 계획 생성과 반영 (워커 스레드에서 실행, writer가 None이면 계획만 생성)"""
+    sync_results = _new_sync_results()
+    user_downloads_path = os.path.join(downloads_path, user_id)
+    plan = _build_user_sync_plan(user_id, user_downloads_path, has_folder, db_workflow_dict,
+                                 manifest, executor, window, sync_results)
+    if writer is not None:
+        _apply_sync_plan(plan, writer, manifest, executor, window, sync_results)
+        # 추가/삭제된 워크플로우의 공유 권한 캐시가 남지 않도록 무효화
+        invalidate_workflow_share(user_id)
+    sync_results["users_processed"] = 1
+    return sync_results, plan
+
+# 마지막(또는 실행 중인) 동기화 진행 상황과 백그라운드 작업
+_sync_progress: Dict[str, Any] = {"state": "idle"}
+_sync_task: Optional[asyncio.Task] = None
+
+def get_workflow_sync_progress() -> Dict[str, Any]:
+    """마지막(또는 실행 중인) 워크플로우 동기화 진행 상황"""
+    return dict(_sync_progress)
+
+def start_workflow_sync_task(app_db, **kwargs) -> asyncio.Task:
+    """
+    워크플로우 동기화를 백그라운드 작업으로 시작 (이미 실행 중이면 기존 작업 반환)
+
+    Args:
+        app_db: 데이터베이스 매니저
+        **kwargs: workflow_data_synchronizer 인자
+
+    Example:
+        >>> task = start_workflow_sync_task(app_db)
+        >>> get_workflow_sync_progress()
+        {'state': 'running', 'users_total': 12, 'users_done': 3, ...}
+    """
+    global _sync_task
+    if _sync_task is None or _sync_task.done():
+        _sync_task = asyncio.get_running_loop().create_task(workflow_data_synchronizer(app_db, **kwargs))
+    return _sync_task
+
+async def _report_progress(progress_callback: Optional[Callable[[Dict[str, Any]], Any]], progress: Dict[str, Any]):
+    _sync_progress.clear()
+    _sync_progress.update(progress)
+    if progress_callback is None:
+        return
+    try:
+        result = progress_callback(dict(progress))
+        if inspect.isawaitable(result):
+            await result
+    except Exception as e:
+        logger.warning("Workflow sync progress callback failed: %s", str(e))
+
+async def workflow_data_synchronizer(app_db, incremental: bool = True,
+                                     manifest_path: Optional[str] = None,
+                                     max_workers: Optional[int] = None,
+                                     batch_size: Optional[int] = None,
+                                     dry_run: bool = False,
+                                     user_concurrency: Optional[int] = None,
+                                     progress_callback: Optional[Callable[[Dict[str, Any]], Any]] = None) -> Dict[str, Any]:
+    """
+    모든 사용자의 파일시스템과 WorkflowMeta DB 간의 데이터 동기화를 수행합니다.
 
-                        except (ValueError, RuntimeError) as e:
-                            sync_results["errors"].append(f"User {user_id}: Failed to remove orphaned DB entry for workflow '{workflow_name}': {str(e)}")
+    사용자별로 변경 계획(삽입, 갱신, 파일 복원, 삭제)을 만든 뒤 batch_size 단위 트랜잭션으로 반영합니다.
+    파일과 DB 작업은 모두 워커 스레드에서 실행되므로 이벤트 루프를 막지 않으며,
+    최대 user_concurrency명의 사용자를 동시에 처리합니다 (DB 쓰기는 한 번에 한 배치씩).
+    incremental 모드에서는 매니페스트(경로, mtime, 크기, 내용 해시)와 비교해
+    지난 동기화 이후 바뀌지 않았고 DB에도 데이터가 있는 파일은 읽지 않습니다.
 
-                if user_id not in user_folders:
-                    sync_results["users_processed"] += 1
+    Args:
+        app_db: 데이터베이스 매니저
+        incremental: 매니페스트로 바뀌지 않은 파일 건너뛰기 (False면 모든 파일을 읽음)
+        manifest_path: 매니페스트 경로 (기본값: WORKFLOW_SYNC_MANIFEST_PATH 또는 downloads/.workflow_sync_manifest.json)
+        max_workers: 파일 I/O 스레드 수 (기본값: WORKFLOW_SYNC_IO_WORKERS)
+        batch_size: 한 트랜잭션에 반영할 행 수 (기본값: WORKFLOW_SYNC_BATCH_SIZE, 삽입/갱신은 WORKFLOW_SYNC_BATCH_BYTES로도 제한)
+        dry_run: True면 DB, 파일, 매니페스트를 수정하지 않고 계획만 반환 (결과의 "plan")
+        user_concurrency: 동시에 처리할 사용자 수 (기본값: WORKFLOW_SYNC_USER_CONCURRENCY)
+        progress_callback: 진행 상황 dict를 받는 함수 또는 코루틴 함수
+                           (시작, 사용자 한 명 완료, 종료 시 호출, get_workflow_sync_progress와 같은 형식)
+
+    Returns:
+        Dict: 동기화 결과 정보
+    """
+    downloads_path = os.path.join(os.getcwd(), "downloads")
 
-        # 4. 결과 검증
+    sync_results = _new_sync_results()
+    sync_results["success"] = True
+
+    progress = {
+        "state": "running",
+        "dry_run": dry_run,
+        "started_at": time.time(),
+        "finished_at": None,
+        "users_total": 0,
+        "users_done": 0,
+        **_new_sync_results(),
+        "errors": 0,
+    }
+
+    def update_progress(user_results: Dict[str, Any]):
+        progress["users_done"] += 1
+        for name, value in user_results.items():
+            progress[name] += len(value) if name == "errors" else value
+
+    executor = None
+    # 스레드에서 실행 중인 사용자 동기화 (취소되어도 끝날 때까지 기다린 뒤 스레드 풀 종료)
+    in_flight = set()
+    try:
+        manifest = None
+        if incremental:
+            manifest = await asyncio.to_thread(
+                WorkflowSyncManifest,
+                manifest_path
+                or os.getenv('WORKFLOW_SYNC_MANIFEST_PATH')
+                or os.path.join(downloads_path, WORKFLOW_SYNC_MANIFEST_FILENAME)
+            )
+
+        # DB 워크플로우는 한 번만 조회해서 사용자별로 그룹핑
+        # (결과가 잘렸으면 각 사용자의 DB 항목은 처리할 때 사용자별로 다시 조회)
+        db_users, db_complete = await asyncio.to_thread(_load_db_workflows, app_db)
+        if not db_complete:
+            logger.warning("WorkflowMeta table has %d+ rows, loading database workflows per user", WORKFLOW_SYNC_DB_LIMIT)
+
+        # 폴더가 있는 사용자 먼저, 그다음 DB에만 존재하는 사용자
+        user_folders = await asyncio.to_thread(_list_user_folders, downloads_path)
+        users = [(user_id, True) for user_id in user_folders]
+        users.extend((user_id, False) for user_id in db_users if user_id not in user_folders)
+        progress["users_total"] = len(users)
+        await _report_progress(progress_callback, progress)
+
+        workers = max_workers or WORKFLOW_SYNC_IO_WORKERS
+        window = workers * 4
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="workflow-sync")
+        writer = None if dry_run else WorkflowSyncWriter(app_db, batch_size or WORKFLOW_SYNC_BATCH_SIZE)
+        semaphore = asyncio.Semaphore(max(1, user_concurrency or WORKFLOW_SYNC_USER_CONCURRENCY))
+
+        async def sync_user(user_id: str, has_folder: bool):
+            async with semaphore:
+                try:
+                    if db_complete:
+                        db_workflow_dict = db_users.get(user_id, {})
+                    else:
+                        db_workflow_dict = await asyncio.to_thread(_load_user_db_workflows, app_db, user_id)
+                    thread_task = asyncio.ensure_future(asyncio.to_thread(
+                        _sync_user, user_id, downloads_path, has_folder, db_workflow_dict,
+                        manifest, writer, executor, window
+                    ))
+                    in_flight.add(thread_task)
+                    thread_task.add_done_callback(in_flight.discard)
+                    user_results, plan = await asyncio.shield(thread_task)
+                except Exception as e:
+                    user_results, plan = _new_sync_results(), None
+                    user_results["errors"].append(f"User {user_id}: Synchronization failed: {str(e)}")
+            update_progress(user_results)
+            await _report_progress(progress_callback, progress)
+            return user_results, plan
+
+        user_syncs = await asyncio.gather(*(sync_user(user_id, has_folder) for user_id, has_folder in users))
+
+        plans = []
+        for user_results, plan in user_syncs:
+            _merge_sync_results(sync_results, user_results)
+            if plan is not None:
+                plans.append(plan)
+
+        if dry_run:
+            sync_results["dry_run"] = True
+            sync_results["plan"] = {action: [] for action in ("inserts", "updates", "restores", "deletes")}
+            for plan in plans:
+                for action, entries in describe_sync_plan(plan).items():
+                    sync_results["plan"][action].extend(entries)
+
+        if manifest is not None and not dry_run:
+            manifest.prune(key for plan in plans for key in plan["seen_keys"])
+            await asyncio.to_thread(manifest.save)
+
+        # 결과 검증
         if sync_results["errors"]:
             sync_results["success"] = False
 
-        logger.info("Workflow synchronization completed: Added %d to DB, Created %d files, Removed %d orphaned entries, Processed %d users, Errors: %d",
+        logger.info("Workflow synchronization completed%s: Added %d to DB, Created %d files, Removed %d orphaned entries, Skipped %d unchanged files, Processed %d users, Errors: %d",
+                   " (dry run)" if dry_run else "",
                    sync_results['files_added_to_db'],
                    sync_results['files_created_from_db'],
                    sync_results['orphaned_db_entries_removed'],
+                   sync_results['files_skipped_unchanged'],
                    sync_results['users_processed'],
                    len(sync_results['errors']))
 
+        progress["state"] = "completed"
         return sync_results
 
-    except (OSError, RuntimeError, ValueError) as e:
+    except Exception as e:
         sync_results["success"] = False
         sync_results["errors"].append(f"Synchronization failed: {str(e)}")
         logger.error("Workflow synchronization failed: %s", str(e))
+        progress["state"] = "failed"
+        progress["errors"] = len(sync_results["errors"])
         return sync_results
+
+    except asyncio.CancelledError:
+        # 이미 스레드에서 실행 중인 사용자는 끝까지 처리되고 새 사용자는 시작하지 않음
+        progress["state"] = "cancelled"
+        raise
+
+    finally:
+        if in_flight:
+            # 실행 중인 사용자가 파일 I/O 스레드 풀을 계속 쓰므로 끝난 뒤에 종료 (중간에 멈추면 계획 일부만 반영됨)
+            pending = list(in_flight)
+            await asyncio.wait(pending)
+            for thread_task in pending:
+                if not thread_task.cancelled() and thread_task.exception() is not None:
+                    logger.warning("Workflow sync for a user failed after cancellation: %s", str(thread_task.exception()))
+        if executor is not None:
+            executor.shutdown(wait=False)
+        progress["finished_at"] = time.time()
+        await _report_progress(progress_callback, progress)
@@ -0,0 +1,103 @@
+"""
+워크플로우 동기화 매니페스트
+
+동기화 때 확인한 워크플로우 파일의 (경로, mtime, 크기, 내용 해시)를 저장해
+다음 동기화에서 바뀌지 않은 파일은 읽지 않고 건너뛸 수 있게 합니다.
+"""
+import os
+import json
+import hashlib
+import logging
+import threading
+from typing import Dict, Any, Optional, Iterable
+
+logger = logging.getLogger("workflow-manifest")
+
+MANIFEST_VERSION = 1
+
+
+def content_hash(data: bytes) -> str:
+    """워크플로우 파일 내용 해시 (sha256)"""
+    return hashlib.sha256(data).hexdigest()
+
+
+class WorkflowSyncManifest:
+    """
+    워크플로우 파일 매니페스트
+
+    키는 downloads 기준 상대 경로("<user_id>/<workflow_name>.json")이며,
+    값은 {"mtime_ns", "size", "sha256"}와 파일에서 읽은 메타데이터입니다.
+
+    Example:
+        >>> manifest = WorkflowSyncManifest("downloads/.workflow_sync_manifest.json")
+        >>> if not manifest.unchanged("1/my_flow.json", os.stat(path)):
+        ...     manifest.record("1/my_flow.json", os.stat(path), sha256)
+        >>> manifest.save()
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.load()
+
+    def load(self):
+        """저장된 매니페스트 읽기 (없거나 손상되었으면 빈 매니페스트로 시작)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                document = json.load(f)
+            if document.get('version') == MANIFEST_VERSION:
+                self._entries = document.get('files', {})
+        except FileNotFoundError:
+            self._entries = {}
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable workflow sync manifest %s: %s", self.path, str(e))
+            self._entries = {}
+
+    def save(self):
+        """변경된 경우에만 임시 파일에 쓴 뒤 교체 (중간에 실패해도 이전 매니페스트 유지)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            document = {'version': MANIFEST_VERSION, 'files': self._entries}
+            self._dirty = False
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(document, f, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._entries.get(key)
+
+    def unchanged(self, key: str, stat: os.stat_result) -> bool:
+        """마지막 동기화 이후 mtime과 크기가 그대로인지 확인"""
+        entry = self._entries.get(key)
+        return (entry is not None
+                and entry.get('mtime_ns') == stat.st_mtime_ns
+                and entry.get('size') == stat.st_size)
+
+    def record(self, key: str, stat: os.stat_result, sha256: str, **metadata):
+        """파일 상태 기록"""
+        entry = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': sha256, **metadata}
+        with self._lock:
+            if self._entries.get(key) != entry:
+                self._entries[key] = entry
+                self._dirty = True
+
+    def prune(self, keys: Iterable[str]):
+        """keys에 없는 항목(삭제된 파일) 제거"""
+        keep = set(keys)
+        with self._lock:
+            removed = [key for key in self._entries if key not in keep]
+            for key in removed:
+                del self._entries[key]
+            if removed:
+                self._dirty = True
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,235 @@
+"""
+워크플로우 메타데이터 스트리밍 추출
+
+워크플로우 JSON 파일 전체를 dict로 만들지 않고 일정 크기씩 읽으면서
+workflow_id, node_count, edge_count, has_startnode, has_endnode와 내용 해시를 계산합니다.
+nodes 배열은 원소 하나씩 디코딩하고 나머지 값은 객체를 만들지 않고 건너뛰므로
+메모리 사용량은 파일 크기가 아니라 가장 큰 노드 하나와 읽기 단위(chunk_size)로 제한됩니다.
+"""
+import os
+import re
+import json
+import codecs
+import hashlib
+from typing import Dict, Any, Tuple, BinaryIO
+
+# 한 번에 읽는 바이트 수
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+# 값을 건너뛸 때 의미 있는 문자 (문자열 시작, 괄호)
+_STRUCTURAL = re.compile(r'["\[\]{}]')
+# 문자열 끝 따옴표 (이스케이프되지 않은 ")
+_STRING_END = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+# 숫자/리터럴 토큰 (구분자 전까지)
+_SCALAR = re.compile(r'[^,:\]}\s]*')
+
+_decoder = json.JSONDecoder()
+
+
+class _JsonStream:
+    """파일을 chunk_size 단위로 읽으며 최상위 JSON 구조를 순서대로 읽는 스트림"""
+
+    def __init__(self, f: BinaryIO, chunk_size: int):
+        self._f = f
+        self._chunk_size = chunk_size
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._hasher = hashlib.sha256()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    @property
+    def sha256(self) -> str:
+        return self._hasher.hexdigest()
+
+    def _fill(self) -> bool:
+        """다음 chunk를 버퍼에 추가 (이미 처리한 앞부분은 버림, 더 읽을 내용이 없으면 False)"""
+        if self._eof:
+            return False
+        raw = self._f.read(self._chunk_size)
+        self._hasher.update(raw)
+        if not raw:
+            self._eof = True
+            text = self._text_decoder.decode(b"", final=True)
+        else:
+            text = self._text_decoder.decode(raw)
+        self._buffer = self._buffer[self._pos:] + text
+        self._pos = 0
+        return bool(raw) or bool(text)
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._pos)
+
+    def peek(self) -> str:
+        """공백을 건너뛴 다음 문자 (파일 끝이면 빈 문자열)"""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise self._error(f"Expecting one of {chars!r}")
+        self._pos += 1
+        return char
+
+    def read_value(self) -> Any:
+        """다음 JSON 값 하나를 디코딩"""
+        if self.peek() not in '{["':
+            # 숫자나 리터럴은 버퍼 끝에서 잘려도 앞부분만으로 디코딩되므로 구분자까지 읽어 둠
+            while _SCALAR.match(self._buffer, self._pos).end() == len(self._buffer) and self._fill():
+                pass
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            self._pos = end
+            return value
+
+    def skip_value(self):
+        """다음 JSON 값을 객체로 만들지 않고 건너뜀"""
+        char = self.peek()
+        if char not in '{["':
+            self.read_value()
+            return
+
+        depth = 0
+        while True:
+            match = _STRUCTURAL.search(self._buffer, self._pos)
+            if match is None:
+                self._pos = len(self._buffer)
+                if not self._fill():
+                    raise self._error("Unterminated value")
+                continue
+
+            self._pos = match.end()
+            char = match.group()
+            if char == '"':
+                self._skip_string()
+            elif char in '{[':
+                depth += 1
+            else:
+                depth -= 1
+            if depth == 0:
+                return
+
+    def _skip_string(self):
+        while True:
+            # 버퍼 끝에서 이스케이프가 잘리면 일치하지 않으므로 다음 chunk와 이어서 다시 확인
+            match = _STRING_END.match(self._buffer, self._pos)
+            if match is not None:
+                self._pos = match.end()
+                return
+            if not self._fill():
+                raise self._error("Unterminated string")
+
+    def iter_array(self):
+        """배열 원소 위치마다 한 번씩 반환 (호출자가 read_value/skip_value로 원소를 소비)"""
+        self.expect('[')
+        if self.peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield
+            if self.expect(',]') == ']':
+                return
+
+    def expect_end(self):
+        if self.peek():
+            raise self._error("Extra data")
+
+
+def _node_function_id(node: Any) -> Any:
+    if not isinstance(node, dict):
+        return None
+    data = node.get('data', {})
+    return data.get('functionId') if isinstance(data, dict) else None
+
+
+def extract_workflow_metadata(file_path: str,
+                              chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[Dict[str, Any], str, os.stat_result]:
+    """
+    워크플로우 파일을 스트리밍으로 읽어 메타데이터 추출
+
+    파일 전체가 올바른 JSON인지도 함께 확인합니다 (json.load와 같은 JSONDecodeError).
+
+    Args:
+        file_path: 워크플로우 JSON 파일 경로
+        chunk_size: 한 번에 읽는 바이트 수
+
+    Returns:
+        (메타데이터, 내용 sha256, 읽은 시점의 stat)
+        메타데이터: {"workflow_id", "node_count", "edge_count", "has_startnode", "has_endnode"}
+
+    Example:
+        >>> metadata, sha256, stat = extract_workflow_metadata("downloads/1/my_flow.json")
+        >>> metadata["node_count"]
+        12
+    """
+    metadata = {
+        "workflow_id": '',
+        "node_count": 0,
+        "edge_count": 0,
+        "has_startnode": False,
+        "has_endnode": False,
+    }
+
+    with open(file_path, 'rb') as f:
+        stream = _JsonStream(f, chunk_size)
+        top_level_object = stream.peek() == '{'
+
+        if not top_level_object:
+            stream.skip_value()
+        else:
+            stream.expect('{')
+            if stream.peek() == '}':
+                stream.expect('}')
+            else:
+                while True:
+                    key = stream.read_value()
+                    if not isinstance(key, str):
+                        raise stream._error("Expecting property name")
+                    stream.expect(':')
+
+                    if key == 'nodes' and stream.peek() == '[':
+                        node_count, has_startnode, has_endnode = 0, False, False
+                        for _ in stream.iter_array():
+                            function_id = _node_function_id(stream.read_value())
+                            node_count += 1
+                            has_startnode = has_startnode or function_id == 'startnode'
+                            has_endnode = has_endnode or function_id == 'endnode'
+                        metadata.update(node_count=node_count, has_startnode=has_startnode, has_endnode=has_endnode)
+                    elif key == 'nodes':
+                        stream.skip_value()
+                        metadata.update(node_count=0, has_startnode=False, has_endnode=False)
+                    elif key == 'edges' and stream.peek() == '[':
+                        edge_count = 0
+                        for _ in stream.iter_array():
+                            stream.skip_value()
+                            edge_count += 1
+                        metadata["edge_count"] = edge_count
+                    elif key == 'edges':
+                        stream.skip_value()
+                        metadata["edge_count"] = 0
+                    elif key == 'workflow_id':
+                        metadata["workflow_id"] = stream.read_value()
+                    else:
+                        stream.skip_value()
+
+                    if stream.expect(',}') == '}':
+                        break
+
+        stream.expect_end()
+        stat = os.fstat(f.fileno())
+
+    if not top_level_object:
+        raise json.JSONDecodeError("Workflow file must contain a JSON object", "", 0)
+
+    return metadata, stream.sha256, stat
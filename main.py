@@ -10,6 +10,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
 from dotenv import load_dotenv
 
@@ -17,8 +18,10 @@ from dotenv import load_dotenv
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from config.config_composer import ConfigComposer
-from service.redis_config_manager import RedisConfigManager
+from service.config_backend import create_config_manager
+from service.metrics import metrics_registry, PROMETHEUS_CONTENT_TYPE
 from controller.appController import router as app_router
+from controller.helper.snapshotMiddleware import ConfigSnapshotMiddleware
 
 # 로깅 설정
 logging.basicConfig(
@@ -36,14 +39,18 @@ async def lifespan(app: FastAPI):
     logger.info("XgenConfig 애플리케이션 시작 중...")
 
     try:
-        # Redis Config Manager 초기화
-        redis_manager = RedisConfigManager()
+        # 설정 저장소 백엔드 초기화 (CONFIG_BACKEND: redis, memory, sqlite, shared)
+        redis_manager = create_config_manager()
         app.state.redis_manager = redis_manager
-        logger.info("Redis Config Manager 초기화 완료")
+        logger.info(f"Config Manager 초기화 완료 (backend: {redis_manager.backend_name})")
 
         # Config Composer 초기화 (모든 설정 자동 로드)
-        config_composer = ConfigComposer(redis_manager=redis_manager)
+        # 로컬 스냅샷(CONFIG_LOCAL_SNAPSHOT_PATH)은 start()로 원본 백엔드와 맞추는 이 컴포저에서만 사용
+        config_composer = ConfigComposer(redis_manager=redis_manager,
+                                         local_snapshot_path=os.getenv('CONFIG_LOCAL_SNAPSHOT_PATH'))
         app.state.config_composer = config_composer
+        # 로컬 스냅샷 작업은 앱이 소유한 컴포저에서만 실행 (종료 시 close)
+        config_composer.start()
         logger.info(f"Config Composer 초기화 완료 - {len(config_composer.all_configs)} 개의 설정 로드됨")
 
         # 환경 정보 로그
@@ -62,13 +69,17 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("XgenConfig 애플리케이션 종료 중...")
 
-    # Redis 연결 정리
+    # 로컬 스냅샷 작업 종료 (마지막 값 저장)
+    if hasattr(app.state, 'config_composer'):
+        app.state.config_composer.close()
+
+    # 설정 저장소 연결 정리
     if hasattr(app.state, 'redis_manager'):
         try:
-            app.state.redis_manager.redis_client.close()
-            logger.info("Redis 연결 종료 완료")
+            app.state.redis_manager.close()
+            logger.info("Config Manager 연결 종료 완료")
         except Exception as e:
-            logger.error(f"Redis 연결 종료 실패: {str(e)}")
+            logger.error(f"Config Manager 연결 종료 실패: {str(e)}")
 
     logger.info("XgenConfig 애플리케이션 종료 완료")
 
@@ -90,19 +101,32 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청별 설정 스냅샷 고정
+app.add_middleware(ConfigSnapshotMiddleware)
+
 # 라우터 등록
 app.include_router(app_router)
 
 # Health check 엔드포인트
 @app.get("/health")
 async def health_check():
-    """헬스 체크"""
+    """헬스 체크 (설정 저장소 차단기가 열려 있으면 degraded)"""
+    config_backend = app.state.redis_manager.health() if hasattr(app.state, 'redis_manager') else None
     return {
-        "status": "healthy",
+        "status": "healthy" if not config_backend or config_backend["status"] == "ok" else "degraded",
         "service": "XgenConfig",
-        "version": "1.0.0"
+        "version": "1.0.0",
+        "config_backend": config_backend
     }
 
+# Prometheus 메트릭 엔드포인트
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """설정 핫패스 메트릭 (Prometheus 텍스트 포맷)"""
+    if hasattr(app.state, 'redis_manager'):
+        app.state.redis_manager.collect_metrics()
+    return PlainTextResponse(metrics_registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
 # Root 엔드포인트
 @app.get("/")
 async def root():
@@ -112,7 +136,8 @@ async def root():
         "description": "Redis 기반 설정 관리 시스템",
         "version": "1.0.0",
         "docs": "/docs",
-        "health": "/health"
+        "health": "/health",
+        "metrics": "/metrics"
     }
 
 
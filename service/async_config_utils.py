@@ -0,0 +1,340 @@
+"""
+Config 비동기 유틸리티 함수들
+
+service.config_utils와 같은 이름, 같은 반환 형태의 async 함수들
+CONFIG_BACKEND=redis이면 공유 연결 풀을 쓰는 AsyncRedisConfigManager를 사용하고,
+그 외 백엔드(또는 동기 ConfigBackend 인스턴스)는 스레드로 넘겨 이벤트 루프를 막지 않습니다.
+
+Example:
+    >>> from service.async_config_utils import get_category_config, get_multiple_category_configs
+    >>> openai = await get_category_config("openai")
+    >>> app, vast = await get_multiple_category_configs(["app", "vast"])
+"""
+import os
+import asyncio
+import logging
+from typing import Dict, Any, Optional, List, Union
+
+from service.config_backend import ConfigBackend, create_config_manager
+from service.async_redis_config_manager import AsyncRedisConfigManager
+from service.config_utils import ConfigNamespace, lazy_namespace, infer_data_type
+
+logger = logging.getLogger(__name__)
+
+# 인자 없이 호출할 때 공유하는 비동기 관리자
+_default_async_manager = None
+
+
+class _AsyncBackendAdapter:
+    """동기 ConfigBackend의 메서드를 asyncio.to_thread로 실행하는 어댑터"""
+
+    def __init__(self, backend: ConfigBackend):
+        self.backend = backend
+        self.backend_name = backend.backend_name
+
+    async def set_config(self, config_path: str, config_value: Any,
+                         data_type: str = "string", category: Optional[str] = None) -> bool:
+        return await asyncio.to_thread(self.backend.set_config, config_path, config_value, data_type, category)
+
+    async def get_config_value(self, config_path: str, default: Any = None) -> Any:
+        return await asyncio.to_thread(self.backend.get_config_value, config_path, default)
+
+    async def get_config_values(self, config_paths: List[str],
+                                defaults: Optional[Dict[str, Any]] = None,
+                                default: Any = None) -> Dict[str, Any]:
+        return await asyncio.to_thread(self.backend.get_config_values, config_paths, defaults, default)
+
+    async def get_category_configs(self, category: str) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self.backend.get_category_configs, category)
+
+    async def get_category_configs_nested(self, category: str, copy: bool = True) -> Dict[str, Any]:
+        return await asyncio.to_thread(self.backend.get_category_configs_nested, category, copy)
+
+    async def get_all_configs(self) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self.backend.get_all_configs)
+
+    async def get_all_configs_nested(self, copy: bool = True) -> Dict[str, Any]:
+        return await asyncio.to_thread(self.backend.get_all_configs_nested, copy)
+
+    async def get_all_categories(self) -> List[str]:
+        return await asyncio.to_thread(self.backend.get_all_categories)
+
+
+AsyncManager = Union[AsyncRedisConfigManager, _AsyncBackendAdapter]
+
+
+def _resolve_manager(redis_manager: Optional[Any] = None) -> AsyncManager:
+    """
+    인자로 받은 관리자를 비동기 인터페이스로 맞춤
+
+    Args:
+        redis_manager: AsyncRedisConfigManager, 동기 ConfigBackend, 또는 None
+                      (None이면 CONFIG_BACKEND 기준 공유 인스턴스)
+    """
+    global _default_async_manager
+
+    if redis_manager is None:
+        if _default_async_manager is None:
+            if os.getenv('CONFIG_BACKEND', 'redis').lower() == "redis":
+                _default_async_manager = AsyncRedisConfigManager()
+            else:
+                _default_async_manager = _AsyncBackendAdapter(create_config_manager())
+        return _default_async_manager
+
+    if isinstance(redis_manager, ConfigBackend):
+        return _AsyncBackendAdapter(redis_manager)
+
+    return redis_manager
+
+
+async def get_config_dict(
+    redis_manager: Optional[Any] = None,
+    category: Optional[str] = None,
+    flatten: bool = False,
+    as_namespace: bool = False,
+    copy: bool = True
+) -> Dict[str, Any]:
+    """
+    설정을 dictionary 형태로 가져옵니다. (config_utils.get_config_dict의 async 버전)
+
+    Args:
+        redis_manager: AsyncRedisConfigManager 또는 ConfigBackend (없으면 공유 인스턴스)
+        category: 특정 카테고리만 가져오기 (None이면 전체)
+        flatten: True면 평탄화된 구조, False면 중첩 구조
+        as_namespace: True면 ConfigNamespace로 감싸서 반환
+        copy: 중첩 구조일 때 False면 공유 읽기 전용 트리를 반환
+
+    Returns:
+        Dict 또는 ConfigNamespace: 설정
+
+    Example:
+        >>> configs = await get_config_dict(category="openai")
+        >>> print(configs["openai"]["api_key"])
+    """
+    manager = _resolve_manager(redis_manager)
+
+    # 속성 뷰는 읽기 전용이므로 복사 없이 공유 트리를 사용
+    copy = copy and not as_namespace
+
+    try:
+        if category:
+            if flatten:
+                configs = await manager.get_category_configs(category)
+                result = {config['path']: config['value'] for config in configs}
+            else:
+                result = await manager.get_category_configs_nested(category, copy=copy)
+        else:
+            if flatten:
+                all_configs = await manager.get_all_configs()
+                result = {config['path']: config['value'] for config in all_configs}
+            else:
+                result = await manager.get_all_configs_nested(copy=copy)
+
+        if as_namespace:
+            return lazy_namespace(result)
+
+        return result
+
+    except Exception as e:
+        logger.error(f"설정 가져오기 실패: {str(e)}")
+        return {} if not as_namespace else ConfigNamespace({})
+
+
+async def get_category_config(
+    category: str,
+    redis_manager: Optional[Any] = None,
+    as_namespace: bool = True,
+    copy: bool = True
+) -> Any:
+    """
+    특정 카테고리의 설정을 가져옵니다. (config_utils.get_category_config의 async 버전)
+
+    Args:
+        category: 카테고리 이름 (예: "openai", "app", "vast")
+        redis_manager: AsyncRedisConfigManager 또는 ConfigBackend
+        as_namespace: True면 ConfigNamespace, False면 dict
+        copy: dict로 받을 때 False면 공유 읽기 전용 트리를 반환
+
+    Returns:
+        ConfigNamespace 또는 Dict: 설정 객체
+
+    Example:
+        >>> openai = await get_category_config("openai")
+        >>> print(openai.api_key)
+    """
+    result = await get_config_dict(
+        redis_manager=redis_manager,
+        category=category,
+        flatten=False,
+        as_namespace=False,
+        copy=copy and not as_namespace
+    )
+
+    # 카테고리 키로 래핑되어 있으면 언래핑
+    if isinstance(result, dict) and category in result:
+        result = result[category]
+        logger.debug(f"카테고리 '{category}' 자동 언래핑")
+
+    if as_namespace:
+        return lazy_namespace(result)
+
+    return result
+
+
+async def get_multiple_category_configs(
+    categories: List[str],
+    redis_manager: Optional[Any] = None,
+    as_namespace: bool = True
+) -> List[Any]:
+    """
+    여러 카테고리 설정을 동시에 가져옵니다.
+
+    카테고리별 조회를 asyncio.gather로 한꺼번에 보내므로
+    전체 대기 시간이 카테고리 수의 합이 아니라 가장 느린 조회 하나 수준입니다.
+
+    Args:
+        categories: 카테고리 이름 리스트
+        redis_manager: AsyncRedisConfigManager 또는 ConfigBackend
+        as_namespace: True면 ConfigNamespace, False면 dict
+
+    Returns:
+        List: categories 순서대로의 설정 객체
+
+    Example:
+        >>> app, openai = await get_multiple_category_configs(["app", "openai"])
+        >>> print(app.environment, openai.model_default)
+    """
+    manager = _resolve_manager(redis_manager)
+
+    return list(await asyncio.gather(*(
+        get_category_config(category, manager, as_namespace=as_namespace)
+        for category in categories
+    )))
+
+
+async def get_flat_config(
+    category: Optional[str] = None,
+    redis_manager: Optional[Any] = None
+) -> Dict[str, Any]:
+    """
+    설정을 평탄화된 dictionary로 가져옵니다.
+
+    Returns:
+        Dict: 평탄화된 설정 딕셔너리 {"path.to.config": value}
+
+    Example:
+        >>> flat = await get_flat_config(category="app")
+    """
+    return await get_config_dict(redis_manager=redis_manager, category=category, flatten=True)
+
+
+async def get_config_value(
+    config_path: str,
+    default: Any = None,
+    redis_manager: Optional[Any] = None
+) -> Any:
+    """
+    특정 설정 값만 가져옵니다.
+
+    Example:
+        >>> env = await get_config_value("app.environment")
+    """
+    manager = _resolve_manager(redis_manager)
+    return await manager.get_config_value(config_path, default=default)
+
+
+async def get_multiple_configs(
+    config_paths: List[str],
+    redis_manager: Optional[Any] = None,
+    defaults: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    여러 설정을 한 번에 가져옵니다. (Redis는 MGET 한 번의 왕복)
+
+    Args:
+        config_paths: 설정 경로 리스트
+        redis_manager: AsyncRedisConfigManager 또는 ConfigBackend
+        defaults: 없는 경로에 사용할 경로별 기본값
+
+    Returns:
+        Dict: {config_path: value}
+
+    Example:
+        >>> configs = await get_multiple_configs(["app.environment", "vast.vllm.port"])
+    """
+    manager = _resolve_manager(redis_manager)
+
+    try:
+        return await manager.get_config_values(config_paths, defaults=defaults)
+    except Exception as e:
+        logger.warning(f"설정 가져오기 실패: {len(config_paths)}개 경로 - {str(e)}")
+        defaults = defaults or {}
+        return {path: defaults.get(path) for path in config_paths}
+
+
+async def get_all_categories(
+    redis_manager: Optional[Any] = None
+) -> List[str]:
+    """
+    모든 카테고리 목록을 가져옵니다.
+
+    Example:
+        >>> categories = await get_all_categories()
+    """
+    manager = _resolve_manager(redis_manager)
+    return await manager.get_all_categories()
+
+
+async def update_config(
+    config_path: str,
+    new_value: Any,
+    data_type: Optional[str] = None,
+    redis_manager: Optional[Any] = None
+) -> bool:
+    """
+    설정 값을 업데이트합니다.
+
+    Example:
+        >>> await update_config("app.port", 9000)
+    """
+    manager = _resolve_manager(redis_manager)
+
+    # 데이터 타입 자동 추론
+    if data_type is None:
+        data_type = infer_data_type(new_value)
+
+    return await manager.set_config(
+        config_path=config_path,
+        config_value=new_value,
+        data_type=data_type,
+        category=config_path.split('.')[0]
+    )
+
+
+# ============================================
+# 편의 함수들 (자동으로 ConfigNamespace 반환)
+# ============================================
+
+async def get_app_config(redis_manager: Optional[Any] = None) -> ConfigNamespace:
+    """app 카테고리 설정 가져오기 (ConfigNamespace)"""
+    return await get_category_config("app", redis_manager, as_namespace=True)
+
+
+async def get_openai_config(redis_manager: Optional[Any] = None) -> ConfigNamespace:
+    """openai 카테고리 설정 가져오기 (ConfigNamespace)"""
+    return await get_category_config("openai", redis_manager, as_namespace=True)
+
+
+async def get_anthropic_config(redis_manager: Optional[Any] = None) -> ConfigNamespace:
+    """anthropic 카테고리 설정 가져오기 (ConfigNamespace)"""
+    return await get_category_config("anthropic", redis_manager, as_namespace=True)
+
+
+async def get_vast_config(redis_manager: Optional[Any] = None) -> ConfigNamespace:
+    """vast 카테고리 설정 가져오기 (ConfigNamespace, 자동 언래핑)"""
+    return await get_category_config("vast", redis_manager, as_namespace=True)
+
+
+async def get_vllm_config(redis_manager: Optional[Any] = None) -> ConfigNamespace:
+    """vllm 카테고리 설정 가져오기 (ConfigNamespace)"""
+    return await get_category_config("vllm", redis_manager, as_namespace=True)
@@ -0,0 +1,341 @@
+"""
+Async Redis Config Manager
+
+redis.asyncio 기반 비동기 설정 관리자 (코루틴에서 이벤트 루프를 막지 않음)
+RedisConfigManager와 같은 키 구조와 리비전 해시를 사용하므로 두 관리자를 섞어 써도 됩니다.
+단일 Redis(standalone) 연결만 지원합니다.
+"""
+import os
+import json
+import logging
+from typing import Dict, Any, Optional, List, Tuple
+
+import redis
+import redis.asyncio as aioredis
+
+from service.config_backend import ConfigBackend
+from service.config_tree import ConfigTreeCache, copy_tree
+from service.redis_key_scheme import create_key_scheme
+from service.redis_config_manager import CATEGORY_PAYLOAD_SCRIPT, _socket_timeouts
+from service.metrics import CONFIG_OPERATION_SECONDS, CONFIG_OPERATION_ERRORS, timed_async
+
+logger = logging.getLogger(__name__)
+
+# MGET 한 번에 조회할 최대 키 수
+MGET_CHUNK_SIZE = int(os.getenv('REDIS_MGET_CHUNK_SIZE', '500'))
+
+# 접속 정보별 공유 연결 풀 (프로세스 내 모든 AsyncRedisConfigManager가 재사용)
+_shared_pools: Dict[Tuple, aioredis.ConnectionPool] = {}
+
+
+def get_shared_pool(host: str, port: int, db: int, password: Optional[str]) -> aioredis.ConnectionPool:
+    """
+    접속 정보에 해당하는 공유 비동기 연결 풀 반환
+
+    redis.asyncio 연결은 생성된 이벤트 루프에 묶이므로 하나의 이벤트 루프에서만 사용해야 합니다.
+    """
+    key = (host, port, db, password)
+    pool = _shared_pools.get(key)
+    if pool is None:
+        pool = aioredis.ConnectionPool(
+            host=host,
+            port=port,
+            db=db,
+            password=password,
+            decode_responses=True,
+            max_connections=int(os.getenv('REDIS_ASYNC_MAX_CONNECTIONS', '50')),
+            # 동기 클라이언트와 같은 타임아웃 (응답 없는 Redis에서 TCP 타임아웃까지 기다리지 않도록)
+            **_socket_timeouts()
+        )
+        _shared_pools[key] = pool
+    return pool
+
+
+class AsyncRedisConfigManager:
+    """redis.asyncio를 사용한 비동기 설정 관리자"""
+
+    backend_name = "redis_async"
+
+    ALL_REVISION = ConfigBackend.ALL_REVISION
+
+    def __init__(self, host: Optional[str] = None, port: Optional[int] = None,
+                 db: Optional[int] = None, password: Optional[str] = None,
+                 redis_client: Optional[aioredis.Redis] = None,
+                 key_scheme: Optional[str] = None):
+        # 환경 변수에서 Redis 연결 정보 읽기
+        host = host or os.getenv('REDIS_HOST', '192.168.2.242')
+        port = port or int(os.getenv('REDIS_PORT', '6379'))
+        db = db or int(os.getenv('REDIS_DB', '0'))
+        password = password or os.getenv('REDIS_PASSWORD', 'redis_secure_password123!')
+
+        self.redis_client = redis_client or aioredis.Redis(
+            connection_pool=get_shared_pool(host, port, db, password)
+        )
+
+        # RedisConfigManager와 같은 키 구조 (REDIS_KEY_SCHEME)
+        self.key_scheme = create_key_scheme(key_scheme)
+        self.config_prefix = self.key_scheme.prefix
+        self.revision_key = self.key_scheme.revision_key
+
+        self._tree_cache = ConfigTreeCache()
+
+        # RedisConfigManager와 같은 서버 측 카테고리 일괄 조회 스크립트
+        self.lua_reads = os.getenv('REDIS_LUA_READS', 'true').lower() in ('true', '1', 'yes', 'on')
+        self._category_script = self.redis_client.register_script(CATEGORY_PAYLOAD_SCRIPT)
+
+        logger.info(f"Async Redis Config Manager 초기화 완료: {host}:{port}")
+
+    # ========== Config 값 CRUD ==========
+
+    @timed_async(CONFIG_OPERATION_SECONDS, "redis_async", "set_config")
+    async def set_config(self, config_path: str, config_value: Any,
+                         data_type: str = "string", category: Optional[str] = None) -> bool:
+        """설정 값 저장 (RedisConfigManager.set_config와 동일)"""
+        try:
+            category, encoded = ConfigBackend._encode_config(config_path, config_value, data_type, category)
+
+            async with self.redis_client.pipeline() as pipe:
+                pipe.set(self.key_scheme.value_key(config_path), encoded)
+                pipe.sadd(self.key_scheme.index_key(category), config_path)
+                if self.key_scheme.categories_key:
+                    pipe.sadd(self.key_scheme.categories_key, category)
+                self.key_scheme.bump_revision(pipe, category, self.ALL_REVISION)
+                await pipe.execute()
+
+            logger.debug(f"Config 저장 완료: {config_path} = {config_value}")
+            return True
+
+        except Exception as e:
+            CONFIG_OPERATION_ERRORS.labels(self.backend_name, "set_config").inc()
+            logger.error(f"Config 저장 실패: {config_path} - {str(e)}")
+            return False
+
+    @timed_async(CONFIG_OPERATION_SECONDS, "redis_async", "get_config")
+    async def get_config(self, config_path: str) -> Optional[Dict[str, Any]]:
+        """설정 값과 메타데이터 조회"""
+        try:
+            data = await self.redis_client.get(self.key_scheme.value_key(config_path))
+            if data:
+                return json.loads(data)
+            return None
+
+        except Exception as e:
+            CONFIG_OPERATION_ERRORS.labels(self.backend_name, "get_config").inc()
+            logger.error(f"Config 조회 실패: {config_path} - {str(e)}")
+            return None
+
+    async def get_config_value(self, config_path: str, default: Any = None) -> Any:
+        """설정 값만 조회"""
+        config_data = await self.get_config(config_path)
+        if config_data:
+            return config_data.get('value', default)
+        return default
+
+    @timed_async(CONFIG_OPERATION_SECONDS, "redis_async", "get_config_values")
+    async def get_config_values(self, config_paths: List[str],
+                                defaults: Optional[Dict[str, Any]] = None,
+                                default: Any = None) -> Dict[str, Any]:
+        """여러 설정 값을 MGET 파이프라인 한 번으로 조회 (없는 경로는 기본값)"""
+        defaults = defaults or {}
+        paths = list(dict.fromkeys(config_paths))
+        result = {path: defaults.get(path, default) for path in paths}
+
+        try:
+            values = await self._mget([self.key_scheme.value_key(path) for path in paths])
+            for path, data in zip(paths, values):
+                if data:
+                    result[path] = json.loads(data).get('value', result[path])
+            return result
+
+        except Exception as e:
+            CONFIG_OPERATION_ERRORS.labels(self.backend_name, "get_config_values").inc()
+            logger.error(f"Config 다중 조회 실패: {len(paths)}개 경로 - {str(e)}")
+            return result
+
+    @timed_async(CONFIG_OPERATION_SECONDS, "redis_async", "delete_config")
+    async def delete_config(self, config_path: str) -> bool:
+        """설정 삭제"""
+        try:
+            category = config_path.split('.')[0]
+
+            async with self.redis_client.pipeline() as pipe:
+                pipe.delete(self.key_scheme.value_key(config_path))
+                pipe.srem(self.key_scheme.index_key(category), config_path)
+                self.key_scheme.bump_revision(pipe, category, self.ALL_REVISION)
+                await pipe.execute()
+
+            logger.debug(f"Config 삭제 완료: {config_path}")
+            return True
+
+        except Exception as e:
+            CONFIG_OPERATION_ERRORS.labels(self.backend_name, "delete_config").inc()
+            logger.error(f"Config 삭제 실패: {config_path} - {str(e)}")
+            return False
+
+    async def exists(self, config_path: str) -> bool:
+        """설정 존재 여부 확인"""
+        try:
+            return await self.redis_client.exists(self.key_scheme.value_key(config_path)) > 0
+
+        except Exception as e:
+            CONFIG_OPERATION_ERRORS.labels(self.backend_name, "exists").inc()
+            logger.error(f"Config 존재 확인 실패: {config_path} - {str(e)}")
+            return False
+
+    # ========== 카테고리 ==========
+
+    @timed_async(CONFIG_OPERATION_SECONDS, "redis_async", "get_category_configs")
+    async def get_category_configs(self, category: str) -> List[Dict[str, Any]]:
+        """특정 카테고리의 모든 설정 조회 (SMEMBERS + MGET 파이프라인)"""
+        try:
+            return await self._load_category_configs(category)
+
+        except Exception as e:
+            CONFIG_OPERATION_ERRORS.labels(self.backend_name, "get_category_configs").inc()
+            logger.error(f"카테고리 Config 조회 실패: {category} - {str(e)}")
+            return []
+
+    async def get_category_configs_nested(self, category: str, copy: bool = True) -> Dict[str, Any]:
+        """특정 카테고리의 모든 설정 조회 (중첩 딕셔너리, 리비전 기준 캐시)"""
+        try:
+            revision = await self.get_revision(category)
+            tree = self._tree_cache.lookup(category, revision)
+            if tree is None:
+                tree = self._tree_cache.store(category, revision, await self._load_category_configs(category))
+            return copy_tree(tree) if copy else tree
+
+        except Exception as e:
+            logger.error(f"카테고리 중첩 Config 조회 실패: {category} - {str(e)}")
+            return {}
+
+    @timed_async(CONFIG_OPERATION_SECONDS, "redis_async", "get_all_configs")
+    async def get_all_configs(self) -> List[Dict[str, Any]]:
+        """모든 설정 조회"""
+        try:
+            return await self._load_all_configs()
+
+        except Exception as e:
+            CONFIG_OPERATION_ERRORS.labels(self.backend_name, "get_all_configs").inc()
+            logger.error(f"전체 Config 조회 실패: {str(e)}")
+            return []
+
+    async def get_all_configs_nested(self, copy: bool = True) -> Dict[str, Any]:
+        """모든 설정 조회 (중첩 딕셔너리, 전체 리비전 기준 캐시)"""
+        try:
+            revision = await self.get_revision()
+            tree = self._tree_cache.lookup(None, revision)
+            if tree is None:
+                tree = self._tree_cache.store(None, revision, await self._load_all_configs())
+            return copy_tree(tree) if copy else tree
+
+        except Exception as e:
+            logger.error(f"전체 중첩 Config 조회 실패: {str(e)}")
+            return {}
+
+    @timed_async(CONFIG_OPERATION_SECONDS, "redis_async", "clear_category")
+    async def clear_category(self, category: str) -> bool:
+        """특정 카테고리의 모든 설정 삭제"""
+        try:
+            category_key = self.key_scheme.index_key(category)
+            config_paths = await self.redis_client.smembers(category_key)
+
+            # 한 번의 MULTI로 삭제하고 리비전은 카테고리당 한 번만 증가 (큰 값은 UNLINK로 백그라운드 해제)
+            async with self.redis_client.pipeline() as pipe:
+                keys = [self.key_scheme.value_key(path) for path in config_paths]
+                for start in range(0, len(keys), MGET_CHUNK_SIZE):
+                    pipe.unlink(*keys[start:start + MGET_CHUNK_SIZE])
+                pipe.unlink(category_key)
+                if self.key_scheme.categories_key:
+                    pipe.srem(self.key_scheme.categories_key, category)
+                self.key_scheme.bump_revision(pipe, category, self.ALL_REVISION)
+                await pipe.execute()
+
+            logger.info(f"카테고리 '{category}' 전체 삭제 완료")
+            return True
+
+        except Exception as e:
+            CONFIG_OPERATION_ERRORS.labels(self.backend_name, "clear_category").inc()
+            logger.error(f"카테고리 삭제 실패: {category} - {str(e)}")
+            return False
+
+    async def get_all_categories(self) -> List[str]:
+        """모든 카테고리 목록 조회"""
+        try:
+            if self.key_scheme.categories_key:
+                categories = sorted(await self.redis_client.smembers(self.key_scheme.categories_key))
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for category in categories:
+                        pipe.exists(self.key_scheme.index_key(category))
+                    exists = await pipe.execute()
+                return [category for category, found in zip(categories, exists) if found]
+
+            keys = await self.redis_client.keys(self.key_scheme.index_pattern())
+            return sorted(self.key_scheme.category_from_index_key(key) for key in keys)
+
+        except Exception as e:
+            CONFIG_OPERATION_ERRORS.labels(self.backend_name, "get_all_categories").inc()
+            logger.error(f"카테고리 목록 조회 실패: {str(e)}")
+            return []
+
+    # ========== 리비전 ==========
+
+    async def get_revision(self, category: Optional[str] = None) -> Optional[int]:
+        """카테고리(생략 시 전체)의 변경 리비전 조회 (실패 시 None)"""
+        try:
+            revision = await self.key_scheme.get_revision(self.redis_client, category, self.ALL_REVISION)
+            return int(revision) if revision else 0
+
+        except Exception as e:
+            CONFIG_OPERATION_ERRORS.labels(self.backend_name, "get_revision").inc()
+            logger.error(f"리비전 조회 실패: {category} - {str(e)}")
+            return None
+
+    # ========== 내부 ==========
+
+    async def _mget(self, keys: List[str]) -> List[Optional[str]]:
+        """키 목록을 MGET_CHUNK_SIZE 단위로 나눠 하나의 파이프라인으로 조회"""
+        if not keys:
+            return []
+
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for start in range(0, len(keys), MGET_CHUNK_SIZE):
+                pipe.mget(keys[start:start + MGET_CHUNK_SIZE])
+            chunks = await pipe.execute()
+
+        return [value for chunk in chunks for value in chunk]
+
+    async def _load_category_configs(self, category: str) -> List[Dict[str, Any]]:
+        if self.lua_reads:
+            try:
+                payload = await self._category_script(
+                    keys=[self.key_scheme.index_key(category)],
+                    args=[self.key_scheme.value_key_prefix(category), "", MGET_CHUNK_SIZE]
+                )
+                return json.loads(payload)
+            except redis.exceptions.ResponseError as e:
+                self.lua_reads = False
+                logger.warning(f"Redis 스크립트 조회를 사용할 수 없어 파이프라인 조회로 전환합니다 - {str(e)}")
+
+        config_paths = await self.redis_client.smembers(self.key_scheme.index_key(category))
+        values = await self._mget([self.key_scheme.value_key(path) for path in config_paths])
+        return [json.loads(data) for data in values if data]
+
+    async def _load_all_configs(self) -> List[Dict[str, Any]]:
+        if self.key_scheme.categories_key:
+            categories = await self.redis_client.smembers(self.key_scheme.categories_key)
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for category in categories:
+                    pipe.smembers(self.key_scheme.index_key(category))
+                members = await pipe.execute()
+            keys = [self.key_scheme.value_key(path) for paths in members for path in paths]
+        else:
+            keys = await self.redis_client.keys(f"{self.config_prefix}:*")
+            # category 인덱스 키, hashtag 구조 키는 제외
+            keys = [key for key in keys if ':category:' not in key
+                    and not key.startswith(f"{self.config_prefix}:{{")]
+        values = await self._mget(keys)
+        return [json.loads(data) for data in values if data]
+
+    async def close(self):
+        """클라이언트 종료 (공유 연결 풀은 유지)"""
+        await self.redis_client.aclose(close_connection_pool=False)
@@ -0,0 +1,133 @@
+"""
+Circuit Breaker
+
+연속 실패가 쌓이면 원격 저장소 호출을 일정 시간 차단(open)하고,
+시간이 지나면 한 번의 시험 호출(half-open)로 복구 여부를 확인하는 차단기
+"""
+import time
+import logging
+import threading
+from typing import Optional
+
+from service.metrics import CONFIG_CIRCUIT_STATE, CONFIG_CIRCUIT_TRANSITIONS
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# 메트릭 게이지 값
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(Exception):
+    """차단기가 열려 있어 호출하지 않은 경우"""
+
+
+class CircuitBreaker:
+    """
+    연속 실패 횟수 기반 차단기
+
+    - closed: 정상 호출, failure_threshold번 연속 실패하면 open
+    - open: 호출 차단, reset_timeout초가 지나면 half_open
+    - half_open: 한 번의 시험 호출만 허용, 성공하면 closed, 실패하면 다시 open
+
+    Example:
+        >>> breaker = CircuitBreaker("redis", failure_threshold=5, reset_timeout=10)
+        >>> if breaker.allow_request():
+        ...     try:
+        ...         client.ping()
+        ...         breaker.record_success()
+        ...     except ConnectionError:
+        ...         breaker.record_failure()
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 10.0):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+        CONFIG_CIRCUIT_STATE.labels(name).set(STATE_VALUES[CLOSED])
+
+    @property
+    def state(self) -> str:
+        """현재 상태 (open 상태에서 reset_timeout이 지났으면 half_open으로 보고)"""
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            return HALF_OPEN
+        return self._state
+
+    @property
+    def failures(self) -> int:
+        return self._failures
+
+    def allow_request(self) -> bool:
+        """호출 허용 여부 (half_open에서는 시험 호출 하나만 허용)"""
+        if self._state == CLOSED:
+            return True
+
+        with self._lock:
+            if self._state == OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self._transition(HALF_OPEN)
+
+            if self._state == HALF_OPEN:
+                if self._probe_in_flight:
+                    return False
+                self._probe_in_flight = True
+                return True
+
+            return True
+
+    def record_success(self):
+        """호출 성공 기록"""
+        if self._state == CLOSED and self._failures == 0:
+            return
+
+        with self._lock:
+            self._failures = 0
+            self._probe_in_flight = False
+            if self._state != CLOSED:
+                self._transition(CLOSED)
+
+    def record_failure(self):
+        """호출 실패 기록 (연결/타임아웃 오류만)"""
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self._state == HALF_OPEN or (self._state == CLOSED and self._failures >= self.failure_threshold):
+                self._opened_at = time.monotonic()
+                self._transition(OPEN)
+
+    def _transition(self, state: str):
+        """상태 전환 (self._lock 안에서 호출)"""
+        if state == self._state:
+            return
+        previous, self._state = self._state, state
+        CONFIG_CIRCUIT_STATE.labels(self.name).set(STATE_VALUES[state])
+        CONFIG_CIRCUIT_TRANSITIONS.labels(self.name, state).inc()
+
+        if state == OPEN:
+            logger.warning(f"Circuit breaker '{self.name}' opened after {self._failures} failures "
+                           f"({previous} -> {state}, retry in {self.reset_timeout}s)")
+        else:
+            logger.info(f"Circuit breaker '{self.name}': {previous} -> {state}")
+
+    def to_dict(self) -> dict:
+        """/health 출력용 상태 정보"""
+        retry_in: Optional[float] = None
+        if self._state == OPEN:
+            retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "failure_threshold": self.failure_threshold,
+            "retry_in_seconds": retry_in
+        }
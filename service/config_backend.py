@@ -0,0 +1,349 @@
+"""
+Config Storage Backend
+
+설정 저장소 백엔드 인터페이스와 백엔드 생성 팩토리
+"""
+import os
+import json
+import logging
+from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from typing import Dict, Any, Optional, List
+
+from service.config_tree import ConfigTreeCache, build_config_tree, copy_tree
+
+logger = logging.getLogger(__name__)
+
+# 지원하는 백엔드 이름
+SUPPORTED_BACKENDS = ("redis", "memory", "sqlite", "shared")
+
+
+class ConfigBackend(ABC):
+    """
+    설정 저장소 백엔드의 공통 인터페이스
+
+    RedisConfigManager, MemoryConfigManager, SQLiteConfigManager가 이 인터페이스를 구현하며
+    BaseConfig, PersistentConfig, ConfigComposer, config_utils는 모두 이 인터페이스만 사용합니다.
+    설정 데이터는 백엔드와 무관하게 {value, type, category, path} 형태의 dict입니다.
+    """
+
+    # 백엔드 이름 (로그, 메트릭 라벨용)
+    backend_name = "base"
+
+    # 전체 저장소 리비전 키 (카테고리 리비전과 구분)
+    ALL_REVISION = "*"
+
+    def __init__(self):
+        # 카테고리/전체 중첩 트리 캐시 (리비전이 바뀔 때만 다시 빌드)
+        self._tree_cache = ConfigTreeCache()
+
+    # ========== Config 값 CRUD ==========
+
+    @abstractmethod
+    def set_config(self, config_path: str, config_value: Any,
+                   data_type: str = "string", category: Optional[str] = None) -> bool:
+        """설정 값 저장"""
+
+    @abstractmethod
+    def get_config(self, config_path: str) -> Optional[Dict[str, Any]]:
+        """설정 값과 메타데이터 조회"""
+
+    @abstractmethod
+    def delete_config(self, config_path: str) -> bool:
+        """설정 삭제"""
+
+    @abstractmethod
+    def exists(self, config_path: str) -> bool:
+        """설정 존재 여부 확인"""
+
+    def get_config_value(self, config_path: str, default: Any = None) -> Any:
+        """
+        설정 값만 조회
+
+        Args:
+            config_path: 설정 경로
+            default: 기본값
+
+        Returns:
+            설정 값 또는 기본값
+        """
+        config_data = self.get_config(config_path)
+        if config_data:
+            return config_data.get('value', default)
+        return default
+
+    def get_config_values(self, config_paths: List[str],
+                          defaults: Optional[Dict[str, Any]] = None,
+                          default: Any = None) -> Dict[str, Any]:
+        """
+        여러 설정 값을 한 번에 조회
+
+        Args:
+            config_paths: 설정 경로 리스트
+            defaults: 경로별 기본값 {config_path: default}
+            default: defaults에 없는 경로의 기본값
+
+        Returns:
+            Dict: {config_path: value} (없는 경로는 기본값)
+        """
+        defaults = defaults or {}
+        return {
+            path: self.get_config_value(path, default=defaults.get(path, default))
+            for path in config_paths
+        }
+
+    # ========== 카테고리 ==========
+
+    @abstractmethod
+    def get_category_configs(self, category: str) -> List[Dict[str, Any]]:
+        """특정 카테고리의 모든 설정 조회 (리스트 형태)"""
+
+    @abstractmethod
+    def get_all_configs(self) -> List[Dict[str, Any]]:
+        """모든 설정 조회"""
+
+    @abstractmethod
+    def clear_category(self, category: str) -> bool:
+        """특정 카테고리의 모든 설정 삭제"""
+
+    @abstractmethod
+    def get_all_categories(self) -> List[str]:
+        """모든 카테고리 목록 조회"""
+
+    def get_category_configs_nested(self, category: str, copy: bool = True) -> Dict[str, Any]:
+        """
+        특정 카테고리의 모든 설정 조회 (중첩 딕셔너리 형태)
+
+        빌드된 트리는 카테고리 리비전이 바뀔 때까지 캐시됩니다.
+
+        Args:
+            category: 카테고리 이름
+            copy: True면 수정 가능한 복사본, False면 공유 읽기 전용 트리(ReadOnlyTree)
+
+        Returns:
+            중첩된 딕셔너리 형태의 설정
+            예: {"openai": {"api_key": "...", "model": "..."}}
+        """
+        try:
+            tree = self._tree_cache.get(
+                category,
+                self.get_revision(category),
+                lambda: self._load_category_configs(category)
+            )
+            return copy_tree(tree) if copy else tree
+
+        except Exception as e:
+            fallback = self._last_known_configs(category)
+            if fallback is not None:
+                return build_config_tree(fallback)
+            logger.error(f"카테고리 중첩 Config 조회 실패: {category} - {str(e)}")
+            return {}
+
+    def get_all_configs_nested(self, copy: bool = True) -> Dict[str, Any]:
+        """
+        모든 설정 조회 (중첩 딕셔너리 형태)
+
+        빌드된 트리는 저장소 전체 리비전이 바뀔 때까지 캐시됩니다.
+
+        Args:
+            copy: True면 수정 가능한 복사본, False면 공유 읽기 전용 트리(ReadOnlyTree)
+
+        Returns:
+            중첩된 딕셔너리 형태의 전체 설정
+        """
+        try:
+            tree = self._tree_cache.get(
+                None,
+                self.get_revision(),
+                self._load_all_configs
+            )
+            return copy_tree(tree) if copy else tree
+
+        except Exception as e:
+            fallback = self._last_known_configs()
+            if fallback is not None:
+                return build_config_tree(fallback)
+            logger.error(f"전체 중첩 Config 조회 실패: {str(e)}")
+            return {}
+
+    def get_prefix_configs(self, prefix: str) -> List[Dict[str, Any]]:
+        """
+        경로 접두사 하위의 설정 조회 (리스트 형태)
+
+        Args:
+            prefix: 설정 경로 접두사 (예: "vast.vllm", 카테고리 이름이면 카테고리 전체)
+
+        Returns:
+            prefix 자신 또는 "prefix." 하위 경로의 설정 리스트
+        """
+        dotted = prefix + '.'
+        return [
+            config for config in self.get_category_configs(prefix.split('.')[0])
+            if config['path'] == prefix or config['path'].startswith(dotted)
+        ]
+
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        경로 접두사 하위의 설정 삭제
+
+        Args:
+            prefix: 설정 경로 접두사 (카테고리 이름이면 카테고리 전체)
+
+        Returns:
+            int: 삭제한 설정 수
+        """
+        configs = self.get_prefix_configs(prefix)
+        if prefix == prefix.split('.')[0]:
+            return len(configs) if self.clear_category(prefix) else 0
+        return sum(1 for config in configs if self.delete_config(config['path']))
+
+    def get_prefix_configs_nested(self, prefix: str, copy: bool = True) -> Dict[str, Any]:
+        """
+        경로 접두사 하위의 설정 조회 (중첩 딕셔너리 형태)
+
+        빌드된 트리는 접두사가 속한 카테고리의 리비전이 바뀔 때까지 캐시됩니다.
+
+        Args:
+            prefix: 설정 경로 접두사 (예: "vast.vllm")
+            copy: True면 수정 가능한 복사본, False면 공유 읽기 전용 트리(ReadOnlyTree)
+
+        Returns:
+            루트부터의 중첩 딕셔너리 (예: {"vast": {"vllm": {...}}})
+        """
+        try:
+            tree = self._tree_cache.get(
+                ("prefix", prefix),
+                self.get_revision(prefix.split('.')[0]),
+                lambda: self._load_prefix_configs(prefix)
+            )
+            return copy_tree(tree) if copy else tree
+
+        except Exception as e:
+            logger.error(f"접두사 중첩 Config 조회 실패: {prefix} - {str(e)}")
+            return {}
+
+    # ========== 리비전 ==========
+
+    @abstractmethod
+    def get_revision(self, category: Optional[str] = None) -> Optional[int]:
+        """
+        카테고리(생략 시 저장소 전체)의 변경 리비전 조회
+
+        설정이 저장, 삭제될 때마다 해당 카테고리와 전체 리비전이 증가합니다.
+        조회에 실패하면 None을 반환하며 이때는 트리 캐시를 사용하지 않습니다.
+        """
+
+    def _load_category_configs(self, category: str) -> List[Dict[str, Any]]:
+        """트리 빌드용 카테고리 설정 조회 (실패 시 예외를 던져 빈 결과가 캐시되지 않도록 함)"""
+        return self.get_category_configs(category)
+
+    def _load_all_configs(self) -> List[Dict[str, Any]]:
+        """트리 빌드용 전체 설정 조회 (실패 시 예외를 던져 빈 결과가 캐시되지 않도록 함)"""
+        return self.get_all_configs()
+
+    def _load_prefix_configs(self, prefix: str) -> List[Dict[str, Any]]:
+        """트리 빌드용 접두사 하위 설정 조회 (실패 시 예외를 던져 빈 결과가 캐시되지 않도록 함)"""
+        return self.get_prefix_configs(prefix)
+
+    def _last_known_configs(self, category: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        조회 실패 시 대신 사용할 마지막 정상 설정 목록 (카테고리 생략 시 전체)
+
+        원격 저장소 백엔드만 구현하며 None이면 빈 결과를 반환합니다.
+        """
+        return None
+
+    # ========== 공통 헬퍼 ==========
+
+    @staticmethod
+    def _encode_config(config_path: str, config_value: Any,
+                       data_type: str, category: Optional[str]) -> tuple:
+        """
+        설정 값을 저장용 JSON 문자열로 변환
+
+        Returns:
+            (category, JSON 문자열)
+        """
+        # 카테고리 자동 추출 (config_path의 첫 번째 부분)
+        if not category:
+            category = config_path.split('.')[0]
+
+        config_data = {
+            'value': config_value,
+            'type': data_type,
+            'category': category,
+            'path': config_path
+        }
+        return category, json.dumps(config_data)
+
+    def write_batch(self):
+        """
+        연속 쓰기 묶음 (with 블록, 쓰기마다 비용이 큰 백엔드만 블록 끝에 한 번에 반영)
+
+        Example:
+            >>> with backend.write_batch():
+            ...     backend.set_config("app.port", 8000, "int")
+        """
+        return nullcontext()
+
+    def close(self):
+        """백엔드 연결 정리 (필요한 백엔드만 구현)"""
+
+    def collect_metrics(self):
+        """/metrics 출력 직전에 백엔드 상태 게이지 갱신 (필요한 백엔드만 구현)"""
+
+    def health(self) -> Dict[str, Any]:
+        """/health 출력용 백엔드 상태 (status: ok 또는 degraded)"""
+        return {"backend": self.backend_name, "status": "ok"}
+
+
+# 프로세스 내 공유 메모리 백엔드 (CONFIG_BACKEND=memory 기본 인스턴스)
+_shared_memory_manager: Optional[ConfigBackend] = None
+
+
+def create_config_manager(backend: Optional[str] = None, **kwargs) -> ConfigBackend:
+    """
+    설정 저장소 백엔드 생성
+
+    backend를 지정하지 않으면 CONFIG_BACKEND 환경변수(기본값: redis)를 사용합니다.
+    memory 백엔드는 인자 없이 생성하면 프로세스 내에서 하나의 인스턴스를 공유하므로
+    BaseConfig, PersistentConfig가 각각 생성해도 같은 저장소를 바라봅니다.
+
+    Args:
+        backend: 백엔드 이름 (redis, memory, sqlite, shared)
+        **kwargs: 백엔드 생성자에 전달할 인자
+
+    Returns:
+        ConfigBackend: 백엔드 인스턴스
+
+    Examples:
+        >>> manager = create_config_manager("memory")
+        >>> manager = create_config_manager("sqlite", db_path="/tmp/config.db")
+        >>> # 멀티 워커: 리더 하나만 Redis를 읽고 나머지는 공유 스냅샷을 매핑
+        >>> manager = create_config_manager("shared", source_backend="redis")
+    """
+    global _shared_memory_manager
+
+    backend = (backend or os.getenv('CONFIG_BACKEND', 'redis')).lower()
+
+    if backend == "redis":
+        from service.redis_config_manager import RedisConfigManager
+        return RedisConfigManager(**kwargs)
+
+    if backend == "memory":
+        from service.memory_config_manager import MemoryConfigManager
+        if kwargs:
+            return MemoryConfigManager(**kwargs)
+        if _shared_memory_manager is None:
+            _shared_memory_manager = MemoryConfigManager()
+        return _shared_memory_manager
+
+    if backend == "sqlite":
+        from service.sqlite_config_manager import SQLiteConfigManager
+        return SQLiteConfigManager(**kwargs)
+
+    if backend == "shared":
+        from service.shared_snapshot_config_manager import SharedSnapshotConfigManager
+        return SharedSnapshotConfigManager(**kwargs)
+
+    raise ValueError(f"지원되지 않는 설정 백엔드입니다: {backend} (지원: {', '.join(SUPPORTED_BACKENDS)})")
@@ -0,0 +1,150 @@
+"""
+Config Tree
+
+평탄한 설정 목록을 중첩 dict 트리로 만드는 공통 빌더와 리비전 기반 트리 캐시
+"""
+import threading
+from typing import Dict, Any, Optional, List, Callable, Hashable, Tuple
+
+from service.metrics import record_cache
+
+
+def build_config_tree(configs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    설정 목록을 경로('.') 기준 중첩 dict로 변환
+
+    Args:
+        configs: {path, value, ...} 형태의 설정 데이터 리스트
+
+    Returns:
+        중첩된 딕셔너리
+        예: [{"path": "openai.api_key", "value": "..."}] -> {"openai": {"api_key": "..."}}
+    """
+    result = {}
+
+    for config in configs:
+        path = config['path']
+        value = config['value']
+
+        # 경로를 '.'로 분리하여 중첩 딕셔너리 생성
+        keys = path.split('.')
+        current = result
+
+        for key in keys[:-1]:
+            if key not in current:
+                current[key] = {}
+            current = current[key]
+
+        current[keys[-1]] = value
+
+    return result
+
+
+def _readonly(*args, **kwargs):
+    raise TypeError("ReadOnlyTree는 수정할 수 없습니다 (copy_tree()로 복사 후 수정하세요)")
+
+
+class ReadOnlyTree(dict):
+    """
+    여러 호출자가 공유하는 읽기 전용 설정 트리 노드
+
+    dict 하위 클래스이므로 json 직렬화, isinstance(dict) 검사는 그대로 동작하며
+    수정 메서드만 막습니다. 트리 안의 list 값은 tuple로 고정됩니다.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def __reduce__(self):
+        # copy.deepcopy, pickle 결과는 일반 dict
+        return (dict, (dict(self),))
+
+
+def freeze_tree(value: Any) -> Any:
+    """중첩 dict/list를 ReadOnlyTree/tuple로 변환"""
+    if isinstance(value, dict):
+        frozen = ReadOnlyTree()
+        for key, child in value.items():
+            dict.__setitem__(frozen, key, freeze_tree(child))
+        return frozen
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_tree(item) for item in value)
+    return value
+
+
+def copy_tree(value: Any) -> Any:
+    """
+    공유 트리를 수정 가능한 일반 dict/list로 복사
+
+    dict, list 노드만 새로 만들고 문자열, 숫자 같은 리프 값은 공유하므로
+    copy.deepcopy보다 저렴합니다.
+    """
+    if isinstance(value, dict):
+        return {key: copy_tree(child) for key, child in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [copy_tree(item) for item in value]
+    return value
+
+
+class ConfigTreeCache:
+    """
+    키(카테고리 또는 전체)별로 빌드된 설정 트리를 리비전과 함께 보관하는 캐시
+
+    저장소 리비전이 바뀐 키만 다시 빌드하며, 캐시된 트리는 ReadOnlyTree로 공유됩니다.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Hashable, Tuple[int, ReadOnlyTree]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, revision: Optional[int],
+            loader: Callable[[], List[Dict[str, Any]]]) -> ReadOnlyTree:
+        """
+        캐시된 트리 반환 (리비전이 다르면 loader로 설정 목록을 다시 읽어 빌드)
+
+        Args:
+            key: 캐시 키 (카테고리 이름, 전체는 None)
+            revision: 현재 저장소 리비전 (None이면 캐시를 사용하지 않음)
+            loader: 설정 목록을 반환하는 함수 (실패 시 예외를 던져야 캐시되지 않음)
+        """
+        tree = self.lookup(key, revision)
+        if tree is None:
+            tree = self.store(key, revision, loader())
+        return tree
+
+    def lookup(self, key: Hashable, revision: Optional[int]) -> Optional[ReadOnlyTree]:
+        """리비전이 일치하는 캐시 트리 반환 (없으면 None, 비동기 로더에서 사용)"""
+        if revision is not None:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == revision:
+                record_cache("config_tree", True)
+                return entry[1]
+
+        record_cache("config_tree", False)
+        return None
+
+    def store(self, key: Hashable, revision: Optional[int],
+              configs: List[Dict[str, Any]]) -> ReadOnlyTree:
+        """설정 목록으로 트리를 빌드해서 캐시 (revision이 None이면 캐시하지 않음)"""
+        tree = freeze_tree(build_config_tree(configs))
+
+        if revision is not None:
+            with self._lock:
+                self._entries[key] = (revision, tree)
+        return tree
+
+    def invalidate(self, key: Hashable = ...):
+        """특정 키(생략 시 전체) 캐시 무효화"""
+        with self._lock:
+            if key is ...:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
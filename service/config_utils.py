@@ -5,15 +5,133 @@ Redis에서 설정을 dictionary 형태로 쉽게 가져오는 함수들
 """
 import logging
 from typing import Dict, Any, Optional, List
-from service.redis_config_manager import RedisConfigManager
+from service.config_backend import ConfigBackend, create_config_manager
+from service.metrics import CONFIG_NAMESPACE_SECONDS, timed
 from types import SimpleNamespace
 
 logger = logging.getLogger(__name__)
 
+# 자동 언래핑 대상 래퍼 키
+COMMON_WRAPPERS = frozenset({'vast', 'config', 'data', 'settings', 'options',
+                             'result', 'response', 'payload'})
+
+
+def _unwrap(data: Dict[str, Any]) -> Dict[str, Any]:
+    """단일 키만 있고 그 키가 일반적인 래퍼이며 값이 dict인 경우 래퍼를 벗김"""
+    if len(data) == 1:
+        key, value = next(iter(data.items()))
+        if key in COMMON_WRAPPERS and isinstance(value, dict):
+            logger.debug(f"자동 언래핑: '{key}' 키 제거됨")
+            return value
+    return data
+
+
+class ConfigNamespace:
+    """
+    중첩 dict 위의 읽기 전용 지연 속성 뷰
+
+    dict_to_namespace와 같은 자동 언래핑 규칙을 따르지만 트리 전체를 미리 변환하지 않고
+    실제로 접근한 노드만 변환하여 메모이즈합니다. 원본 dict는 복사하지 않으므로
+    뷰가 살아 있는 동안 원본을 수정하지 않아야 합니다.
+
+    Examples:
+        >>> ns = ConfigNamespace({'vast': {'vllm': {'port': 12434}}})
+        >>> ns.vllm.port  # 'vast'가 자동으로 제거됨
+        12434
+        >>> ns.to_dict()
+        {'vllm': {'port': 12434}}
+    """
+
+    __slots__ = ("_data", "_children")
+
+    def __init__(self, data: Dict[str, Any], _unwrapped: bool = False):
+        object.__setattr__(self, "_data", data if _unwrapped else _unwrap(data))
+        object.__setattr__(self, "_children", None)
+
+    def __getattr__(self, name: str) -> Any:
+        # 슬롯이 아직 채워지지 않은 상태(복사/pickle 중)에서 재귀하지 않도록 직접 조회
+        data = object.__getattribute__(self, "_data")
+        try:
+            value = data[name]
+        except KeyError:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'") from None
+
+        if not isinstance(value, (dict, list, tuple)):
+            return value
+
+        children = object.__getattribute__(self, "_children")
+        if children is None:
+            children = {}
+            object.__setattr__(self, "_children", children)
+        child = children.get(name)
+        if child is None:
+            child = lazy_namespace(value)
+            children[name] = child
+        return child
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"'{type(self).__name__}' object is read-only")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"'{type(self).__name__}' object is read-only")
+
+    def __reduce__(self):
+        return (type(self), (self._data, True))
+
+    def __dir__(self):
+        return sorted(set(self._data) | {"to_dict", "to_namespace"})
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._data
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ConfigNamespace):
+            return self._data == other._data
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        items = ", ".join(f"{key}={value!r}" for key, value in self._data.items())
+        return f"{type(self).__name__}({items})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """언래핑이 적용된 원본 dict 반환"""
+        return self._data
+
+    def to_namespace(self) -> SimpleNamespace:
+        """SimpleNamespace로 즉시 변환 (vars(), 속성 수정이 필요한 경우)"""
+        return dict_to_namespace(self._data)
+
+
+def lazy_namespace(data):
+    """
+    dict를 지연 변환되는 ConfigNamespace로 감쌈
+
+    list(공유 트리의 tuple 포함)는 요소별로 감싸고 기본 타입은 그대로 반환합니다.
+    자식 노드는 접근할 때 변환되므로 호출 비용은 트리 크기와 무관합니다.
+
+    Args:
+        data: 변환할 데이터 (dict, list, 또는 기본 타입)
+
+    Returns:
+        ConfigNamespace 또는 변환된 데이터
+    """
+    if isinstance(data, dict):
+        return ConfigNamespace(data)
+    elif isinstance(data, (list, tuple)):
+        return [lazy_namespace(item) for item in data]
+    else:
+        return data
+
+
+@timed(CONFIG_NAMESPACE_SECONDS, "dict_to_namespace")
 def dict_to_namespace(data):
     """
     dict를 재귀적으로 SimpleNamespace로 변환
     자동으로 'vast', 'config' 같은 단일 래퍼 키를 언래핑합니다
+
+    트리 전체를 즉시 변환하므로 속성 읽기만 필요하면 lazy_namespace를 사용하세요.
     
     Args:
         data: 변환할 데이터 (dict, list, 또는 기본 타입)
@@ -42,53 +160,55 @@ def dict_to_namespace(data):
     """
     if isinstance(data, dict):
         # 🎯 자동 언래핑: 단일 키만 있고 그 값이 dict인 경우
-        if len(data) == 1:
-            key, value = next(iter(data.items()))
-            # 일반적인 래퍼 키를 자동으로 건너뜀
-            common_wrappers = {'vast', 'config', 'data', 'settings', 'options', 
-                              'result', 'response', 'payload'}
-            if key in common_wrappers and isinstance(value, dict):
-                data = value  # 래퍼를 벗김
-                logger.debug(f"자동 언래핑: '{key}' 키 제거됨")
+        data = _unwrap(data)
         
         # dict의 모든 값을 재귀적으로 변환
         return SimpleNamespace(**{
-            key: dict_to_namespace(value) 
+            key: _dict_to_namespace(value) 
             for key, value in data.items()
         })
-    elif isinstance(data, list):
-        # list의 각 요소를 재귀적으로 변환
-        return [dict_to_namespace(item) for item in data]
+    elif isinstance(data, (list, tuple)):
+        # list(공유 트리의 tuple 포함)의 각 요소를 재귀적으로 변환
+        return [_dict_to_namespace(item) for item in data]
     else:
         # 기본 타입은 그대로 반환
         return data
 
 
+# 재귀 호출마다 시간이 기록되지 않도록 최상위 호출만 계측
+_dict_to_namespace = dict_to_namespace.__wrapped__
+
+
 def get_config_dict(
-    redis_manager: Optional[RedisConfigManager] = None,
+    redis_manager: Optional[ConfigBackend] = None,
     category: Optional[str] = None,
     flatten: bool = False,
-    as_namespace: bool = False
+    as_namespace: bool = False,
+    copy: bool = True
 ) -> Dict[str, Any]:
     """
     Redis에서 설정을 dictionary 형태로 가져옵니다.
 
+    중첩 구조는 카테고리(전체 조회 시 저장소 전체) 리비전이 바뀔 때까지 캐시된 트리를 사용합니다.
+
     Args:
-        redis_manager: RedisConfigManager 인스턴스 (없으면 자동 생성)
+        redis_manager: 설정 백엔드 인스턴스 (없으면 CONFIG_BACKEND 기준으로 자동 생성)
         category: 특정 카테고리만 가져오기 (None이면 전체)
         flatten: True면 평탄화된 구조 {"app.environment": "dev"},
                 False면 중첩 구조 {"app": {"environment": "dev"}}
-        as_namespace: True면 SimpleNamespace로 변환 (속성 접근 가능)
+        as_namespace: True면 ConfigNamespace로 감싸서 반환 (읽기 전용 속성 접근)
+        copy: 중첩 구조일 때 True면 수정 가능한 복사본,
+              False면 공유 읽기 전용 트리(ReadOnlyTree, 리스트는 tuple)를 반환
 
     Returns:
-        Dict 또는 SimpleNamespace: 설정
+        Dict 또는 ConfigNamespace: 설정
 
     Examples:
         >>> # 모든 설정을 중첩 구조로
         >>> configs = get_config_dict()
         >>> print(configs["app"]["environment"])  # "development"
 
-        >>> # SimpleNamespace로 변환 (속성 접근)
+        >>> # ConfigNamespace로 (속성 접근)
         >>> configs = get_config_dict(as_namespace=True)
         >>> print(configs.app.environment)  # "development"
 
@@ -99,9 +219,15 @@ def get_config_dict(
         >>> # 평탄화된 구조로
         >>> flat_config = get_config_dict(flatten=True)
         >>> print(flat_config["app.environment"])  # "development"
+
+        >>> # 요청마다 호출하는 읽기 전용 경로 (복사 없음)
+        >>> configs = get_config_dict(copy=False)
     """
     if redis_manager is None:
-        redis_manager = RedisConfigManager()
+        redis_manager = create_config_manager()
+
+    # 속성 뷰는 읽기 전용이므로 복사 없이 공유 트리를 사용
+    copy = copy and not as_namespace
 
     try:
         if category:
@@ -111,65 +237,52 @@ def get_config_dict(
                 configs = redis_manager.get_category_configs(category)
                 result = {config['path']: config['value'] for config in configs}
             else:
-                # 중첩 구조
-                result = redis_manager.get_category_configs_nested(category)
+                # 중첩 구조 (카테고리 리비전 기준 캐시)
+                result = redis_manager.get_category_configs_nested(category, copy=copy)
         else:
             # 모든 설정 가져오기
-            all_configs = redis_manager.get_all_configs()
-
             if flatten:
                 # 평탄화된 구조
+                all_configs = redis_manager.get_all_configs()
                 result = {config['path']: config['value'] for config in all_configs}
             else:
-                # 중첩 구조
-                result = {}
-                for config in all_configs:
-                    path = config['path']
-                    value = config['value']
-
-                    # 경로를 '.'로 분리하여 중첩 딕셔너리 생성
-                    keys = path.split('.')
-                    current = result
-
-                    for key in keys[:-1]:
-                        if key not in current:
-                            current[key] = {}
-                        current = current[key]
+                # 중첩 구조 (전체 리비전 기준 캐시)
+                result = redis_manager.get_all_configs_nested(copy=copy)
 
-                    current[keys[-1]] = value
-
-        # SimpleNamespace로 변환 (자동 언래핑 포함)
+        # ConfigNamespace로 감싸기 (자동 언래핑 포함, 접근한 노드만 변환)
         if as_namespace:
-            return dict_to_namespace(result)
+            return lazy_namespace(result)
         
         return result
 
     except Exception as e:
         logger.error(f"설정 가져오기 실패: {str(e)}")
-        return {} if not as_namespace else SimpleNamespace()
+        return {} if not as_namespace else ConfigNamespace({})
 
 
 def get_category_config(
     category: str,
-    redis_manager: Optional[RedisConfigManager] = None,
-    as_namespace: bool = True
+    redis_manager: Optional[ConfigBackend] = None,
+    as_namespace: bool = True,
+    copy: bool = True
 ) -> Any:
     """
     특정 카테고리의 설정을 가져옵니다.
     
-    기본적으로 SimpleNamespace로 반환하여 속성으로 접근 가능합니다.
+    기본적으로 ConfigNamespace로 반환하여 속성으로 접근 가능합니다.
     자동으로 카테고리 래퍼 키를 언래핑합니다.
 
     Args:
         category: 카테고리 이름 (예: "openai", "app", "vast")
-        redis_manager: RedisConfigManager 인스턴스 (없으면 자동 생성)
-        as_namespace: True면 SimpleNamespace, False면 dict
+        redis_manager: 설정 백엔드 인스턴스 (없으면 CONFIG_BACKEND 기준으로 자동 생성)
+        as_namespace: True면 ConfigNamespace, False면 dict
+        copy: dict로 받을 때 False면 공유 읽기 전용 트리를 반환
 
     Returns:
-        SimpleNamespace 또는 Dict: 설정 객체
+        ConfigNamespace 또는 Dict: 설정 객체
 
     Examples:
-        >>> # SimpleNamespace로 (기본값, 속성 접근)
+        >>> # ConfigNamespace로 (기본값, 속성 접근)
         >>> openai = get_category_config("openai")
         >>> print(openai.api_key)  # 바로 접근!
         >>> print(openai.model_default)
@@ -186,7 +299,8 @@ def get_category_config(
         redis_manager=redis_manager, 
         category=category, 
         flatten=False,
-        as_namespace=False  # 일단 dict로 받음
+        as_namespace=False,  # 일단 dict로 받음
+        copy=copy and not as_namespace
     )
     
     # 카테고리 키로 래핑되어 있으면 언래핑
@@ -194,23 +308,23 @@ def get_category_config(
         result = result[category]
         logger.debug(f"카테고리 '{category}' 자동 언래핑")
     
-    # SimpleNamespace로 변환 (필요시)
+    # ConfigNamespace로 감싸기 (필요시)
     if as_namespace:
-        return dict_to_namespace(result)
+        return lazy_namespace(result)
     
     return result
 
 
 def get_flat_config(
     category: Optional[str] = None,
-    redis_manager: Optional[RedisConfigManager] = None
+    redis_manager: Optional[ConfigBackend] = None
 ) -> Dict[str, Any]:
     """
     설정을 평탄화된 dictionary로 가져옵니다.
 
     Args:
         category: 특정 카테고리만 (None이면 전체)
-        redis_manager: RedisConfigManager 인스턴스
+        redis_manager: 설정 백엔드 인스턴스
 
     Returns:
         Dict: 평탄화된 설정 딕셔너리 {"path.to.config": value}
@@ -230,7 +344,7 @@ def get_flat_config(
 def get_config_value(
     config_path: str,
     default: Any = None,
-    redis_manager: Optional[RedisConfigManager] = None
+    redis_manager: Optional[ConfigBackend] = None
 ) -> Any:
     """
     특정 설정 값만 가져옵니다.
@@ -238,7 +352,7 @@ def get_config_value(
     Args:
         config_path: 설정 경로 (예: "app.environment", "openai.api_key")
         default: 기본값
-        redis_manager: RedisConfigManager 인스턴스
+        redis_manager: 설정 백엔드 인스턴스
 
     Returns:
         설정 값 또는 기본값
@@ -250,21 +364,25 @@ def get_config_value(
         >>> api_key = get_config_value("openai.api_key", default="")
     """
     if redis_manager is None:
-        redis_manager = RedisConfigManager()
+        redis_manager = create_config_manager()
 
     return redis_manager.get_config_value(config_path, default=default)
 
 
 def get_multiple_configs(
     config_paths: List[str],
-    redis_manager: Optional[RedisConfigManager] = None
+    redis_manager: Optional[ConfigBackend] = None,
+    defaults: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """
     여러 설정을 한 번에 가져옵니다.
 
+    Redis 백엔드는 경로 수와 관계없이 MGET 한 번의 왕복으로 조회합니다.
+
     Args:
         config_paths: 설정 경로 리스트
-        redis_manager: RedisConfigManager 인스턴스
+        redis_manager: 설정 백엔드 인스턴스
+        defaults: 없는 경로에 사용할 경로별 기본값 {config_path: default} (없으면 None)
 
     Returns:
         Dict: {config_path: value}
@@ -274,7 +392,7 @@ def get_multiple_configs(
         ...     "app.environment",
         ...     "openai.api_key",
         ...     "vast.vllm.port"
-        ... ])
+        ... ], defaults={"vast.vllm.port": 12434})
         >>> print(configs)
         {
             "app.environment": "development",
@@ -283,27 +401,24 @@ def get_multiple_configs(
         }
     """
     if redis_manager is None:
-        redis_manager = RedisConfigManager()
-
-    result = {}
-    for path in config_paths:
-        try:
-            result[path] = redis_manager.get_config_value(path)
-        except Exception as e:
-            logger.warning(f"설정 가져오기 실패: {path} - {str(e)}")
-            result[path] = None
+        redis_manager = create_config_manager()
 
-    return result
+    try:
+        return redis_manager.get_config_values(config_paths, defaults=defaults)
+    except Exception as e:
+        logger.warning(f"설정 가져오기 실패: {len(config_paths)}개 경로 - {str(e)}")
+        defaults = defaults or {}
+        return {path: defaults.get(path) for path in config_paths}
 
 
 def get_all_categories(
-    redis_manager: Optional[RedisConfigManager] = None
+    redis_manager: Optional[ConfigBackend] = None
 ) -> List[str]:
     """
     모든 카테고리 목록을 가져옵니다.
 
     Args:
-        redis_manager: RedisConfigManager 인스턴스
+        redis_manager: 설정 백엔드 인스턴스
 
     Returns:
         List[str]: 카테고리 목록
@@ -314,16 +429,32 @@ def get_all_categories(
         ['app', 'openai', 'anthropic', 'vast', ...]
     """
     if redis_manager is None:
-        redis_manager = RedisConfigManager()
+        redis_manager = create_config_manager()
 
     return redis_manager.get_all_categories()
 
 
+def infer_data_type(value: Any) -> str:
+    """값의 데이터 타입 이름 추론 (bool, int, float, list, dict, string)"""
+    if isinstance(value, bool):
+        return "bool"
+    elif isinstance(value, int):
+        return "int"
+    elif isinstance(value, float):
+        return "float"
+    elif isinstance(value, list):
+        return "list"
+    elif isinstance(value, dict):
+        return "dict"
+    else:
+        return "string"
+
+
 def update_config(
     config_path: str,
     new_value: Any,
     data_type: Optional[str] = None,
-    redis_manager: Optional[RedisConfigManager] = None
+    redis_manager: Optional[ConfigBackend] = None
 ) -> bool:
     """
     설정 값을 업데이트합니다.
@@ -332,7 +463,7 @@ def update_config(
         config_path: 설정 경로
         new_value: 새로운 값
         data_type: 데이터 타입 (자동 추론 가능)
-        redis_manager: RedisConfigManager 인스턴스
+        redis_manager: 설정 백엔드 인스턴스
 
     Returns:
         bool: 성공 여부
@@ -342,22 +473,11 @@ def update_config(
         >>> update_config("app.port", 9000)
     """
     if redis_manager is None:
-        redis_manager = RedisConfigManager()
+        redis_manager = create_config_manager()
 
     # 데이터 타입 자동 추론
     if data_type is None:
-        if isinstance(new_value, bool):
-            data_type = "bool"
-        elif isinstance(new_value, int):
-            data_type = "int"
-        elif isinstance(new_value, float):
-            data_type = "float"
-        elif isinstance(new_value, list):
-            data_type = "list"
-        elif isinstance(new_value, dict):
-            data_type = "dict"
-        else:
-            data_type = "string"
+        data_type = infer_data_type(new_value)
 
     # 카테고리 추출
     category = config_path.split('.')[0]
@@ -371,15 +491,15 @@ def update_config(
 
 
 # ============================================
-# 편의 함수들 (자동으로 SimpleNamespace 반환)
+# 편의 함수들 (자동으로 ConfigNamespace 반환)
 # ============================================
 
-def get_app_config(redis_manager: Optional[RedisConfigManager] = None) -> SimpleNamespace:
+def get_app_config(redis_manager: Optional[ConfigBackend] = None) -> ConfigNamespace:
     """
-    app 카테고리 설정 가져오기 (SimpleNamespace)
+    app 카테고리 설정 가져오기 (ConfigNamespace)
     
     Returns:
-        SimpleNamespace: app.* 설정들을 속성으로 접근 가능
+        ConfigNamespace: app.* 설정들을 속성으로 접근 가능
     
     Example:
         >>> app = get_app_config()
@@ -389,12 +509,12 @@ def get_app_config(redis_manager: Optional[RedisConfigManager] = None) -> Simple
     return get_category_config("app", redis_manager, as_namespace=True)
 
 
-def get_openai_config(redis_manager: Optional[RedisConfigManager] = None) -> SimpleNamespace:
+def get_openai_config(redis_manager: Optional[ConfigBackend] = None) -> ConfigNamespace:
     """
-    openai 카테고리 설정 가져오기 (SimpleNamespace)
+    openai 카테고리 설정 가져오기 (ConfigNamespace)
     
     Returns:
-        SimpleNamespace: openai.* 설정들을 속성으로 접근 가능
+        ConfigNamespace: openai.* 설정들을 속성으로 접근 가능
     
     Example:
         >>> openai = get_openai_config()
@@ -404,12 +524,12 @@ def get_openai_config(redis_manager: Optional[RedisConfigManager] = None) -> Sim
     return get_category_config("openai", redis_manager, as_namespace=True)
 
 
-def get_anthropic_config(redis_manager: Optional[RedisConfigManager] = None) -> SimpleNamespace:
+def get_anthropic_config(redis_manager: Optional[ConfigBackend] = None) -> ConfigNamespace:
     """
-    anthropic 카테고리 설정 가져오기 (SimpleNamespace)
+    anthropic 카테고리 설정 가져오기 (ConfigNamespace)
     
     Returns:
-        SimpleNamespace: anthropic.* 설정들을 속성으로 접근 가능
+        ConfigNamespace: anthropic.* 설정들을 속성으로 접근 가능
     
     Example:
         >>> anthropic = get_anthropic_config()
@@ -419,12 +539,12 @@ def get_anthropic_config(redis_manager: Optional[RedisConfigManager] = None) ->
     return get_category_config("anthropic", redis_manager, as_namespace=True)
 
 
-def get_vast_config(redis_manager: Optional[RedisConfigManager] = None) -> SimpleNamespace:
+def get_vast_config(redis_manager: Optional[ConfigBackend] = None) -> ConfigNamespace:
     """
-    vast 카테고리 설정 가져오기 (SimpleNamespace, 자동 언래핑)
+    vast 카테고리 설정 가져오기 (ConfigNamespace, 자동 언래핑)
     
     Returns:
-        SimpleNamespace: vast.* 설정들을 속성으로 접근 가능
+        ConfigNamespace: vast.* 설정들을 속성으로 접근 가능
         'vast' 래퍼 키가 있으면 자동으로 제거됨
     
     Example:
@@ -436,12 +556,12 @@ def get_vast_config(redis_manager: Optional[RedisConfigManager] = None) -> Simpl
     return get_category_config("vast", redis_manager, as_namespace=True)
 
 
-def get_vllm_config(redis_manager: Optional[RedisConfigManager] = None) -> SimpleNamespace:
+def get_vllm_config(redis_manager: Optional[ConfigBackend] = None) -> ConfigNamespace:
     """
-    vllm 카테고리 설정 가져오기 (SimpleNamespace)
+    vllm 카테고리 설정 가져오기 (ConfigNamespace)
     
     Returns:
-        SimpleNamespace: vllm.* 설정들을 속성으로 접근 가능
+        ConfigNamespace: vllm.* 설정들을 속성으로 접근 가능
     
     Example:
         >>> vllm = get_vllm_config()
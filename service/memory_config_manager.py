@@ -0,0 +1,143 @@
+"""
+Memory Config Manager
+
+프로세스 메모리에 설정을 저장하는 백엔드 (테스트, 단일 프로세스 임베디드 용도)
+"""
+import json
+import logging
+import threading
+from typing import Dict, Any, Optional, List, Set
+
+from service.config_backend import ConfigBackend
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryConfigManager(ConfigBackend):
+    """
+    메모리 기반 설정 관리자
+
+    Redis와 동일하게 설정 데이터를 JSON 문자열로 저장하므로
+    조회 결과를 수정해도 저장된 값에는 영향이 없습니다.
+    """
+
+    backend_name = "memory"
+
+    def __init__(self, initial_configs: Optional[List[Dict[str, Any]]] = None):
+        super().__init__()
+
+        # 키: config_path, 값: JSON 문자열
+        self._data: Dict[str, str] = {}
+        # 키: category, 값: config_path 집합
+        self._categories: Dict[str, Set[str]] = {}
+        # 키: category 또는 ALL_REVISION, 값: 변경 리비전
+        self._revisions: Dict[str, int] = {}
+        self._lock = threading.RLock()
+
+        for config in initial_configs or []:
+            self.set_config(
+                config_path=config['path'],
+                config_value=config.get('value'),
+                data_type=config.get('type', 'string'),
+                category=config.get('category')
+            )
+
+        logger.info("Memory Config Manager 초기화 완료")
+
+    # ========== Config 값 CRUD ==========
+
+    def set_config(self, config_path: str, config_value: Any,
+                   data_type: str = "string", category: Optional[str] = None) -> bool:
+        try:
+            category, encoded = self._encode_config(config_path, config_value, data_type, category)
+
+            with self._lock:
+                self._data[config_path] = encoded
+                self._categories.setdefault(category, set()).add(config_path)
+                self._bump_revision(category)
+
+            logger.debug(f"Config 저장 완료: {config_path} = {config_value}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Config 저장 실패: {config_path} - {str(e)}")
+            return False
+
+    def get_config(self, config_path: str) -> Optional[Dict[str, Any]]:
+        data = self._data.get(config_path)
+        if data:
+            return json.loads(data)
+        return None
+
+    def delete_config(self, config_path: str) -> bool:
+        category = config_path.split('.')[0]
+
+        with self._lock:
+            self._data.pop(config_path, None)
+            paths = self._categories.get(category)
+            if paths is not None:
+                paths.discard(config_path)
+                # Redis의 빈 set처럼 카테고리 인덱스도 사라짐
+                if not paths:
+                    del self._categories[category]
+            self._bump_revision(category)
+
+        logger.debug(f"Config 삭제 완료: {config_path}")
+        return True
+
+    def exists(self, config_path: str) -> bool:
+        return config_path in self._data
+
+    # ========== 카테고리 ==========
+
+    def get_category_configs(self, category: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            encoded = [self._data[path] for path in self._categories.get(category, ())
+                       if path in self._data]
+        return [json.loads(data) for data in encoded]
+
+    def get_all_configs(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            encoded = list(self._data.values())
+        return [json.loads(data) for data in encoded]
+
+    def clear_category(self, category: str) -> bool:
+        with self._lock:
+            for path in self._categories.pop(category, set()):
+                self._data.pop(path, None)
+            self._bump_revision(category)
+
+        logger.info(f"카테고리 '{category}' 전체 삭제 완료")
+        return True
+
+    def delete_prefix(self, prefix: str) -> int:
+        category = prefix.split('.')[0]
+        dotted = prefix + '.'
+
+        with self._lock:
+            paths = self._categories.get(category, set())
+            matched = [path for path in paths if prefix == category or path == prefix or path.startswith(dotted)]
+            for path in matched:
+                self._data.pop(path, None)
+                paths.discard(path)
+            if not paths:
+                self._categories.pop(category, None)
+            if matched:
+                self._bump_revision(category)
+
+        logger.info(f"접두사 '{prefix}' 하위 설정 삭제 완료 ({len(matched)}개)")
+        return len(matched)
+
+    def get_all_categories(self) -> List[str]:
+        with self._lock:
+            return sorted(self._categories.keys())
+
+    # ========== 리비전 ==========
+
+    def get_revision(self, category: Optional[str] = None) -> Optional[int]:
+        return self._revisions.get(category or self.ALL_REVISION, 0)
+
+    def _bump_revision(self, category: str):
+        """카테고리와 전체 리비전 증가 (self._lock 안에서 호출)"""
+        self._revisions[category] = self._revisions.get(category, 0) + 1
+        self._revisions[self.ALL_REVISION] = self._revisions.get(self.ALL_REVISION, 0) + 1
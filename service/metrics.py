@@ -0,0 +1,355 @@
+"""
+Config Metrics
+
+설정 핫패스 계측(지연 시간 히스토그램, 카운터, 게이지)과 Prometheus 텍스트 포맷 출력
+운영 환경에서 항상 켜 둘 수 있도록 외부 의존성 없이 관측 1회당 Lock 1회로 동작합니다.
+CONFIG_METRICS_ENABLED=false로 끌 수 있습니다.
+"""
+import os
+import time
+import bisect
+import functools
+import threading
+from typing import Dict, Tuple, List, Sequence, Optional, Callable
+
+# 지연 시간 히스토그램 기본 버킷 (초)
+DEFAULT_LATENCY_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+    0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+METRICS_ENABLED = os.getenv('CONFIG_METRICS_ENABLED', 'true').lower() in ('true', '1', 'yes', 'on')
+
+
+def _escape_label_value(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(labelnames: Sequence[str], labelvalues: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape_label_value(value)}"' for name, value in zip(labelnames, labelvalues)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class _Metric:
+    """라벨별 자식 값을 가지는 메트릭 공통 부모"""
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *labelvalues: str):
+        """라벨 값에 해당하는 자식 메트릭 반환 (없으면 생성)"""
+        if len(labelvalues) != len(self.labelnames):
+            raise ValueError(f"{self.name}: 라벨 개수가 일치하지 않습니다 ({self.labelnames})")
+        key = tuple(str(v) for v in labelvalues)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._new_child()
+                    self._children[key] = child
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        for labelvalues, child in sorted(self._children.items()):
+            lines.extend(child.render(self.name, self.labelnames, labelvalues))
+        return lines
+
+
+class _CounterChild:
+    __slots__ = ("_value", "_lock")
+
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        if not METRICS_ENABLED:
+            return
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def render(self, name, labelnames, labelvalues) -> List[str]:
+        return [f"{name}{_format_labels(labelnames, labelvalues)} {_format_value(self._value)}"]
+
+
+class _GaugeChild:
+    __slots__ = ("_value",)
+
+    def __init__(self):
+        self._value = 0.0
+
+    def set(self, value: float):
+        self._value = float(value)
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def render(self, name, labelnames, labelvalues) -> List[str]:
+        return [f"{name}{_format_labels(labelnames, labelvalues)} {_format_value(self._value)}"]
+
+
+class _HistogramChild:
+    __slots__ = ("_buckets", "_counts", "_sum", "_count", "_lock")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self._buckets = buckets
+        # 마지막 칸은 +Inf
+        self._counts = [0] * (len(buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        if not METRICS_ENABLED:
+            return
+        index = bisect.bisect_left(self._buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    def render(self, name, labelnames, labelvalues) -> List[str]:
+        with self._lock:
+            counts = list(self._counts)
+            total_sum = self._sum
+            total_count = self._count
+
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self._buckets + (float('inf'),), counts):
+            cumulative += count
+            labels = _format_labels(labelnames, labelvalues, f'le="{_format_value(bound)}"')
+            lines.append(f"{name}_bucket{labels} {cumulative}")
+        labels = _format_labels(labelnames, labelvalues)
+        lines.append(f"{name}_sum{labels} {_format_value(total_sum)}")
+        lines.append(f"{name}_count{labels} {total_count}")
+        return lines
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    metric_type = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+
+class Gauge(_Metric):
+    """현재 값을 나타내는 게이지"""
+
+    metric_type = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+
+class Histogram(_Metric):
+    """값 분포를 버킷으로 집계하는 히스토그램"""
+
+    metric_type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+
+class MetricsRegistry:
+    """메트릭 등록 및 Prometheus 텍스트 포맷 출력"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def register_collector(self, collector: Callable[[], None]):
+        """render 직전에 호출되어 게이지 값을 갱신하는 콜백 등록 (연결 풀 상태 등)"""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 포맷 (version 0.0.4) 문자열 생성"""
+        for collector in list(self._collectors):
+            try:
+                collector()
+            except Exception:
+                # 수집 실패가 /metrics 전체를 막지 않도록 무시
+                pass
+
+        lines = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].render())
+        return "\n".join(lines) + "\n"
+
+
+# 전역 메트릭 레지스트리
+metrics_registry = MetricsRegistry()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# ========== 설정 핫패스 메트릭 ==========
+
+CONFIG_OPERATION_SECONDS = metrics_registry.histogram(
+    "xgen_config_operation_seconds",
+    "Config backend operation latency in seconds (store round trips + decoding)",
+    ("backend", "operation"),
+)
+CONFIG_OPERATION_ERRORS = metrics_registry.counter(
+    "xgen_config_operation_errors_total",
+    "Config backend operations that failed and returned a default",
+    ("backend", "operation"),
+)
+CONFIG_JSON_DECODE_SECONDS = metrics_registry.histogram(
+    "xgen_config_json_decode_seconds",
+    "Time spent decoding stored config JSON payloads in seconds",
+    ("backend", "operation"),
+)
+CONFIG_NAMESPACE_SECONDS = metrics_registry.histogram(
+    "xgen_config_namespace_seconds",
+    "Time spent converting config dicts to attribute namespaces in seconds",
+    ("function",),
+)
+CONFIG_CACHE_REQUESTS = metrics_registry.counter(
+    "xgen_config_cache_requests_total",
+    "Config lookups by cache and result (hit or miss)",
+    ("cache", "result"),
+)
+CONFIG_REDIS_POOL_CONNECTIONS = metrics_registry.gauge(
+    "xgen_config_redis_pool_connections",
+    "Redis connection pool connections by state",
+    ("state",),
+)
+CONFIG_COMPOSER_LOAD_SECONDS = metrics_registry.gauge(
+    "xgen_config_composer_load_seconds",
+    "Time the ConfigComposer spent loading each config category on its last load",
+    ("category",),
+)
+CONFIG_CIRCUIT_STATE = metrics_registry.gauge(
+    "xgen_config_circuit_state",
+    "Config backend circuit breaker state (0=closed, 1=half_open, 2=open)",
+    ("backend",),
+)
+CONFIG_CIRCUIT_TRANSITIONS = metrics_registry.counter(
+    "xgen_config_circuit_transitions_total",
+    "Config backend circuit breaker state transitions by target state",
+    ("backend", "state"),
+)
+CONFIG_CIRCUIT_REJECTED = metrics_registry.counter(
+    "xgen_config_circuit_rejected_total",
+    "Config backend calls skipped because the circuit breaker was open",
+    ("backend",),
+)
+CONFIG_FALLBACK_READS = metrics_registry.counter(
+    "xgen_config_fallback_reads_total",
+    "Config reads served from last known good values after a backend failure",
+    ("backend", "operation"),
+)
+CONFIG_REDIS_READS = metrics_registry.counter(
+    "xgen_config_redis_reads_total",
+    "Redis config reads by route (replica or primary)",
+    ("route",),
+)
+CONFIG_REDIS_REPLICA_LATENCY = metrics_registry.gauge(
+    "xgen_config_redis_replica_latency_seconds",
+    "Smoothed read latency of each Redis read replica in seconds",
+    ("replica",),
+)
+
+
+def record_cache(cache: str, hit: bool):
+    """캐시 hit/miss 기록"""
+    CONFIG_CACHE_REQUESTS.labels(cache, "hit" if hit else "miss").inc()
+
+
+def timed(histogram: Histogram, *labelvalues: str):
+    """
+    함수 실행 시간을 히스토그램에 기록하는 데코레이터
+
+    Examples:
+        >>> @timed(CONFIG_NAMESPACE_SECONDS, "dict_to_namespace")
+        ... def convert(data): ...
+    """
+    child = histogram.labels(*labelvalues)
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                child.observe(time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def timed_async(histogram: Histogram, *labelvalues: str):
+    """코루틴 실행 시간을 히스토그램에 기록하는 데코레이터 (timed의 async 버전)"""
+    child = histogram.labels(*labelvalues)
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                child.observe(time.perf_counter() - start)
+        return wrapper
+    return decorator
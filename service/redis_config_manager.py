@@ -4,40 +4,288 @@ Redis Config Manager
 PostgreSQL 대신 Redis를 사용한 설정 관리 시스템
 """
 import os
+import copy
+import time
 import redis
 import json
 import logging
-from typing import Dict, Any, Optional, List
+import threading
+from typing import Dict, Any, Optional, List, Set, Tuple
+
+from service.config_backend import ConfigBackend
+from service.circuit_breaker import CircuitBreaker, CircuitOpenError, CLOSED
+from service.redis_key_scheme import create_key_scheme
+from service.redis_read_router import ReadReplicaRouter
+from service.metrics import (
+    CONFIG_CACHE_REQUESTS,
+    CONFIG_OPERATION_SECONDS,
+    CONFIG_OPERATION_ERRORS,
+    CONFIG_JSON_DECODE_SECONDS,
+    CONFIG_REDIS_POOL_CONNECTIONS,
+    CONFIG_CIRCUIT_REJECTED,
+    CONFIG_FALLBACK_READS,
+    CONFIG_REDIS_READS,
+    CONFIG_REDIS_REPLICA_LATENCY,
+    record_cache,
+    timed
+)
 
 logger = logging.getLogger(__name__)
 
+# MGET 한 번에 조회할 최대 키 수 (큰 요청이 Redis를 오래 점유하지 않도록 분할)
+MGET_CHUNK_SIZE = int(os.getenv('REDIS_MGET_CHUNK_SIZE', '500'))
+
+# 차단기 실패로 세는 예외 (서버가 응답한 ResponseError 등은 제외)
+REDIS_FAILURES = (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError, OSError)
+
+SUPPORTED_REDIS_MODES = ("standalone", "sentinel", "cluster")
+
+# 카테고리 스크립트 공통부: 인덱스에서 경로 접두사 하위 경로 선택
+# KEYS[1]: 카테고리 인덱스 키, ARGV: 값 키 접두사, 경로 접두사(빈 문자열이면 전체), 명령 분할 크기
+_SELECT_PATHS_LUA = """
+local paths = redis.call('SMEMBERS', KEYS[1])
+local key_prefix = ARGV[1]
+local path_prefix = ARGV[2]
+local chunk_size = tonumber(ARGV[3])
+
+local selected = paths
+if path_prefix ~= '' then
+    selected = {}
+    local dotted = path_prefix .. '.'
+    for _, path in ipairs(paths) do
+        if path == path_prefix or string.sub(path, 1, #dotted) == dotted then
+            selected[#selected + 1] = path
+        end
+    end
+end
+"""
+
+# 카테고리(또는 경로 접두사 하위)의 저장 값을 서버에서 모아 JSON 배열 문자열 하나로 반환
+# 저장 값은 이미 JSON이므로 서버는 이어 붙이기만 하고 디코딩은 클라이언트에서 한 번만 수행
+CATEGORY_PAYLOAD_SCRIPT = _SELECT_PATHS_LUA + """
+local values = {}
+for start = 1, #selected, chunk_size do
+    local keys = {}
+    for i = start, math.min(start + chunk_size - 1, #selected) do
+        keys[#keys + 1] = key_prefix .. selected[i]
+    end
+    for _, value in ipairs(redis.call('MGET', unpack(keys))) do
+        if value then
+            values[#values + 1] = value
+        end
+    end
+end
+
+return '[' .. table.concat(values, ',') .. ']'
+"""
+
+# 카테고리(또는 경로 접두사 하위)의 값 키와 인덱스 항목을 한 번에 삭제하고 삭제한 경로 수 반환
+# 큰 값도 서버를 막지 않도록 UNLINK(백그라운드 해제) 사용
+CATEGORY_DELETE_SCRIPT = _SELECT_PATHS_LUA + """
+for start = 1, #selected, chunk_size do
+    local keys = {}
+    local members = {}
+    for i = start, math.min(start + chunk_size - 1, #selected) do
+        keys[#keys + 1] = key_prefix .. selected[i]
+        members[#members + 1] = selected[i]
+    end
+    redis.call('UNLINK', unpack(keys))
+    if path_prefix ~= '' then
+        redis.call('SREM', KEYS[1], unpack(members))
+    end
+end
+
+if path_prefix == '' then
+    redis.call('UNLINK', KEYS[1])
+end
+
+return #selected
+"""
+
+
+def _parse_nodes(value: str, default_port: int) -> List[Tuple[str, int]]:
+    """"host1:port1,host2:port2" 형식의 노드 목록 파싱"""
+    nodes = []
+    for item in value.split(','):
+        item = item.strip()
+        if not item:
+            continue
+        host, _, port = item.rpartition(':') if ':' in item else (item, '', '')
+        nodes.append((host, int(port) if port else default_port))
+    return nodes
+
+
+def _connection_settings(host: Optional[str], port: Optional[int], db: Optional[int],
+                         password: Optional[str]) -> Tuple[str, int, int, Optional[str]]:
+    """환경 변수에서 Redis 연결 정보 읽기 (인자가 우선)"""
+    return (
+        host or os.getenv('REDIS_HOST', '192.168.2.242'),
+        port or int(os.getenv('REDIS_PORT', '6379')),
+        db or int(os.getenv('REDIS_DB', '0')),
+        password or os.getenv('REDIS_PASSWORD', 'redis_secure_password123!')
+    )
+
+
+def _socket_timeouts() -> Dict[str, float]:
+    # 타임아웃이 없으면 응답 없는 Redis에서 호출마다 TCP 타임아웃까지 대기하므로 기본값을 둠
+    return {
+        'socket_connect_timeout': float(os.getenv('REDIS_SOCKET_CONNECT_TIMEOUT', '2')),
+        'socket_timeout': float(os.getenv('REDIS_SOCKET_TIMEOUT', '2'))
+    }
+
+
+def _create_sentinel(host: str):
+    from redis.sentinel import Sentinel
+
+    timeouts = _socket_timeouts()
+    sentinels = _parse_nodes(os.getenv('REDIS_SENTINELS', ''), 26379) or [(host, 26379)]
+    sentinel_password = os.getenv('REDIS_SENTINEL_PASSWORD')
+    return Sentinel(
+        sentinels,
+        sentinel_kwargs={'password': sentinel_password, **timeouts} if sentinel_password else timeouts,
+        **timeouts
+    )
+
+
+def create_redis_client(mode: Optional[str] = None, host: Optional[str] = None, port: Optional[int] = None,
+                        db: Optional[int] = None, password: Optional[str] = None):
+    """
+    연결 모드(REDIS_MODE)에 맞는 Redis 클라이언트 생성
+
+    - standalone: REDIS_HOST, REDIS_PORT 단일 서버
+    - sentinel: REDIS_SENTINELS(host:port 목록)와 REDIS_SENTINEL_MASTER로 현재 마스터에 연결 (장애 조치 자동 추적)
+    - cluster: REDIS_CLUSTER_NODES(host:port 목록, 없으면 REDIS_HOST:REDIS_PORT)로 클러스터에 연결
+
+    Returns:
+        redis.Redis 또는 redis.cluster.RedisCluster (decode_responses=True)
+    """
+    mode = (mode or os.getenv('REDIS_MODE', 'standalone')).lower()
+    host, port, db, password = _connection_settings(host, port, db, password)
+    timeouts = _socket_timeouts()
+
+    if mode == "standalone":
+        return redis.Redis(host=host, port=port, db=db, password=password,
+                           decode_responses=True, **timeouts)
+
+    if mode == "sentinel":
+        return _create_sentinel(host).master_for(
+            os.getenv('REDIS_SENTINEL_MASTER', 'mymaster'),
+            db=db, password=password, decode_responses=True
+        )
+
+    if mode == "cluster":
+        from redis.cluster import RedisCluster, ClusterNode
+
+        nodes = _parse_nodes(os.getenv('REDIS_CLUSTER_NODES', ''), port) or [(host, port)]
+        return RedisCluster(
+            startup_nodes=[ClusterNode(node_host, node_port) for node_host, node_port in nodes],
+            password=password, decode_responses=True, **timeouts
+        )
 
-class RedisConfigManager:
+    raise ValueError(f"지원되지 않는 Redis 모드입니다: {mode} (지원: {', '.join(SUPPORTED_REDIS_MODES)})")
+
+
+def create_read_clients(mode: Optional[str] = None, host: Optional[str] = None,
+                        db: Optional[int] = None, password: Optional[str] = None) -> List[Tuple[str, Any]]:
+    """
+    읽기 전용 복제본 클라이언트 생성
+
+    - REDIS_READ_ENDPOINTS: "host:port,host:port" 형식의 복제본 목록
+    - REDIS_SENTINEL_READ_REPLICAS=true: sentinel 모드에서 sentinel이 알려주는 복제본 (slave_for)
+
+    Returns:
+        (이름, 클라이언트) 리스트 (설정이 없으면 빈 리스트)
+    """
+    mode = (mode or os.getenv('REDIS_MODE', 'standalone')).lower()
+    host, port, db, password = _connection_settings(host, None, db, password)
+    timeouts = _socket_timeouts()
+
+    clients = [
+        (f"{node_host}:{node_port}",
+         redis.Redis(host=node_host, port=node_port, db=db, password=password,
+                     decode_responses=True, **timeouts))
+        for node_host, node_port in _parse_nodes(os.getenv('REDIS_READ_ENDPOINTS', ''), port)
+    ]
+
+    if mode == "sentinel" and os.getenv('REDIS_SENTINEL_READ_REPLICAS', 'false').lower() in ('true', '1', 'yes', 'on'):
+        master_name = os.getenv('REDIS_SENTINEL_MASTER', 'mymaster')
+        clients.append((f"sentinel:{master_name}:replicas",
+                        _create_sentinel(host).slave_for(master_name, db=db, password=password,
+                                                         decode_responses=True)))
+
+    return clients
+
+
+class RedisConfigManager(ConfigBackend):
     """Redis를 사용한 설정 관리자"""
 
+    backend_name = "redis"
+
     def __init__(self, host: Optional[str] = None, port: Optional[int] = None,
-                 db: Optional[int] = None, password: Optional[str] = None):
-        # 환경 변수에서 Redis 연결 정보 읽기
-        host = host or os.getenv('REDIS_HOST', '192.168.2.242')
-        port = port or int(os.getenv('REDIS_PORT', '6379'))
-        db = db or int(os.getenv('REDIS_DB', '0'))
-        password = password or os.getenv('REDIS_PASSWORD', 'redis_secure_password123!')
-
-        self.redis_client = redis.Redis(
-            host=host,
-            port=port,
-            db=db,
-            password=password,
-            decode_responses=True
+                 db: Optional[int] = None, password: Optional[str] = None,
+                 redis_client: Optional[redis.Redis] = None,
+                 mode: Optional[str] = None, key_scheme: Optional[str] = None,
+                 read_clients: Optional[List[Tuple[str, Any]]] = None):
+        super().__init__()
+
+        # 연결 모드 (standalone, sentinel, cluster)
+        self.mode = (mode or os.getenv('REDIS_MODE', 'standalone')).lower()
+
+        # 외부에서 생성한 클라이언트(fakeredis 등)를 주입할 수 있음 (decode_responses=True 필요)
+        self.redis_client = redis_client or create_redis_client(self.mode, host, port, db, password)
+
+        # 키 구조 (cluster는 카테고리 키가 같은 슬롯에 있어야 하므로 hashtag 필수)
+        self.key_scheme = create_key_scheme(key_scheme)
+        if self.mode == "cluster" and not self.key_scheme.hash_tags:
+            logger.warning("Redis cluster 모드는 hashtag 키 구조가 필요하므로 REDIS_KEY_SCHEME=hashtag로 동작합니다")
+            self.key_scheme = create_key_scheme("hashtag")
+
+        # cluster 파이프라인은 MULTI를 쓸 수 없으므로 노드별 비트랜잭션 파이프라인으로 보냄
+        self._transaction = self.mode != "cluster"
+
+        # 읽기 복제본 (없으면 모든 조회를 primary로, cluster는 클라이언트가 노드를 직접 고름)
+        if read_clients is None and redis_client is None and self.mode != "cluster":
+            read_clients = create_read_clients(self.mode, host, db, password)
+        self.read_router = ReadReplicaRouter(
+            read_clients,
+            strategy=os.getenv('REDIS_READ_STRATEGY', 'round_robin').lower(),
+            failure_cooldown=float(os.getenv('REDIS_READ_FAILURE_COOLDOWN', '5'))
+        ) if read_clients else None
+
+        # 쓰기 직후 같은 카테고리 조회는 잠시 primary로 (복제 지연 동안 이전 값을 읽지 않도록, 0이면 사용 안 함)
+        self.read_your_writes_window = float(os.getenv('REDIS_READ_YOUR_WRITES_WINDOW', '0'))
+        self._recent_writes: Dict[str, float] = {}
+
+        # 연속 실패 시 Redis 호출을 차단하고 마지막 정상 값으로 응답
+        self.circuit_breaker_enabled = os.getenv('REDIS_CIRCUIT_ENABLED', 'true').lower() in ('true', '1', 'yes', 'on')
+        self.circuit_breaker = CircuitBreaker(
+            self.backend_name,
+            failure_threshold=int(os.getenv('REDIS_CIRCUIT_FAILURE_THRESHOLD', '5')),
+            reset_timeout=float(os.getenv('REDIS_CIRCUIT_RESET_TIMEOUT', '10'))
         )
 
+        # 마지막 정상 값 (키: config_path, 값: JSON 문자열 또는 일괄 조회로 디코딩된 dict)과 카테고리 인덱스
+        self._last_good: Dict[str, Any] = {}
+        self._last_good_categories: Dict[str, Set[str]] = {}
+        self._last_good_lock = threading.Lock()
+
         # Config 키 Prefix
-        self.config_prefix = "config"
+        self.config_prefix = self.key_scheme.prefix
+
+        # 전체(및 legacy 구조의 카테고리) 변경 리비전 해시
+        self.revision_key = self.key_scheme.revision_key
+
+        # 카테고리/접두사 조회를 서버 측 스크립트 한 번으로 처리 (EVAL이 막힌 환경이면 파이프라인 조회로 전환)
+        self.lua_reads = os.getenv('REDIS_LUA_READS', 'true').lower() in ('true', '1', 'yes', 'on')
+        self._category_script = self.redis_client.register_script(CATEGORY_PAYLOAD_SCRIPT)
+        self._delete_script = self.redis_client.register_script(CATEGORY_DELETE_SCRIPT)
+        self._lua_deletes = True
 
-        logger.info(f"Redis Config Manager 초기화 완료: {host}:{port}")
+        logger.info(f"Redis Config Manager 초기화 완료 (mode: {self.mode}, key scheme: {self.key_scheme.name})")
 
     # ========== Config 값 CRUD ==========
 
+    @timed(CONFIG_OPERATION_SECONDS, "redis", "set_config")
     def set_config(self, config_path: str, config_value: Any,
                    data_type: str = "string", category: Optional[str] = None) -> bool:
         """
@@ -53,33 +301,34 @@ class RedisConfigManager:
             bool: 성공 여부
         """
         try:
-            # 카테고리 자동 추출 (config_path의 첫 번째 부분)
-            if not category:
-                category = config_path.split('.')[0]
-
-            # 설정 값과 메타데이터를 JSON으로 저장
-            config_data = {
-                'value': config_value,
-                'type': data_type,
-                'category': category,
-                'path': config_path
-            }
+            # 설정 값과 메타데이터를 JSON으로 저장 (카테고리는 config_path의 첫 번째 부분으로 자동 추출)
+            category, encoded = self._encode_config(config_path, config_value, data_type, category)
 
-            # Redis에 저장 (키: config:path)
-            redis_key = f"{self.config_prefix}:{config_path}"
-            self.redis_client.set(redis_key, json.dumps(config_data))
+            redis_key = self.key_scheme.value_key(config_path)
+            category_key = self.key_scheme.index_key(category)
 
+            pipe = self.redis_client.pipeline(transaction=self._transaction)
+            # Redis에 저장 (키: config:path)
+            pipe.set(redis_key, encoded)
             # 카테고리별 인덱스도 저장 (키: config:category:name)
-            category_key = f"{self.config_prefix}:category:{category}"
-            self.redis_client.sadd(category_key, config_path)
+            pipe.sadd(category_key, config_path)
+            # 카테고리 목록 등록 (hashtag 구조)
+            if self.key_scheme.categories_key:
+                pipe.sadd(self.key_scheme.categories_key, category)
+            # 트리 캐시 무효화를 위한 리비전 증가
+            self._bump_revision(pipe, category)
+            self._execute(pipe.execute)
+            self._note_write(category)
+            self._remember(config_path, encoded, category)
 
             logger.debug(f"Config 저장 완료: {config_path} = {config_value}")
             return True
 
         except Exception as e:
-            logger.error(f"Config 저장 실패: {config_path} - {str(e)}")
+            self._record_error("set_config", f"Config 저장 실패: {config_path}", e)
             return False
 
+    @timed(CONFIG_OPERATION_SECONDS, "redis", "get_config_value")
     def get_config_value(self, config_path: str, default: Any = None) -> Any:
         """
         설정 값만 조회
@@ -92,18 +341,76 @@ class RedisConfigManager:
             설정 값 또는 기본값
         """
         try:
-            redis_key = f"{self.config_prefix}:{config_path}"
-            data = self.redis_client.get(redis_key)
+            redis_key = self.key_scheme.value_key(config_path)
+            data = self._read(config_path.split('.')[0], lambda client: client.get(redis_key))
+            record_cache(self.backend_name, bool(data))
+            self._remember(config_path, data)
 
             if data:
-                config_data = json.loads(data)
+                config_data = self._decode(data, "get_config_value")
                 return config_data.get('value', default)
             return default
 
         except Exception as e:
-            logger.error(f"Config 조회 실패: {config_path} - {str(e)}")
+            data = self._last_good_value(config_path, "get_config_value")
+            if data is not None:
+                return self._restore(data).get('value', default)
+            self._record_error("get_config_value", f"Config 조회 실패: {config_path}", e)
             return default
 
+    @timed(CONFIG_OPERATION_SECONDS, "redis", "get_config_values")
+    def get_config_values(self, config_paths: List[str],
+                          defaults: Optional[Dict[str, Any]] = None,
+                          default: Any = None) -> Dict[str, Any]:
+        """
+        여러 설정 값을 MGET으로 한 번에 조회
+
+        경로가 많으면 MGET_CHUNK_SIZE 단위로 나누되 모든 MGET을 하나의 파이프라인으로 보내
+        왕복은 한 번만 발생합니다.
+
+        Args:
+            config_paths: 설정 경로 리스트
+            defaults: 경로별 기본값 {config_path: default}
+            default: defaults에 없는 경로의 기본값
+
+        Returns:
+            Dict: {config_path: value} (없거나 조회에 실패한 경로는 기본값)
+        """
+        defaults = defaults or {}
+        paths = list(dict.fromkeys(config_paths))
+        result = {path: defaults.get(path, default) for path in paths}
+        if not paths:
+            return result
+
+        try:
+            values = self._read({path.split('.')[0] for path in paths},
+                                lambda client: self._mget_paths(paths, client))
+
+            hits = 0
+            for path, data in zip(paths, values):
+                self._remember(path, data)
+                if data:
+                    hits += 1
+                    config_data = self._decode(data, "get_config_values")
+                    result[path] = config_data.get('value', result[path])
+            CONFIG_CACHE_REQUESTS.labels(self.backend_name, "hit").inc(hits)
+            CONFIG_CACHE_REQUESTS.labels(self.backend_name, "miss").inc(len(paths) - hits)
+
+            return result
+
+        except Exception as e:
+            served = 0
+            for path in paths:
+                data = self._last_good.get(path)
+                if data is not None:
+                    served += 1
+                    result[path] = self._restore(data).get('value', result[path])
+            if served:
+                CONFIG_FALLBACK_READS.labels(self.backend_name, "get_config_values").inc()
+            self._record_error("get_config_values", f"Config 다중 조회 실패: {len(paths)}개 경로", e)
+            return result
+
+    @timed(CONFIG_OPERATION_SECONDS, "redis", "get_config")
     def get_config(self, config_path: str) -> Optional[Dict[str, Any]]:
         """
         설정 값과 메타데이터 조회
@@ -115,17 +422,23 @@ class RedisConfigManager:
             설정 데이터 (value, type, category, path)
         """
         try:
-            redis_key = f"{self.config_prefix}:{config_path}"
-            data = self.redis_client.get(redis_key)
+            redis_key = self.key_scheme.value_key(config_path)
+            data = self._read(config_path.split('.')[0], lambda client: client.get(redis_key))
+            record_cache(self.backend_name, bool(data))
+            self._remember(config_path, data)
 
             if data:
-                return json.loads(data)
+                return self._decode(data, "get_config")
             return None
 
         except Exception as e:
-            logger.error(f"Config 조회 실패: {config_path} - {str(e)}")
+            data = self._last_good_value(config_path, "get_config")
+            if data is not None:
+                return self._restore(data)
+            self._record_error("get_config", f"Config 조회 실패: {config_path}", e)
             return None
 
+    @timed(CONFIG_OPERATION_SECONDS, "redis", "delete_config")
     def delete_config(self, config_path: str) -> bool:
         """
         설정 삭제
@@ -140,21 +453,27 @@ class RedisConfigManager:
             # 카테고리 추출
             category = config_path.split('.')[0]
 
-            # Redis에서 삭제
-            redis_key = f"{self.config_prefix}:{config_path}"
-            self.redis_client.delete(redis_key)
+            redis_key = self.key_scheme.value_key(config_path)
+            category_key = self.key_scheme.index_key(category)
 
+            pipe = self.redis_client.pipeline(transaction=self._transaction)
+            # Redis에서 삭제
+            pipe.delete(redis_key)
             # 카테고리 인덱스에서도 제거
-            category_key = f"{self.config_prefix}:category:{category}"
-            self.redis_client.srem(category_key, config_path)
+            pipe.srem(category_key, config_path)
+            self._bump_revision(pipe, category)
+            self._execute(pipe.execute)
+            self._note_write(category)
+            self._remember(config_path, None)
 
             logger.debug(f"Config 삭제 완료: {config_path}")
             return True
 
         except Exception as e:
-            logger.error(f"Config 삭제 실패: {config_path} - {str(e)}")
+            self._record_error("delete_config", f"Config 삭제 실패: {config_path}", e)
             return False
 
+    @timed(CONFIG_OPERATION_SECONDS, "redis", "get_category_configs")
     def get_category_configs(self, category: str) -> List[Dict[str, Any]]:
         """
         특정 카테고리의 모든 설정 조회 (리스트 형태)
@@ -166,57 +485,16 @@ class RedisConfigManager:
             설정 리스트
         """
         try:
-            category_key = f"{self.config_prefix}:category:{category}"
-            config_paths = self.redis_client.smembers(category_key)
-
-            configs = []
-            for path in config_paths:
-                config = self.get_config(path)
-                if config:
-                    configs.append(config)
-
-            return configs
+            return self._load_category_configs(category)
 
         except Exception as e:
-            logger.error(f"카테고리 Config 조회 실패: {category} - {str(e)}")
+            fallback = self._last_known_configs(category)
+            if fallback is not None:
+                return fallback
+            self._record_error("get_category_configs", f"카테고리 Config 조회 실패: {category}", e)
             return []
 
-    def get_category_configs_nested(self, category: str) -> Dict[str, Any]:
-        """
-        특정 카테고리의 모든 설정 조회 (중첩 딕셔너리 형태)
-
-        Args:
-            category: 카테고리 이름
-
-        Returns:
-            중첩된 딕셔너리 형태의 설정
-            예: {"openai": {"api_key": "...", "model": "..."}}
-        """
-        try:
-            configs = self.get_category_configs(category)
-            result = {}
-
-            for config in configs:
-                path = config['path']
-                value = config['value']
-
-                # 경로를 '.'로 분리하여 중첩 딕셔너리 생성
-                keys = path.split('.')
-                current = result
-
-                for key in keys[:-1]:
-                    if key not in current:
-                        current[key] = {}
-                    current = current[key]
-
-                current[keys[-1]] = value
-
-            return result
-
-        except Exception as e:
-            logger.error(f"카테고리 중첩 Config 조회 실패: {category} - {str(e)}")
-            return {}
-
+    @timed(CONFIG_OPERATION_SECONDS, "redis", "get_all_configs")
     def get_all_configs(self) -> List[Dict[str, Any]]:
         """
         모든 설정 조회
@@ -225,24 +503,16 @@ class RedisConfigManager:
             모든 설정 리스트
         """
         try:
-            # config:* 패턴으로 모든 설정 키 검색
-            pattern = f"{self.config_prefix}:*"
-            keys = self.redis_client.keys(pattern)
-
-            configs = []
-            for key in keys:
-                # category 인덱스 키는 제외
-                if ':category:' not in key:
-                    data = self.redis_client.get(key)
-                    if data:
-                        configs.append(json.loads(data))
-
-            return configs
+            return self._load_all_configs()
 
         except Exception as e:
-            logger.error(f"전체 Config 조회 실패: {str(e)}")
+            fallback = self._last_known_configs()
+            if fallback is not None:
+                return fallback
+            self._record_error("get_all_configs", "전체 Config 조회 실패", e)
             return []
 
+    @timed(CONFIG_OPERATION_SECONDS, "redis", "clear_category")
     def clear_category(self, category: str) -> bool:
         """
         특정 카테고리의 모든 설정 삭제
@@ -254,23 +524,112 @@ class RedisConfigManager:
             bool: 성공 여부
         """
         try:
-            category_key = f"{self.config_prefix}:category:{category}"
-            config_paths = self.redis_client.smembers(category_key)
+            deleted = self._delete_paths(category, "")
+            self._forget(category)
 
-            # 각 설정 삭제
-            for path in config_paths:
-                self.delete_config(path)
-
-            # 카테고리 인덱스도 삭제
-            self.redis_client.delete(category_key)
-
-            logger.info(f"카테고리 '{category}' 전체 삭제 완료")
+            logger.info(f"카테고리 '{category}' 전체 삭제 완료 ({deleted}개)")
             return True
 
         except Exception as e:
-            logger.error(f"카테고리 삭제 실패: {category} - {str(e)}")
+            self._record_error("clear_category", f"카테고리 삭제 실패: {category}", e)
             return False
 
+    @timed(CONFIG_OPERATION_SECONDS, "redis", "delete_prefix")
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        경로 접두사 하위의 설정을 한 번에 삭제
+
+        Args:
+            prefix: 설정 경로 접두사 (예: "vast.vllm", 카테고리 이름이면 clear_category와 같음)
+
+        Returns:
+            int: 삭제한 설정 수 (실패 시 0)
+        """
+        category = prefix.split('.')[0]
+        # 카테고리 이름이면 인덱스와 카테고리 목록까지 정리
+        subtree = "" if prefix == category else prefix
+
+        try:
+            deleted = self._delete_paths(category, subtree)
+            self._forget(category, subtree)
+
+            logger.info(f"접두사 '{prefix}' 하위 설정 삭제 완료 ({deleted}개)")
+            return deleted
+
+        except Exception as e:
+            self._record_error("delete_prefix", f"접두사 삭제 실패: {prefix}", e)
+            return 0
+
+    def _delete_paths(self, category: str, prefix: str) -> int:
+        """
+        카테고리(prefix가 빈 문자열이면 전체) 또는 접두사 하위 설정 삭제
+
+        삭제, 카테고리 목록 정리, 리비전 증가(무효화)를 하나의 MULTI로 보내
+        리비전은 카테고리당 한 번만 증가하고 중간에 실패해도 일부만 지워지지 않습니다 (cluster는 슬롯별 원자성).
+        스크립트를 사용할 수 없는 서버면 SMEMBERS 후 UNLINK 파이프라인으로 삭제합니다.
+        """
+        category_key = self.key_scheme.index_key(category)
+        args = [self.key_scheme.value_key_prefix(category), prefix, MGET_CHUNK_SIZE]
+
+        while True:
+            pipe = self.redis_client.pipeline(transaction=self._transaction)
+            deleted = None
+            if self._lua_deletes and not self._transaction:
+                # cluster: 스크립트(카테고리 슬롯)는 단독 실행, 전체 리비전 등 다른 슬롯 키는 뒤의 파이프라인으로
+                try:
+                    deleted = self._execute(self._delete_script, keys=[category_key], args=args)
+                except redis.exceptions.ResponseError as e:
+                    self._disable_lua_deletes(e)
+                    continue
+            elif self._lua_deletes:
+                self._delete_script(keys=[category_key], args=args, client=pipe)
+            else:
+                config_paths = list(self._execute(self.redis_client.smembers, category_key))
+                if prefix:
+                    dotted = prefix + '.'
+                    config_paths = [path for path in config_paths if path == prefix or path.startswith(dotted)]
+                for start in range(0, len(config_paths), MGET_CHUNK_SIZE):
+                    chunk = config_paths[start:start + MGET_CHUNK_SIZE]
+                    pipe.unlink(*[self.key_scheme.value_key(path) for path in chunk])
+                    if prefix:
+                        pipe.srem(category_key, *chunk)
+                if not prefix:
+                    pipe.unlink(category_key)
+                deleted = len(config_paths)
+            if not prefix and self.key_scheme.categories_key:
+                pipe.srem(self.key_scheme.categories_key, category)
+            self._bump_revision(pipe, category)
+
+            try:
+                results = self._execute(pipe.execute)
+            except redis.exceptions.ResponseError as e:
+                if not self._lua_deletes or deleted is not None:
+                    raise
+                self._disable_lua_deletes(e)
+                continue
+
+            self._note_write(category)
+            return results[0] if deleted is None else deleted
+
+    def _disable_lua_deletes(self, error: Exception):
+        self._lua_deletes = False
+        logger.warning(f"Redis 스크립트 삭제를 사용할 수 없어 파이프라인 삭제로 전환합니다 - {str(error)}")
+
+    def _forget(self, category: str, prefix: str = ""):
+        """삭제한 카테고리(또는 접두사 하위)의 마지막 정상 값 제거"""
+        with self._last_good_lock:
+            if not prefix:
+                for path in self._last_good_categories.pop(category, ()):
+                    self._last_good.pop(path, None)
+                return
+
+            dotted = prefix + '.'
+            paths = self._last_good_categories.get(category, set())
+            for path in [path for path in paths if path == prefix or path.startswith(dotted)]:
+                paths.discard(path)
+                self._last_good.pop(path, None)
+
+    @timed(CONFIG_OPERATION_SECONDS, "redis", "exists")
     def exists(self, config_path: str) -> bool:
         """
         설정 존재 여부 확인
@@ -282,13 +641,16 @@ class RedisConfigManager:
             bool: 존재 여부
         """
         try:
-            redis_key = f"{self.config_prefix}:{config_path}"
-            return self.redis_client.exists(redis_key) > 0
+            redis_key = self.key_scheme.value_key(config_path)
+            return self._read(config_path.split('.')[0], lambda client: client.exists(redis_key)) > 0
 
         except Exception as e:
-            logger.error(f"Config 존재 확인 실패: {config_path} - {str(e)}")
+            if self._last_good_value(config_path, "exists") is not None:
+                return True
+            self._record_error("exists", f"Config 존재 확인 실패: {config_path}", e)
             return False
 
+    @timed(CONFIG_OPERATION_SECONDS, "redis", "get_all_categories")
     def get_all_categories(self) -> List[str]:
         """
         모든 카테고리 목록 조회
@@ -297,13 +659,415 @@ class RedisConfigManager:
             카테고리 목록
         """
         try:
-            pattern = f"{self.config_prefix}:category:*"
-            keys = self.redis_client.keys(pattern)
+            return sorted(self._read(None, self._list_categories))
+
+        except Exception as e:
+            if self._last_good_categories:
+                CONFIG_FALLBACK_READS.labels(self.backend_name, "get_all_categories").inc()
+                return sorted(self._last_good_categories)
+            self._record_error("get_all_categories", "카테고리 목록 조회 실패", e)
+            return []
 
+    def _list_categories(self, client) -> List[str]:
+        """카테고리 목록 (legacy: 인덱스 키 패턴, hashtag: 등록 집합 중 인덱스가 남아 있는 것)"""
+        if not self.key_scheme.categories_key:
+            keys = client.keys(self.key_scheme.index_pattern())
             # 카테고리 이름만 추출
-            categories = [key.split(':')[-1] for key in keys]
-            return sorted(categories)
+            return [self.key_scheme.category_from_index_key(key) for key in keys]
+
+        categories = sorted(client.smembers(self.key_scheme.categories_key))
+        pipe = client.pipeline(transaction=False)
+        for category in categories:
+            pipe.exists(self.key_scheme.index_key(category))
+        exists = pipe.execute()
+        return [category for category, found in zip(categories, exists) if found]
+
+    def _mget_paths(self, paths: List[str], client) -> List[Optional[str]]:
+        """
+        경로 목록의 저장 값을 하나의 파이프라인으로 조회 (paths 순서대로 반환)
+
+        MGET_CHUNK_SIZE 단위로 나누고, hashtag 구조에서는 카테고리(슬롯)별로 묶어
+        cluster에서도 MGET 하나가 한 슬롯만 다루도록 합니다.
+        """
+        if not paths:
+            return []
+
+        if self.key_scheme.hash_tags:
+            groups: Dict[str, List[str]] = {}
+            for path in paths:
+                groups.setdefault(path.split('.')[0], []).append(path)
+            grouped = list(groups.values())
+        else:
+            grouped = [paths]
+
+        ordered = []
+        pipe = client.pipeline(transaction=False)
+        for group in grouped:
+            for start in range(0, len(group), MGET_CHUNK_SIZE):
+                chunk = group[start:start + MGET_CHUNK_SIZE]
+                ordered.extend(chunk)
+                pipe.mget([self.key_scheme.value_key(path) for path in chunk])
+
+        values = dict(zip(ordered, (value for chunk in pipe.execute() for value in chunk)))
+        return [values[path] for path in paths]
+
+    def _fetch_category(self, client, category: str) -> Tuple[List[str], List[Optional[str]]]:
+        """카테고리 인덱스와 저장 값 조회 (경로, 값)"""
+        config_paths = list(client.smembers(self.key_scheme.index_key(category)))
+        return config_paths, self._mget_paths(config_paths, client)
+
+    def _fetch_all_values(self, client) -> List[Optional[str]]:
+        """모든 설정의 저장 값 조회"""
+        if self.key_scheme.categories_key:
+            # 등록된 카테고리 인덱스로 경로를 모은 뒤 카테고리별 MGET (KEYS 없음)
+            category_names = list(client.smembers(self.key_scheme.categories_key))
+            pipe = client.pipeline(transaction=False)
+            for category in category_names:
+                pipe.smembers(self.key_scheme.index_key(category))
+            paths = [path for members in pipe.execute() for path in members]
+            return self._mget_paths(paths, client)
+
+        # config:* 패턴으로 모든 설정 키 검색 (category 인덱스 키, hashtag 구조 키는 제외)
+        keys = [key for key in client.keys(f"{self.config_prefix}:*")
+                if ':category:' not in key and not key.startswith(f"{self.config_prefix}:{{")]
+        pipe = client.pipeline(transaction=False)
+        for start in range(0, len(keys), MGET_CHUNK_SIZE):
+            pipe.mget(keys[start:start + MGET_CHUNK_SIZE])
+        return [value for chunk in pipe.execute() for value in chunk]
+
+    def _fetch_payload(self, client, category: str, prefix: str, operation: str) -> List[Dict[str, Any]]:
+        """CATEGORY_PAYLOAD_SCRIPT로 카테고리(또는 접두사 하위) 설정을 한 번에 조회"""
+        payload = self._category_script(
+            keys=[self.key_scheme.index_key(category)],
+            args=[self.key_scheme.value_key_prefix(category), prefix, MGET_CHUNK_SIZE],
+            client=client
+        )
+        return self._decode(payload, operation)
+
+    def _read_payload(self, category: str, prefix: str, operation: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        서버 측 스크립트로 일괄 조회 (사용할 수 없으면 None)
+
+        EVAL이 금지되었거나 스크립트를 실행할 수 없는 서버(ResponseError)면
+        이후 조회는 파이프라인 방식으로 전환합니다.
+        """
+        if not self.lua_reads:
+            return None
+        try:
+            return self._read(category, lambda client: self._fetch_payload(client, category, prefix, operation))
+        except redis.exceptions.ResponseError as e:
+            self.lua_reads = False
+            logger.warning(f"Redis 스크립트 조회를 사용할 수 없어 파이프라인 조회로 전환합니다 - {str(e)}")
+            return None
+
+    def _load_category_configs(self, category: str) -> List[Dict[str, Any]]:
+        configs = self._read_payload(category, "", "get_category_configs")
+        if configs is not None:
+            encoded = {config['path']: config for config in configs}
+        else:
+            config_paths, values = self._read(category, lambda client: self._fetch_category(client, category))
+
+            configs = []
+            encoded = {}
+            for path, data in zip(config_paths, values):
+                if data:
+                    encoded[path] = data
+                    configs.append(self._decode(data, "get_category_configs"))
+
+        with self._last_good_lock:
+            for path in self._last_good_categories.get(category, ()):
+                self._last_good.pop(path, None)
+            self._last_good.update(encoded)
+            self._last_good_categories[category] = set(encoded)
+
+        return configs
+
+    def _load_all_configs(self) -> List[Dict[str, Any]]:
+        values = self._read(None, self._fetch_all_values)
+
+        configs = []
+        encoded = {}
+        categories: Dict[str, Set[str]] = {}
+        for data in values:
+            if data:
+                config_data = self._decode(data, "get_all_configs")
+                encoded[config_data['path']] = data
+                categories.setdefault(config_data['category'], set()).add(config_data['path'])
+                configs.append(config_data)
+
+        with self._last_good_lock:
+            self._last_good = encoded
+            self._last_good_categories = categories
+
+        return configs
+
+    @timed(CONFIG_OPERATION_SECONDS, "redis", "get_prefix_configs")
+    def get_prefix_configs(self, prefix: str) -> List[Dict[str, Any]]:
+        """
+        경로 접두사 하위의 설정 조회 (리스트 형태)
+
+        서버 측 스크립트가 카테고리 인덱스를 접두사로 걸러 한 번의 호출로 반환합니다.
+
+        Args:
+            prefix: 설정 경로 접두사 (예: "vast.vllm")
+
+        Returns:
+            설정 리스트
+        """
+        try:
+            return self._load_prefix_configs(prefix)
 
         except Exception as e:
-            logger.error(f"카테고리 목록 조회 실패: {str(e)}")
+            fallback = self._last_known_configs(prefix.split('.')[0])
+            if fallback is not None:
+                dotted = prefix + '.'
+                return [config for config in fallback
+                        if config['path'] == prefix or config['path'].startswith(dotted)]
+            self._record_error("get_prefix_configs", f"접두사 Config 조회 실패: {prefix}", e)
             return []
+
+    def _load_prefix_configs(self, prefix: str) -> List[Dict[str, Any]]:
+        category = prefix.split('.')[0]
+        if prefix == category:
+            return self._load_category_configs(category)
+
+        configs = self._read_payload(category, prefix, "get_prefix_configs")
+        if configs is not None:
+            return configs
+
+        dotted = prefix + '.'
+        return [config for config in self._load_category_configs(category)
+                if config['path'] == prefix or config['path'].startswith(dotted)]
+
+    # ========== 리비전 ==========
+
+    @timed(CONFIG_OPERATION_SECONDS, "redis", "get_revision")
+    def get_revision(self, category: Optional[str] = None) -> Optional[int]:
+        """
+        카테고리(생략 시 전체)의 변경 리비전 조회
+
+        이 클래스를 거치지 않고 Redis를 직접 수정한 경우에는 리비전이 증가하지 않으므로
+        트리 캐시가 갱신되지 않습니다.
+        """
+        try:
+            revision = self._read(
+                category, lambda client: self.key_scheme.get_revision(client, category, self.ALL_REVISION)
+            )
+            return int(revision) if revision else 0
+
+        except Exception as e:
+            self._record_error("get_revision", f"리비전 조회 실패: {category}", e)
+            return None
+
+    def _bump_revision(self, pipe, category: str):
+        """파이프라인에 카테고리와 전체 리비전 증가 명령 추가"""
+        self.key_scheme.bump_revision(pipe, category, self.ALL_REVISION)
+
+    def migrate_key_scheme(self, source: Optional[str] = "legacy") -> int:
+        """
+        다른 키 구조로 저장된 설정을 현재 키 구조로 복사 (기존 키는 유지)
+
+        Args:
+            source: 원본 키 구조 이름 (기본값: legacy)
+
+        Returns:
+            int: 복사한 설정 수
+        """
+        source_scheme = create_key_scheme(source, self.config_prefix)
+        if source_scheme.name == self.key_scheme.name:
+            return 0
+
+        previous, self.key_scheme = self.key_scheme, source_scheme
+        try:
+            configs = self._load_all_configs()
+        finally:
+            self.key_scheme = previous
+
+        for config in configs:
+            self.set_config(config['path'], config['value'], config.get('type', 'string'), config.get('category'))
+
+        logger.info(f"키 구조 이전 완료: {source_scheme.name} -> {self.key_scheme.name} ({len(configs)}개)")
+        return len(configs)
+
+    def close(self):
+        """Redis 연결 종료"""
+        self.redis_client.close()
+        if self.read_router is not None:
+            self.read_router.close()
+
+    # ========== 읽기 라우팅 ==========
+
+    def _read(self, category, operation):
+        """
+        조회 명령을 복제본 또는 primary에서 실행
+
+        복제본이 있고 해당 카테고리에 최근 쓰기가 없으면 복제본을 사용하며,
+        복제본이 실패하면 잠시 제외하고 primary(차단기 경유)로 다시 실행합니다.
+
+        Args:
+            category: 조회 대상 카테고리 (여러 개면 집합, 전체면 None)
+            operation: 클라이언트를 받아 명령을 실행하는 함수
+        """
+        if self.read_router is not None and not self._recently_written(category):
+            endpoint = self.read_router.choose()
+            if endpoint is not None:
+                start = time.perf_counter()
+                try:
+                    result = operation(endpoint.client)
+                except REDIS_FAILURES as e:
+                    self.read_router.mark_failed(endpoint)
+                    logger.warning(f"Redis 복제본 조회 실패, primary로 재시도: {endpoint.name} - {str(e)}")
+                else:
+                    self.read_router.observe(endpoint, time.perf_counter() - start)
+                    CONFIG_REDIS_READS.labels("replica").inc()
+                    return result
+
+        CONFIG_REDIS_READS.labels("primary").inc()
+        return self._execute(operation, self.redis_client)
+
+    def _note_write(self, category: str):
+        """
+        read-your-writes 구간 시작
+
+        이 관리자 인스턴스(프로세스) 기준이므로 다른 워커가 쓴 값은 복제 지연만큼 늦게 보일 수 있습니다.
+        """
+        if self.read_your_writes_window > 0:
+            self._recent_writes[category] = time.monotonic() + self.read_your_writes_window
+
+    def _recently_written(self, category) -> bool:
+        """카테고리(None이면 전체)에 read-your-writes 구간이 남아 있는지 확인"""
+        if not self._recent_writes:
+            return False
+
+        now = time.monotonic()
+        if category is None:
+            categories = list(self._recent_writes)
+        elif isinstance(category, str):
+            categories = [category]
+        else:
+            categories = category
+
+        recent = False
+        for name in categories:
+            deadline = self._recent_writes.get(name)
+            if deadline is None:
+                continue
+            if deadline > now:
+                recent = True
+            else:
+                self._recent_writes.pop(name, None)
+        return recent
+
+    # ========== 차단기 / 마지막 정상 값 ==========
+
+    def _execute(self, func, *args, **kwargs):
+        """
+        차단기를 거쳐 Redis 명령 실행
+
+        차단기가 열려 있으면 네트워크 호출 없이 CircuitOpenError를 던지고,
+        연결/타임아웃 오류만 실패로 기록합니다 (서버가 응답한 오류는 성공으로 봄).
+        """
+        if not self.circuit_breaker_enabled:
+            return func(*args, **kwargs)
+
+        if not self.circuit_breaker.allow_request():
+            CONFIG_CIRCUIT_REJECTED.labels(self.backend_name).inc()
+            raise CircuitOpenError(f"Redis circuit breaker is {self.circuit_breaker.state}")
+
+        try:
+            result = func(*args, **kwargs)
+        except REDIS_FAILURES:
+            self.circuit_breaker.record_failure()
+            raise
+        except Exception:
+            self.circuit_breaker.record_success()
+            raise
+
+        self.circuit_breaker.record_success()
+        return result
+
+    def _record_error(self, operation: str, message: str, error: Exception):
+        """실패 기록 (차단기로 건너뛴 호출은 로그를 남기지 않음)"""
+        if isinstance(error, CircuitOpenError):
+            logger.debug(f"{message} - {str(error)}")
+            return
+        CONFIG_OPERATION_ERRORS.labels(self.backend_name, operation).inc()
+        logger.error(f"{message} - {str(error)}")
+
+    def _remember(self, config_path: str, data: Optional[str], category: Optional[str] = None):
+        """조회/저장에 성공한 값을 마지막 정상 값으로 기록 (data가 None이면 삭제)"""
+        if data is None and config_path not in self._last_good:
+            return
+        with self._last_good_lock:
+            if data is None:
+                self._last_good.pop(config_path, None)
+                for paths in self._last_good_categories.values():
+                    paths.discard(config_path)
+                return
+            self._last_good[config_path] = data
+            self._last_good_categories.setdefault(category or config_path.split('.')[0], set()).add(config_path)
+
+    @staticmethod
+    def _restore(data: Any) -> Dict[str, Any]:
+        """마지막 정상 값을 설정 dict로 복원 (공유 중인 dict는 복사본 반환)"""
+        return json.loads(data) if isinstance(data, str) else copy.deepcopy(data)
+
+    def _last_good_value(self, config_path: str, operation: str) -> Optional[Any]:
+        data = self._last_good.get(config_path)
+        if data is not None:
+            CONFIG_FALLBACK_READS.labels(self.backend_name, operation).inc()
+        return data
+
+    def _last_known_configs(self, category: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+        with self._last_good_lock:
+            if category is None:
+                encoded = list(self._last_good.values())
+            elif category in self._last_good_categories:
+                encoded = [self._last_good[path] for path in self._last_good_categories[category]
+                           if path in self._last_good]
+            else:
+                return None
+
+        if not encoded:
+            return None
+        CONFIG_FALLBACK_READS.labels(self.backend_name, "get_category_configs" if category else "get_all_configs").inc()
+        return [self._restore(data) for data in encoded]
+
+    def health(self) -> Dict[str, Any]:
+        """/health 출력용 상태 (차단기가 닫혀 있지 않으면 degraded)"""
+        breaker = self.circuit_breaker.to_dict()
+        return {
+            "backend": self.backend_name,
+            "status": "ok" if breaker["state"] == CLOSED else "degraded",
+            "circuit_breaker": breaker,
+            "read_replicas": self.read_router.to_dict() if self.read_router is not None else None,
+            "last_known_configs": len(self._last_good)
+        }
+
+    # ========== 계측 ==========
+
+    def _decode(self, data: str, operation: str) -> Dict[str, Any]:
+        """저장된 JSON 디코딩 (디코딩 시간을 Redis 왕복 시간과 분리해서 기록)"""
+        start = time.perf_counter()
+        try:
+            return json.loads(data)
+        finally:
+            CONFIG_JSON_DECODE_SECONDS.labels(self.backend_name, operation).observe(time.perf_counter() - start)
+
+    def collect_metrics(self):
+        """연결 풀 상태를 메트릭 게이지에 반영"""
+        if self.read_router is not None:
+            for endpoint in self.read_router.endpoints:
+                if endpoint.latency is not None:
+                    CONFIG_REDIS_REPLICA_LATENCY.labels(endpoint.name).set(endpoint.latency)
+
+        pool = getattr(self.redis_client, 'connection_pool', None)
+        if pool is None:
+            # cluster 클라이언트는 노드별 풀을 사용
+            return
+        available = len(getattr(pool, '_available_connections', ()) or ())
+        in_use = len(getattr(pool, '_in_use_connections', ()) or ())
+        CONFIG_REDIS_POOL_CONNECTIONS.labels("created").set(getattr(pool, '_created_connections', available + in_use))
+        CONFIG_REDIS_POOL_CONNECTIONS.labels("available").set(available)
+        CONFIG_REDIS_POOL_CONNECTIONS.labels("in_use").set(in_use)
+        CONFIG_REDIS_POOL_CONNECTIONS.labels("max").set(getattr(pool, 'max_connections', 0) or 0)
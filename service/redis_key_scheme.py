@@ -0,0 +1,108 @@
+"""
+Redis Key Scheme
+
+설정 키 구조 정의
+- legacy: config:<path>, config:category:<category> (기존 데이터와 호환)
+- 리비전 해시는 두 구조 모두 config_meta:revisions에 둠 (기존 클라이언트의 config:* 조회에 섞이지 않도록)
+- hashtag: config:{<category>}:<path>, config:{<category>}:__index__ 처럼 카테고리를 해시 태그로 묶어
+  Redis Cluster에서도 한 카테고리의 값, 인덱스, 리비전이 같은 슬롯에 놓이도록 함
+"""
+import os
+from typing import Optional
+
+SUPPORTED_KEY_SCHEMES = ("legacy", "hashtag")
+
+
+class LegacyKeyScheme:
+    """기존 키 구조 (단일 Redis, Sentinel 전용)"""
+
+    name = "legacy"
+
+    # 카테고리 목록을 따로 저장하지 않고 인덱스 키 패턴(KEYS)으로 조회
+    hash_tags = False
+
+    def __init__(self, prefix: str = "config"):
+        self.prefix = prefix
+        # 이전 버전은 config:*를 KEYS로 찾아 모두 GET하므로 해시 타입 리비전 키는 그 밖에 둠
+        self.revision_key = f"{prefix}_meta:revisions"
+        self.categories_key: Optional[str] = None
+
+    def value_key(self, config_path: str) -> str:
+        return f"{self.prefix}:{config_path}"
+
+    def value_key_prefix(self, category: str) -> str:
+        """카테고리 값 키의 공통 접두사 (value_key(path) == value_key_prefix(category) + path)"""
+        return f"{self.prefix}:"
+
+    def index_key(self, category: str) -> str:
+        return f"{self.prefix}:category:{category}"
+
+    def index_pattern(self) -> str:
+        return f"{self.prefix}:category:*"
+
+    def category_from_index_key(self, key: str) -> str:
+        return key.split(':')[-1]
+
+    def bump_revision(self, pipe, category: str, all_revision: str):
+        """파이프라인에 카테고리와 전체 리비전 증가 명령 추가"""
+        pipe.hincrby(self.revision_key, category, 1)
+        pipe.hincrby(self.revision_key, all_revision, 1)
+
+    def get_revision(self, client, category: Optional[str], all_revision: str):
+        return client.hget(self.revision_key, category or all_revision)
+
+
+class HashTagKeyScheme(LegacyKeyScheme):
+    """
+    카테고리 해시 태그 키 구조 (Redis Cluster 지원)
+
+    카테고리는 config_path의 첫 번째 부분이며, 카테고리 목록은 config:categories 집합에 등록합니다.
+    """
+
+    name = "hashtag"
+
+    hash_tags = True
+
+    def __init__(self, prefix: str = "config"):
+        super().__init__(prefix)
+        self.categories_key = f"{prefix}:categories"
+
+    def _tag(self, category: str) -> str:
+        return f"{self.prefix}:{{{category}}}"
+
+    def value_key(self, config_path: str) -> str:
+        return f"{self._tag(config_path.split('.')[0])}:{config_path}"
+
+    def value_key_prefix(self, category: str) -> str:
+        return f"{self._tag(category)}:"
+
+    def index_key(self, category: str) -> str:
+        return f"{self._tag(category)}:__index__"
+
+    def category_revision_key(self, category: str) -> str:
+        return f"{self._tag(category)}:__revision__"
+
+    def bump_revision(self, pipe, category: str, all_revision: str):
+        # 카테고리 리비전은 카테고리 슬롯에, 전체 리비전만 공용 해시에 둠
+        pipe.incr(self.category_revision_key(category))
+        pipe.hincrby(self.revision_key, all_revision, 1)
+
+    def get_revision(self, client, category: Optional[str], all_revision: str):
+        if category:
+            return client.get(self.category_revision_key(category))
+        return client.hget(self.revision_key, all_revision)
+
+
+def create_key_scheme(name: Optional[str] = None, prefix: str = "config") -> LegacyKeyScheme:
+    """
+    키 구조 생성 (기본값: REDIS_KEY_SCHEME 환경변수, 없으면 legacy)
+
+    Raises:
+        ValueError: 지원하지 않는 이름
+    """
+    name = (name or os.getenv('REDIS_KEY_SCHEME', 'legacy')).lower()
+    if name == "legacy":
+        return LegacyKeyScheme(prefix)
+    if name == "hashtag":
+        return HashTagKeyScheme(prefix)
+    raise ValueError(f"지원되지 않는 Redis 키 구조입니다: {name} (지원: {', '.join(SUPPORTED_KEY_SCHEMES)})")
@@ -0,0 +1,108 @@
+"""
+Redis Read Router
+
+설정 조회를 읽기 전용 복제본(replica)으로 분산하는 라우터
+라운드 로빈 또는 최소 지연(EWMA) 방식으로 복제본을 고르고,
+실패한 복제본은 잠시 제외합니다. 모든 복제본을 쓸 수 없으면 None을 반환해 primary로 보냅니다.
+"""
+import time
+import itertools
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+SUPPORTED_READ_STRATEGIES = ("round_robin", "least_latency")
+
+
+class ReplicaEndpoint:
+    """복제본 하나의 클라이언트와 상태"""
+
+    __slots__ = ("name", "client", "latency", "failed_until", "reads", "failures")
+
+    def __init__(self, name: str, client: Any):
+        self.name = name
+        self.client = client
+        # 지수 이동 평균 지연 시간 (초, 아직 측정 전이면 None)
+        self.latency: Optional[float] = None
+        self.failed_until = 0.0
+        self.reads = 0
+        self.failures = 0
+
+
+class ReadReplicaRouter:
+    """
+    복제본 선택기
+
+    Args:
+        endpoints: (이름, 클라이언트) 리스트
+        strategy: round_robin 또는 least_latency
+        failure_cooldown: 실패한 복제본을 제외할 시간 (초)
+        explore_every: least_latency에서 지연 측정값을 갱신하기 위해 N번에 한 번은 라운드 로빈으로 선택
+
+    Example:
+        >>> router = ReadReplicaRouter([("replica1:6379", client1), ("replica2:6379", client2)])
+        >>> endpoint = router.choose()
+    """
+
+    def __init__(self, endpoints: List[Tuple[str, Any]], strategy: str = "round_robin",
+                 failure_cooldown: float = 5.0, explore_every: int = 20, smoothing: float = 0.2):
+        if strategy not in SUPPORTED_READ_STRATEGIES:
+            raise ValueError(f"지원되지 않는 읽기 분산 방식입니다: {strategy} "
+                             f"(지원: {', '.join(SUPPORTED_READ_STRATEGIES)})")
+
+        self.endpoints = [ReplicaEndpoint(name, client) for name, client in endpoints]
+        self.strategy = strategy
+        self.failure_cooldown = failure_cooldown
+        self.explore_every = max(1, explore_every)
+        self.smoothing = smoothing
+
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def choose(self) -> Optional[ReplicaEndpoint]:
+        """읽기에 사용할 복제본 (사용 가능한 복제본이 없으면 None)"""
+        now = time.monotonic()
+        healthy = [endpoint for endpoint in self.endpoints if endpoint.failed_until <= now]
+        if not healthy:
+            return None
+
+        turn = next(self._counter)
+        if self.strategy == "least_latency" and turn % self.explore_every:
+            # 측정 전인 복제본을 먼저 시도
+            return min(healthy, key=lambda endpoint: endpoint.latency or 0.0)
+        return healthy[turn % len(healthy)]
+
+    def observe(self, endpoint: ReplicaEndpoint, seconds: float):
+        """성공한 읽기의 지연 시간 기록"""
+        with self._lock:
+            endpoint.reads += 1
+            if endpoint.latency is None:
+                endpoint.latency = seconds
+            else:
+                endpoint.latency += self.smoothing * (seconds - endpoint.latency)
+
+    def mark_failed(self, endpoint: ReplicaEndpoint):
+        """실패한 복제본을 failure_cooldown 동안 제외"""
+        with self._lock:
+            endpoint.failures += 1
+            endpoint.failed_until = time.monotonic() + self.failure_cooldown
+
+    def to_dict(self) -> Dict[str, Any]:
+        """/health 출력용 상태"""
+        now = time.monotonic()
+        return {
+            "strategy": self.strategy,
+            "replicas": [
+                {
+                    "name": endpoint.name,
+                    "healthy": endpoint.failed_until <= now,
+                    "latency_ms": round(endpoint.latency * 1000, 3) if endpoint.latency is not None else None,
+                    "reads": endpoint.reads,
+                    "failures": endpoint.failures
+                }
+                for endpoint in self.endpoints
+            ]
+        }
+
+    def close(self):
+        for endpoint in self.endpoints:
+            endpoint.client.close()
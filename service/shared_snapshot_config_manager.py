@@ -0,0 +1,520 @@
+"""
+Shared Snapshot Config Manager
+
+여러 워커 프로세스(uvicorn/gunicorn)가 하나의 설정 스냅샷을 공유하는 백엔드
+리더 프로세스 하나만 원본 백엔드(Redis 등)를 읽어 메모리 맵 파일에 스냅샷을 발행하고,
+나머지 워커는 같은 파일을 매핑해서 읽습니다. 헤더의 시퀀스 번호(seqlock)로
+Lock 없이 갱신을 감지하며, 쓰기는 원본 백엔드로 보낸 뒤 스냅샷에 반영합니다.
+
+리눅스/유닉스 전용 (fcntl.flock 사용)
+"""
+import os
+import json
+import mmap
+import time
+import zlib
+import struct
+import logging
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, List, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from service.config_backend import ConfigBackend, create_config_manager
+
+logger = logging.getLogger(__name__)
+
+# 헤더: magic, 포맷 버전, 예약, 시퀀스(쓰는 중이면 홀수), 페이로드 길이, CRC32
+HEADER_FORMAT = "<4sHHQQI"
+HEADER_SIZE = 32
+SNAPSHOT_MAGIC = b"XGCS"
+SNAPSHOT_FORMAT_VERSION = 1
+INITIAL_CAPACITY = 1024 * 1024
+
+# 읽는 도중 갱신이 겹쳤을 때 재시도 횟수
+READ_RETRIES = 50
+
+
+class SnapshotReadError(RuntimeError):
+    """갱신이 계속 겹쳐 스냅샷을 일관되게 읽지 못함 (값이 없다는 뜻이 아님)"""
+
+
+def _default_snapshot_path() -> str:
+    shm_dir = "/dev/shm"
+    base_dir = shm_dir if os.path.isdir(shm_dir) else tempfile.gettempdir()
+    return os.path.join(base_dir, "xgen_config.snapshot")
+
+
+class SharedSnapshotSegment:
+    """
+    seqlock 헤더를 가진 메모리 맵 스냅샷 파일
+
+    쓰기는 파일 Lock(flock)으로 프로세스 간 직렬화하고, 읽기는 Lock 없이
+    시퀀스 번호가 짝수이고 앞뒤로 같을 때만 페이로드를 받아들입니다 (CRC32로 한 번 더 검증).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        self._lock_fd = os.open(f"{path}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+        self._map: Optional[mmap.mmap] = None
+        self._local_lock = threading.Lock()
+
+        with self.write_lock():
+            if os.fstat(self._fd).st_size < HEADER_SIZE:
+                os.ftruncate(self._fd, HEADER_SIZE + INITIAL_CAPACITY)
+                self._remap()
+                self._write_header(0, 0, 0)
+        self._remap()
+
+    def _remap(self):
+        size = os.fstat(self._fd).st_size
+        if self._map is not None and len(self._map) == size:
+            return
+        # 이전 매핑은 닫지 않고 교체만 함 (Lock 없이 읽는 스레드가 아직 쓰고 있을 수 있으며, 참조가 없어지면 해제됨)
+        self._map = mmap.mmap(self._fd, size)
+
+    def _read_header(self) -> Tuple[int, int, int]:
+        magic, version, _, seq, length, checksum = struct.unpack_from(HEADER_FORMAT, self._map, 0)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_FORMAT_VERSION:
+            return 0, 0, 0
+        return seq, length, checksum
+
+    def _write_header(self, seq: int, length: int, checksum: int):
+        struct.pack_into(HEADER_FORMAT, self._map, 0,
+                         SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, 0, seq, length, checksum)
+
+    def sequence(self) -> int:
+        """현재 시퀀스 번호 (갱신 감지용, 헤더만 읽음)"""
+        return struct.unpack_from("<Q", self._map, 8)[0]
+
+    def write_lock(self):
+        """프로세스 간 쓰기 Lock (블로킹)"""
+        return _FileLock(self._lock_fd, self._local_lock)
+
+    def read(self) -> Tuple[int, Optional[bytes]]:
+        """
+        일관된 페이로드 읽기
+
+        Returns:
+            (시퀀스, 페이로드) - 아직 발행된 스냅샷이 없으면 페이로드는 None
+        """
+        for _ in range(READ_RETRIES):
+            seq, length, checksum = self._read_header()
+            if seq % 2:
+                time.sleep(0.0005)
+                continue
+            if seq == 0:
+                return 0, None
+            snapshot_map = self._map
+            if HEADER_SIZE + length > len(snapshot_map):
+                # 다른 프로세스가 파일을 키웠으면 다시 매핑
+                self._remap()
+                snapshot_map = self._map
+            payload = bytes(snapshot_map[HEADER_SIZE:HEADER_SIZE + length])
+            if self.sequence() == seq and zlib.crc32(payload) == checksum:
+                return seq, payload
+        raise SnapshotReadError(f"공유 스냅샷을 일관되게 읽지 못했습니다: {self.path}")
+
+    def write(self, payload: bytes) -> int:
+        """페이로드 발행 (write_lock() 안에서 호출), 새 시퀀스 반환"""
+        if HEADER_SIZE + len(payload) > len(self._map):
+            capacity = max(len(self._map) - HEADER_SIZE, INITIAL_CAPACITY)
+            while capacity < len(payload):
+                capacity *= 2
+            os.ftruncate(self._fd, HEADER_SIZE + capacity)
+        self._remap()
+
+        seq, _, _ = self._read_header()
+        # 홀수 시퀀스로 쓰는 중임을 알리고, 다 쓴 뒤 짝수로 올림
+        self._write_header(seq + 1, 0, 0)
+        self._map[HEADER_SIZE:HEADER_SIZE + len(payload)] = payload
+        self._write_header(seq + 2, len(payload), zlib.crc32(payload))
+        return seq + 2
+
+    def try_acquire_leadership(self, leader_fd: int) -> bool:
+        """리더 Lock 획득 시도 (논블로킹, 프로세스가 죽으면 OS가 해제)"""
+        try:
+            fcntl.flock(leader_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            return False
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        os.close(self._fd)
+        os.close(self._lock_fd)
+
+
+class _FileLock:
+    """flock 기반 컨텍스트 매니저 (같은 프로세스의 스레드는 threading.Lock으로 직렬화)"""
+
+    def __init__(self, fd: int, local_lock: threading.Lock):
+        self._fd = fd
+        self._local_lock = local_lock
+
+    def __enter__(self):
+        self._local_lock.acquire()
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self._local_lock.release()
+
+
+class SharedSnapshotConfigManager(ConfigBackend):
+    """
+    공유 메모리 스냅샷을 읽는 설정 관리자
+
+    조회는 공유 스냅샷만 사용하므로 워커 수와 관계없이 원본 백엔드에는 리더 하나만 접근합니다.
+    쓰기가 계속 겹쳐 스냅샷을 읽지 못한 조회는 값이 없다고 답하지 않고 원본 백엔드에서 읽습니다.
+    저장/삭제는 원본 백엔드에 먼저 쓰고 성공하면 스냅샷에도 바로 반영합니다.
+    """
+
+    backend_name = "shared"
+
+    def __init__(self, source_backend: Optional[str] = None,
+                 snapshot_path: Optional[str] = None,
+                 refresh_interval: Optional[float] = None,
+                 source: Optional[ConfigBackend] = None):
+        super().__init__()
+
+        if fcntl is None:
+            raise RuntimeError("shared 설정 백엔드는 fcntl을 지원하는 플랫폼에서만 사용할 수 있습니다")
+
+        # 환경 변수에서 원본 백엔드, 스냅샷 경로, 갱신 주기 읽기
+        self.source_backend = source_backend or os.getenv('CONFIG_SHARED_SOURCE_BACKEND', 'redis')
+        self.snapshot_path = snapshot_path or os.getenv('CONFIG_SHARED_SNAPSHOT_PATH') or _default_snapshot_path()
+        self.refresh_interval = refresh_interval or float(os.getenv('CONFIG_SHARED_REFRESH_INTERVAL', '5'))
+
+        # 원본 백엔드 연결은 리더가 되거나 쓰기가 필요할 때 생성
+        self._source = source
+        self._source_lock = threading.Lock()
+
+        self._segment = SharedSnapshotSegment(self.snapshot_path)
+        self._leader_fd = os.open(f"{self.snapshot_path}.leader", os.O_RDWR | os.O_CREAT, 0o600)
+        self.is_leader = False
+
+        # 프로세스 로컬 디코딩 캐시 (시퀀스가 바뀔 때만 다시 읽음)
+        self._seq = -1
+        self._configs: Dict[str, str] = {}
+        self._categories: Dict[str, List[str]] = {}
+        self._lock = threading.RLock()
+
+        # write_batch() 안에서 모아 둔 스냅샷 변경 (스레드별)
+        self._batch = threading.local()
+
+        self._stop = threading.Event()
+        self._try_lead()
+        if self._segment.sequence() == 0:
+            # 아직 아무도 발행하지 않았으면 직접 발행 (리더가 아니어도 한 번은 필요)
+            self._publish_from_source(force=False)
+
+        self._thread = threading.Thread(target=self._refresh_loop, name="config-snapshot-leader", daemon=True)
+        self._thread.start()
+
+        logger.info(f"Shared Snapshot Config Manager 초기화 완료: {self.snapshot_path} "
+                    f"(source: {self.source_backend}, leader: {self.is_leader})")
+
+    # ========== 원본 백엔드 / 발행 ==========
+
+    @property
+    def source(self) -> ConfigBackend:
+        """원본 백엔드 (처음 사용할 때 연결)"""
+        if self._source is None:
+            with self._source_lock:
+                if self._source is None:
+                    self._source = create_config_manager(self.source_backend)
+        return self._source
+
+    def _try_lead(self):
+        if not self.is_leader and self._segment.try_acquire_leadership(self._leader_fd):
+            self.is_leader = True
+            logger.info(f"공유 설정 스냅샷 리더로 선출됨 (pid: {os.getpid()})")
+
+    def _refresh_loop(self):
+        while not self._stop.wait(self.refresh_interval):
+            try:
+                self._try_lead()
+                if self.is_leader:
+                    self._publish_from_source(force=False)
+            except Exception as e:
+                logger.error(f"공유 설정 스냅샷 갱신 실패: {str(e)}")
+
+    def _publish_from_source(self, force: bool = True) -> bool:
+        """
+        원본 백엔드 전체를 읽어 스냅샷 발행
+
+        Args:
+            force: False면 원본 리비전이 마지막 발행 이후 바뀌었을 때만 발행
+        """
+        source_revision = self.source.get_revision()
+        if source_revision is None and not force:
+            # 원본 조회 실패 시 기존 스냅샷 유지
+            return False
+
+        with self._segment.write_lock():
+            if not force:
+                _, payload = self._segment.read()
+                if payload is not None and json.loads(payload).get('source_revision') == source_revision:
+                    return False
+
+            configs = {}
+            categories: Dict[str, List[str]] = {}
+            for config in self.source._load_all_configs():
+                configs[config['path']] = json.dumps(config)
+                categories.setdefault(config.get('category') or config['path'].split('.')[0], []).append(config['path'])
+
+            seq = self._segment.write(self._encode_payload(configs, categories, source_revision))
+
+        logger.debug(f"공유 설정 스냅샷 발행: {len(configs)}개 (seq: {seq})")
+        return True
+
+    @staticmethod
+    def _encode_payload(configs: Dict[str, str], categories: Dict[str, List[str]],
+                        source_revision: Optional[int]) -> bytes:
+        return json.dumps({
+            'source_revision': source_revision,
+            'configs': configs,
+            'categories': categories
+        }, separators=(',', ':')).encode('utf-8')
+
+    @contextmanager
+    def write_batch(self):
+        """
+        블록 안의 쓰기를 모아 블록이 끝날 때 스냅샷을 한 번만 다시 발행
+
+        쓰기마다 전체 스냅샷을 디코딩/인코딩하므로 기본값 시딩처럼 연속 쓰기가 많을 때 사용합니다.
+        원본 백엔드에는 바로 쓰고, 블록 안에서는 스냅샷 조회에 아직 반영되지 않습니다. 중첩 블록은 바깥 블록에 합쳐집니다.
+        """
+        if getattr(self._batch, 'patches', None) is not None:
+            yield
+            return
+
+        self._batch.patches = []
+        try:
+            yield
+        finally:
+            patches, self._batch.patches = self._batch.patches, None
+            if patches:
+                try:
+                    self._apply_patches(patches)
+                except Exception as e:
+                    # 원본 백엔드에는 저장되었으므로 리더가 다음 주기에 다시 발행
+                    logger.error(f"공유 설정 스냅샷 일괄 반영 실패: {str(e)}")
+
+    def _patch(self, set_items: Dict[str, Tuple[str, str]] = None, delete_paths: List[str] = (),
+               delete_category: Optional[str] = None):
+        """쓰기 결과를 스냅샷에 반영 (write_batch 안이면 블록이 끝날 때 한 번에 반영)"""
+        patch = (set_items or {}, list(delete_paths), delete_category)
+        patches = getattr(self._batch, 'patches', None)
+        if patches is not None:
+            patches.append(patch)
+        else:
+            self._apply_patches([patch])
+
+    def _apply_patches(self, patches: List[Tuple[Dict[str, Tuple[str, str]], List[str], Optional[str]]]):
+        """변경 목록을 순서대로 적용해 한 번 발행 (원본 리비전은 비워서 리더가 다음 주기에 전체 확인)"""
+        with self._segment.write_lock():
+            _, payload = self._segment.read()
+            data = json.loads(payload) if payload else {'configs': {}, 'categories': {}}
+            configs = data['configs']
+            categories = {name: set(paths) for name, paths in data['categories'].items()}
+            # 경로 -> 카테고리 (경로마다 모든 카테고리를 훑지 않도록)
+            path_categories = {path: name for name, paths in categories.items() for path in paths}
+
+            for set_items, delete_paths, delete_category in patches:
+                if delete_category is not None:
+                    for path in categories.pop(delete_category, ()):
+                        configs.pop(path, None)
+                        path_categories.pop(path, None)
+                for path in delete_paths:
+                    configs.pop(path, None)
+                    old_category = path_categories.pop(path, None)
+                    if old_category is not None:
+                        categories[old_category].discard(path)
+                for path, (category, encoded) in set_items.items():
+                    configs[path] = encoded
+                    old_category = path_categories.get(path)
+                    if old_category is not None and old_category != category:
+                        categories[old_category].discard(path)
+                    categories.setdefault(category, set()).add(path)
+                    path_categories[path] = category
+
+            categories = {name: sorted(paths) for name, paths in categories.items() if paths}
+            self._segment.write(self._encode_payload(configs, categories, None))
+
+    def _sync(self) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+        """스냅샷 시퀀스가 바뀌었으면 다시 디코딩, (configs, categories) 반환"""
+        seq = self._segment.sequence()
+        if seq != self._seq:
+            with self._lock:
+                if seq != self._seq:
+                    seq, payload = self._segment.read()
+                    data = json.loads(payload) if payload else {'configs': {}, 'categories': {}}
+                    self._configs = data['configs']
+                    self._categories = data['categories']
+                    self._seq = seq
+        return self._configs, self._categories
+
+    # ========== Config 값 CRUD ==========
+
+    def set_config(self, config_path: str, config_value: Any,
+                   data_type: str = "string", category: Optional[str] = None) -> bool:
+        try:
+            if not self.source.set_config(config_path, config_value, data_type, category):
+                return False
+            self._patch(set_items={config_path: self._encode_config(config_path, config_value, data_type, category)})
+            return True
+
+        except Exception as e:
+            logger.error(f"Config 저장 실패: {config_path} - {str(e)}")
+            return False
+
+    def get_config(self, config_path: str) -> Optional[Dict[str, Any]]:
+        try:
+            configs, _ = self._sync()
+            data = configs.get(config_path)
+            if data:
+                return json.loads(data)
+            return None
+
+        except SnapshotReadError as e:
+            logger.warning(f"공유 스냅샷 조회 실패, 원본 백엔드에서 조회: {config_path} - {str(e)}")
+            return self.source.get_config(config_path)
+        except Exception as e:
+            logger.error(f"Config 조회 실패: {config_path} - {str(e)}")
+            return None
+
+    def delete_config(self, config_path: str) -> bool:
+        try:
+            if not self.source.delete_config(config_path):
+                return False
+            self._patch(delete_paths=[config_path])
+            return True
+
+        except Exception as e:
+            logger.error(f"Config 삭제 실패: {config_path} - {str(e)}")
+            return False
+
+    def exists(self, config_path: str) -> bool:
+        try:
+            configs, _ = self._sync()
+            return config_path in configs
+
+        except SnapshotReadError as e:
+            logger.warning(f"공유 스냅샷 조회 실패, 원본 백엔드에서 확인: {config_path} - {str(e)}")
+            return self.source.exists(config_path)
+        except Exception as e:
+            logger.error(f"Config 존재 확인 실패: {config_path} - {str(e)}")
+            return False
+
+    # ========== 카테고리 ==========
+
+    def get_category_configs(self, category: str) -> List[Dict[str, Any]]:
+        try:
+            return self._load_category_configs(category)
+
+        except SnapshotReadError as e:
+            logger.warning(f"공유 스냅샷 조회 실패, 원본 백엔드에서 조회: {category} - {str(e)}")
+            return self.source.get_category_configs(category)
+        except Exception as e:
+            logger.error(f"카테고리 Config 조회 실패: {category} - {str(e)}")
+            return []
+
+    def get_all_configs(self) -> List[Dict[str, Any]]:
+        try:
+            return self._load_all_configs()
+
+        except SnapshotReadError as e:
+            logger.warning(f"공유 스냅샷 조회 실패, 원본 백엔드에서 조회: {str(e)}")
+            return self.source.get_all_configs()
+        except Exception as e:
+            logger.error(f"전체 Config 조회 실패: {str(e)}")
+            return []
+
+    def _load_category_configs(self, category: str) -> List[Dict[str, Any]]:
+        configs, categories = self._sync()
+        return [json.loads(configs[path]) for path in categories.get(category, ()) if path in configs]
+
+    def _load_all_configs(self) -> List[Dict[str, Any]]:
+        configs, _ = self._sync()
+        return [json.loads(data) for data in configs.values()]
+
+    def clear_category(self, category: str) -> bool:
+        try:
+            if not self.source.clear_category(category):
+                return False
+            self._patch(delete_category=category)
+            return True
+
+        except Exception as e:
+            logger.error(f"카테고리 삭제 실패: {category} - {str(e)}")
+            return False
+
+    def delete_prefix(self, prefix: str) -> int:
+        try:
+            deleted = self.source.delete_prefix(prefix)
+            if prefix == prefix.split('.')[0]:
+                self._patch(delete_category=prefix)
+            else:
+                dotted = prefix + '.'
+                configs, _ = self._sync()
+                self._patch(delete_paths=[path for path in configs
+                                          if path == prefix or path.startswith(dotted)])
+            return deleted
+
+        except Exception as e:
+            logger.error(f"접두사 삭제 실패: {prefix} - {str(e)}")
+            return 0
+
+    def get_all_categories(self) -> List[str]:
+        try:
+            _, categories = self._sync()
+            return sorted(categories.keys())
+
+        except SnapshotReadError as e:
+            logger.warning(f"공유 스냅샷 조회 실패, 원본 백엔드에서 조회: {str(e)}")
+            return self.source.get_all_categories()
+        except Exception as e:
+            logger.error(f"카테고리 목록 조회 실패: {str(e)}")
+            return []
+
+    # ========== 리비전 ==========
+
+    def get_revision(self, category: Optional[str] = None) -> Optional[int]:
+        """스냅샷 시퀀스를 모든 카테고리의 리비전으로 사용 (발행될 때마다 트리 캐시 무효화)"""
+        try:
+            return self._segment.sequence()
+
+        except Exception as e:
+            logger.error(f"리비전 조회 실패: {category} - {str(e)}")
+            return None
+
+    def refresh(self) -> bool:
+        """원본 백엔드에서 스냅샷을 즉시 다시 발행"""
+        try:
+            return self._publish_from_source(force=True)
+
+        except Exception as e:
+            logger.error(f"공유 설정 스냅샷 발행 실패: {str(e)}")
+            return False
+
+    def close(self):
+        self._stop.set()
+        self._thread.join(timeout=self.refresh_interval)
+        if self.is_leader:
+            fcntl.flock(self._leader_fd, fcntl.LOCK_UN)
+            self.is_leader = False
+        os.close(self._leader_fd)
+        self._segment.close()
+        if self._source is not None:
+            self._source.close()
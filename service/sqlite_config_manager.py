@@ -0,0 +1,246 @@
+"""
+SQLite Config Manager
+
+로컬 SQLite 파일에 설정을 저장하는 백엔드 (Redis 없이 로컬 도구에서 사용)
+"""
+import os
+import json
+import sqlite3
+import logging
+import threading
+from typing import Dict, Any, Optional, List
+
+from service.config_backend import ConfigBackend
+
+logger = logging.getLogger(__name__)
+
+# IN 절 하나에 넣을 최대 경로 수 (SQLite 바인딩 변수 제한 대비)
+SELECT_CHUNK_SIZE = 500
+
+
+class SQLiteConfigManager(ConfigBackend):
+    """SQLite를 사용한 설정 관리자"""
+
+    backend_name = "sqlite"
+
+    def __init__(self, db_path: Optional[str] = None):
+        super().__init__()
+
+        # 환경 변수에서 SQLite 파일 경로 읽기 (":memory:" 가능)
+        self.db_path = db_path or os.getenv('CONFIG_SQLITE_PATH', 'xgen_config.db')
+
+        # FastAPI 스레드풀에서 공유하므로 스레드 검사 대신 Lock으로 직렬화
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._lock = threading.RLock()
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS configs ("
+                " path TEXT PRIMARY KEY,"
+                " category TEXT NOT NULL,"
+                " data TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_configs_category ON configs (category)"
+            )
+            # 같은 파일을 쓰는 다른 프로세스의 변경도 감지할 수 있도록 리비전을 테이블에 저장
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS config_revisions ("
+                " name TEXT PRIMARY KEY,"
+                " revision INTEGER NOT NULL)"
+            )
+
+        logger.info(f"SQLite Config Manager 초기화 완료: {self.db_path}")
+
+    # ========== Config 값 CRUD ==========
+
+    def set_config(self, config_path: str, config_value: Any,
+                   data_type: str = "string", category: Optional[str] = None) -> bool:
+        try:
+            category, encoded = self._encode_config(config_path, config_value, data_type, category)
+
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT INTO configs (path, category, data) VALUES (?, ?, ?) "
+                    "ON CONFLICT(path) DO UPDATE SET category = excluded.category, data = excluded.data",
+                    (config_path, category, encoded)
+                )
+                self._bump_revision(category)
+
+            logger.debug(f"Config 저장 완료: {config_path} = {config_value}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Config 저장 실패: {config_path} - {str(e)}")
+            return False
+
+    def get_config(self, config_path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT data FROM configs WHERE path = ?", (config_path,)
+                ).fetchone()
+
+            if row:
+                return json.loads(row[0])
+            return None
+
+        except Exception as e:
+            logger.error(f"Config 조회 실패: {config_path} - {str(e)}")
+            return None
+
+    def get_config_values(self, config_paths: List[str],
+                          defaults: Optional[Dict[str, Any]] = None,
+                          default: Any = None) -> Dict[str, Any]:
+        defaults = defaults or {}
+        paths = list(dict.fromkeys(config_paths))
+        result = {path: defaults.get(path, default) for path in paths}
+
+        try:
+            rows = []
+            with self._lock:
+                for start in range(0, len(paths), SELECT_CHUNK_SIZE):
+                    chunk = paths[start:start + SELECT_CHUNK_SIZE]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows.extend(self._conn.execute(
+                        f"SELECT path, data FROM configs WHERE path IN ({placeholders})", chunk
+                    ).fetchall())
+
+            for path, data in rows:
+                result[path] = json.loads(data).get('value', result[path])
+            return result
+
+        except Exception as e:
+            logger.error(f"Config 다중 조회 실패: {len(paths)}개 경로 - {str(e)}")
+            return result
+
+    def delete_config(self, config_path: str) -> bool:
+        try:
+            with self._lock, self._conn:
+                row = self._conn.execute(
+                    "SELECT category FROM configs WHERE path = ?", (config_path,)
+                ).fetchone()
+                self._conn.execute("DELETE FROM configs WHERE path = ?", (config_path,))
+                if row:
+                    self._bump_revision(row[0])
+
+            logger.debug(f"Config 삭제 완료: {config_path}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Config 삭제 실패: {config_path} - {str(e)}")
+            return False
+
+    def exists(self, config_path: str) -> bool:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT 1 FROM configs WHERE path = ?", (config_path,)
+                ).fetchone()
+            return row is not None
+
+        except Exception as e:
+            logger.error(f"Config 존재 확인 실패: {config_path} - {str(e)}")
+            return False
+
+    # ========== 카테고리 ==========
+
+    def get_category_configs(self, category: str) -> List[Dict[str, Any]]:
+        try:
+            return self._load_category_configs(category)
+
+        except Exception as e:
+            logger.error(f"카테고리 Config 조회 실패: {category} - {str(e)}")
+            return []
+
+    def get_all_configs(self) -> List[Dict[str, Any]]:
+        try:
+            return self._load_all_configs()
+
+        except Exception as e:
+            logger.error(f"전체 Config 조회 실패: {str(e)}")
+            return []
+
+    def _load_category_configs(self, category: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM configs WHERE category = ?", (category,)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def _load_all_configs(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute("SELECT data FROM configs").fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def clear_category(self, category: str) -> bool:
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM configs WHERE category = ?", (category,))
+                self._bump_revision(category)
+
+            logger.info(f"카테고리 '{category}' 전체 삭제 완료")
+            return True
+
+        except Exception as e:
+            logger.error(f"카테고리 삭제 실패: {category} - {str(e)}")
+            return False
+
+    def delete_prefix(self, prefix: str) -> int:
+        try:
+            # LIKE는 '_', '%'를 와일드카드로 해석하므로 접두사 비교는 substr로 수행
+            dotted = prefix + '.'
+            with self._lock, self._conn:
+                deleted = self._conn.execute(
+                    "DELETE FROM configs WHERE category = ? AND "
+                    "(path = ? OR substr(path, 1, ?) = ? OR ? = category)",
+                    (prefix.split('.')[0], prefix, len(dotted), dotted, prefix)
+                ).rowcount
+                if deleted:
+                    self._bump_revision(prefix.split('.')[0])
+
+            logger.info(f"접두사 '{prefix}' 하위 설정 삭제 완료 ({deleted}개)")
+            return deleted
+
+        except Exception as e:
+            logger.error(f"접두사 삭제 실패: {prefix} - {str(e)}")
+            return 0
+
+    def get_all_categories(self) -> List[str]:
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT DISTINCT category FROM configs ORDER BY category"
+                ).fetchall()
+            return [row[0] for row in rows]
+
+        except Exception as e:
+            logger.error(f"카테고리 목록 조회 실패: {str(e)}")
+            return []
+
+    # ========== 리비전 ==========
+
+    def get_revision(self, category: Optional[str] = None) -> Optional[int]:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT revision FROM config_revisions WHERE name = ?",
+                    (category or self.ALL_REVISION,)
+                ).fetchone()
+            return row[0] if row else 0
+
+        except Exception as e:
+            logger.error(f"리비전 조회 실패: {category} - {str(e)}")
+            return None
+
+    def _bump_revision(self, category: str):
+        """카테고리와 전체 리비전 증가 (쓰기 트랜잭션 안에서 호출)"""
+        self._conn.executemany(
+            "INSERT INTO config_revisions (name, revision) VALUES (?, 1) "
+            "ON CONFLICT(name) DO UPDATE SET revision = revision + 1",
+            [(category,), (self.ALL_REVISION,)]
+        )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -20,7 +20,8 @@ from service.config_utils import (
     get_openai_config,
     get_anthropic_config,
     get_vast_config,
-    get_vllm_config
+    get_vllm_config,
+    ConfigNamespace
 )
 from types import SimpleNamespace
 import json
@@ -34,7 +35,9 @@ def print_section(title):
 
 
 def namespace_to_dict(obj):
-    """SimpleNamespace를 dict로 변환 (JSON 출력용)"""
+    """SimpleNamespace/ConfigNamespace를 dict로 변환 (JSON 출력용)"""
+    if isinstance(obj, ConfigNamespace):
+        return obj.to_dict()
     if isinstance(obj, SimpleNamespace):
         return {key: namespace_to_dict(value) for key, value in vars(obj).items()}
     elif isinstance(obj, list):
@@ -0,0 +1,151 @@
+"""
+evaluate_batch_with_llm 테스트
+
+LLM 호출(_score_with_llm)과 클라이언트 조회, DB 매니저를 스텁으로 바꿔 네트워크/DB 없이
+동시 호출 수 제한, 초당 요청 수 제한, 같은 내용 중복 평가 제거, 배치 저장을 확인합니다.
+"""
+import os
+import sys
+import asyncio
+from contextlib import contextmanager
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# controller.helper.utils 패키지는 앱의 DB 모델과 langchain이 있어야 import 되므로 없으면 건너뜀
+pytest.importorskip("langchain_openai")
+pytest.importorskip("langchain_core")
+pytest.importorskip("service.database.models.executor")
+pytest.importorskip("service.database.models.user")
+pytest.importorskip("service.database.models.workflow")
+pytest.importorskip("service.database.models.deploy")
+
+from controller.helper.utils import llm_evaluators
+from controller.helper.utils.llm_score_cache import MemoryLLMScoreCache, reset_llm_score_cache
+
+
+class StubScorer:
+    """_score_with_llm 대신 호출되어 동시 호출 수와 호출 시각을 기록"""
+
+    def __init__(self, delay: float = 0.01, score: float = 0.5, fail_on: str = None):
+        self.delay = delay
+        self.score = score
+        self.fail_on = fail_on
+        self.calls = []
+        self.started_at = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def __call__(self, llm_client, input_data, expected_output, actual_output):
+        self.calls.append((input_data, expected_output, actual_output))
+        self.started_at.append(asyncio.get_running_loop().time())
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail_on is not None and self.fail_on in actual_output:
+                raise RuntimeError("stub LLM failure")
+            return self.score
+        finally:
+            self.in_flight -= 1
+
+
+class StubDB:
+    """transaction()과 update_list_columns()만 있는 DB 매니저"""
+
+    def __init__(self):
+        self.transactions = []
+        self._current = None
+
+    @contextmanager
+    def transaction(self):
+        self._current = []
+        yield
+        self.transactions.append(self._current)
+        self._current = None
+
+    def update_list_columns(self, model, values, condition):
+        self._current.append((condition["interaction_id"], values["llm_eval_score"]))
+
+
+@pytest.fixture
+def scorer(monkeypatch):
+    stub = StubScorer()
+    monkeypatch.setattr(llm_evaluators, "_score_with_llm", stub)
+    monkeypatch.setattr(llm_evaluators.llm_client_registry, "get_client",
+                        lambda llm_eval_type, llm_eval_model, config_composer: object())
+    monkeypatch.setattr(llm_evaluators.llm_client_registry, "client_key",
+                        lambda llm_eval_type, llm_eval_model, config_composer: (llm_eval_type, "", llm_eval_model, 0.1))
+    reset_llm_score_cache(MemoryLLMScoreCache())
+    yield stub
+    reset_llm_score_cache(None)
+
+
+def _items(count: int, prefix: str = "answer"):
+    return [(f"run-{i}", f"question {i}", "expected", f"{prefix} {i}") for i in range(count)]
+
+
+def _evaluate(items, app_db, **kwargs):
+    return asyncio.run(llm_evaluators.evaluate_batch_with_llm(
+        items, "OpenAI", "gpt-4o-mini", app_db, config_composer=None, **kwargs
+    ))
+
+
+def test_concurrency_limits_in_flight_calls(scorer):
+    scores = _evaluate(_items(50), StubDB(), concurrency=10)
+
+    assert len(scorer.calls) == 50
+    assert scorer.peak_in_flight == 10
+    assert scores == {f"run-{i}": 0.5 for i in range(50)}
+
+
+def test_rate_limit_spaces_request_starts(scorer):
+    scorer.delay = 0
+    _evaluate(_items(6), StubDB(), concurrency=6, rate_limit=20)
+
+    gaps = [b - a for a, b in zip(scorer.started_at, scorer.started_at[1:])]
+    assert len(gaps) == 5
+    assert min(gaps) >= 0.05 * 0.9
+
+
+def test_identical_content_is_scored_once(scorer):
+    items = [
+        ("run-1", "question", "expected", "answer"),
+        ("run-2", "question", "expected", "<think>reasoning</think>answer"),
+        ("run-3", "question", "expected", "other answer"),
+    ]
+    db = StubDB()
+    scores = _evaluate(items, db, concurrency=4)
+
+    assert sorted(call[2] for call in scorer.calls) == ["answer", "other answer"]
+    assert scores == {"run-1": 0.5, "run-2": 0.5, "run-3": 0.5}
+    assert sorted(row for batch in db.transactions for row in batch) == [
+        ("run-1", 0.5), ("run-2", 0.5), ("run-3", 0.5)
+    ]
+
+    # 캐시에 있는 내용은 다시 호출하지 않고 저장만 함
+    db = StubDB()
+    assert _evaluate(items, db, concurrency=4) == scores
+    assert len(scorer.calls) == 2
+    assert sum(len(batch) for batch in db.transactions) == 3
+
+
+def test_scores_are_saved_in_db_batches(scorer):
+    db = StubDB()
+    _evaluate(_items(300), db, concurrency=8, db_batch_size=128)
+
+    assert [len(batch) for batch in db.transactions] == [128, 128, 44]
+    saved = [interaction_id for batch in db.transactions for interaction_id, _ in batch]
+    assert sorted(saved) == sorted(f"run-{i}" for i in range(300))
+
+
+def test_failed_items_return_zero_and_are_not_saved(scorer):
+    scorer.fail_on = "broken"
+    items = _items(3) + [("run-bad", "question", "expected", "broken answer")]
+    db = StubDB()
+    scores = _evaluate(items, db, concurrency=2)
+
+    assert scores["run-bad"] == 0.0
+    assert "run-bad" not in [interaction_id for batch in db.transactions for interaction_id, _ in batch]
+    assert sum(len(batch) for batch in db.transactions) == 3